@@ -0,0 +1,648 @@
+import sys
+import heapq
+from array import array
+from collections import deque
+from operator import attrgetter
+
+RED = 1
+BLACK = 0
+
+
+class ArrayRedBlackTree:
+    """
+    Rot-Schwarz-Baum mit kompakter Speicherung in parallelen Integer-Arrays.
+
+    Statt eines Python-Objekts pro Knoten werden linkes Kind, rechtes Kind, Elternknoten,
+    Farbe und Teilbaumgröße über eine Knotennummer in Arrays des array-Moduls abgelegt,
+    die Songs liegen in einer Liste daneben. Die Knotennummer 0 ist der NIL-Knoten.
+    Die öffentliche Schnittstelle entspricht der von RedBlackTree.
+    """
+
+    NIL = 0
+
+    def __init__(self):
+        #Initialisiert einen leeren Baum, der nur den NIL-Knoten enthält
+        self._reset(0)
+
+    def _reset(self, capacity):
+        #Legt die Arrays für den NIL-Knoten und capacity weitere Knoten neu an
+        self.left = array('i', bytes(4 * (capacity + 1)))
+        self.right = array('i', bytes(4 * (capacity + 1)))
+        self.parent = array('i', bytes(4 * (capacity + 1)))
+        self.color = array('b', bytes(capacity + 1))
+        self.size = array('i', bytes(4 * (capacity + 1)))
+        self.songs = [None] * (capacity + 1)
+        self.free = []  #Wiederverwendbare Knotennummern gelöschter Knoten
+        self.root = self.NIL
+
+    def __len__(self):
+        #Anzahl der Songs im Baum, direkt aus der Teilbaumgröße der Wurzel
+        return self.size[self.root]
+
+    def _new_node(self, song):
+        #Legt einen roten Knoten an und gibt seine Nummer zurück
+        if self.free:
+            node = self.free.pop()
+            self.left[node] = self.right[node] = self.parent[node] = self.NIL
+            self.color[node] = RED
+            self.size[node] = 1
+            self.songs[node] = song
+            return node
+        self.left.append(self.NIL)
+        self.right.append(self.NIL)
+        self.parent.append(self.NIL)
+        self.color.append(RED)
+        self.size.append(1)
+        self.songs.append(song)
+        return len(self.songs) - 1
+
+    @classmethod
+    def from_sorted(cls, songs):
+        """
+        Baut einen balancierten Baum in linearer Zeit aus nach Titel sortierten Songs.
+
+        Args:
+            songs (list): Die nach Titel sortierten Song-Objekte.
+
+        Returns:
+            ArrayRedBlackTree: Der aufgebaute Baum.
+        """
+        tree = cls()
+        tree._build_from_sorted(songs)
+        return tree
+
+    def _build_from_sorted(self, songs):
+        #Ersetzt den Inhalt des Baums; Knoten i + 1 enthält den i-ten Song der sortierten Liste
+        count = len(songs)
+        self._reset(count)
+        if count == 0:
+            return
+        left, right, parent, color, size = self.left, self.right, self.parent, self.color, self.size
+        self.songs[1:] = songs
+        red_depth = count.bit_length() - 1  #Tiefe der untersten Ebene
+
+        def build(low, high, parent_node, depth):
+            if low > high:
+                return self.NIL
+            mid = (low + high) // 2
+            node = mid + 1
+            color[node] = RED if depth == red_depth else BLACK
+            size[node] = high - low + 1
+            parent[node] = parent_node
+            left[node] = build(low, mid - 1, node, depth + 1)
+            right[node] = build(mid + 1, high, node, depth + 1)
+            return node
+
+        self.root = build(0, count - 1, self.NIL, 0)
+        color[self.root] = BLACK
+
+    def inorder(self):
+        """
+        Durchläuft den Baum in sortierter Reihenfolge (In-Order).
+
+        Returns:
+            generator: Die Song-Objekte in aufsteigender Reihenfolge nach Titel.
+        """
+        left, right, songs = self.left, self.right, self.songs
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield songs[node]
+            node = right[node]
+
+    def bulk_insert(self, songs):
+        """
+        Fügt viele Songs auf einmal in den Baum ein.
+
+        Args:
+            songs (list): Die einzufügenden Song-Objekte.
+
+        Returns:
+            None
+        """
+        batch = sorted(songs, key=attrgetter('title'))
+        existing = len(self)
+        if existing and len(batch) * existing.bit_length() < existing:
+            for song in batch:
+                self.insert(song)
+            return
+        merged = list(heapq.merge(self.inorder(), batch, key=attrgetter('title')))
+        self._build_from_sorted(merged)
+
+    def insert(self, song):
+        """
+        Fügt einen neuen Song in den Baum ein.
+
+        Args:
+            song (Song): Das Song-Objekt, das in den Baum eingefügt werden soll.
+
+        Returns:
+            None
+        """
+        new_node = self._new_node(song)
+        left, right, size, songs = self.left, self.right, self.size, self.songs
+
+        parent = self.NIL
+        current = self.root
+        while current:
+            parent = current
+            size[current] += 1
+            if song < songs[current]:
+                current = left[current]
+            else:
+                current = right[current]
+
+        self.parent[new_node] = parent
+        if parent == self.NIL:
+            self.root = new_node
+        elif song < songs[parent]:
+            left[parent] = new_node
+        else:
+            right[parent] = new_node
+
+        self.fix_insert(new_node)
+
+    def fix_insert(self, node):
+        """
+        Fixiert den Baum nach dem Einfügen, um die Rot-Schwarz-Eigenschaften zu bewahren.
+
+        Args:
+            node (int): Die Nummer des neu eingefügten Knotens.
+
+        Returns:
+            None
+        """
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        while node != self.root and color[parent[node]] == RED:
+            father = parent[node]
+            grandfather = parent[father]
+            if father == left[grandfather]:
+                uncle = right[grandfather]
+                if color[uncle] == RED:
+                    color[father] = BLACK
+                    color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                else:
+                    if node == right[father]:
+                        node = father
+                        self.left_rotate(node)
+                        father = parent[node]
+                    color[father] = BLACK
+                    color[grandfather] = RED
+                    self.right_rotate(grandfather)
+            else:
+                uncle = left[grandfather]
+                if color[uncle] == RED:
+                    color[father] = BLACK
+                    color[uncle] = BLACK
+                    color[grandfather] = RED
+                    node = grandfather
+                else:
+                    if node == left[father]:
+                        node = father
+                        self.right_rotate(node)
+                        father = parent[node]
+                    color[father] = BLACK
+                    color[grandfather] = RED
+                    self.left_rotate(grandfather)
+
+        color[self.root] = BLACK
+
+    def left_rotate(self, x):
+        """
+        Führt eine Linksrotation durch.
+
+        Args:
+            x (int): Die Nummer des Knotens, um den rotiert wird.
+
+        Returns:
+            None
+        """
+        left, right, parent, size = self.left, self.right, self.parent, self.size
+        y = right[x]
+        right[x] = left[y]
+        if left[y]:
+            parent[left[y]] = x
+        parent[y] = parent[x]
+        if parent[x] == self.NIL:
+            self.root = y
+        elif x == left[parent[x]]:
+            left[parent[x]] = y
+        else:
+            right[parent[x]] = y
+        left[y] = x
+        parent[x] = y
+        size[y] = size[x]
+        size[x] = size[left[x]] + size[right[x]] + 1
+
+    def right_rotate(self, x):
+        """
+        Führt eine Rechtsrotation durch.
+
+        Args:
+            x (int): Die Nummer des Knotens, um den rotiert wird.
+
+        Returns:
+            None
+        """
+        left, right, parent, size = self.left, self.right, self.parent, self.size
+        y = left[x]
+        left[x] = right[y]
+        if right[y]:
+            parent[right[y]] = x
+        parent[y] = parent[x]
+        if parent[x] == self.NIL:
+            self.root = y
+        elif x == right[parent[x]]:
+            right[parent[x]] = y
+        else:
+            left[parent[x]] = y
+        right[y] = x
+        parent[x] = y
+        size[y] = size[x]
+        size[x] = size[left[x]] + size[right[x]] + 1
+
+    def get_size(self):
+        """
+        Berechnet den Speicherbedarf der Arrays, der Songliste und der Songs.
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        size = sum(sys.getsizeof(column) for column in (self.left, self.right, self.parent, self.color, self.size))
+        size += sys.getsizeof(self.songs) + sys.getsizeof(self.free)
+        if self.root:
+            size += len(self) * sys.getsizeof(self.songs[self.root])
+        return size
+
+    def rank(self, title):
+        """
+        Bestimmt die Anzahl der Songs, deren Titel kleiner als der angegebene Titel ist.
+
+        Args:
+            title (str): Der Titel, dessen Rang bestimmt werden soll.
+
+        Returns:
+            int: Die Position, an der ein Song mit diesem Titel in der sortierten Reihenfolge steht.
+        """
+        left, right, size, songs = self.left, self.right, self.size, self.songs
+        rank = 0
+        node = self.root
+        while node:
+            if title <= songs[node].title:
+                node = left[node]
+            else:
+                rank += size[left[node]] + 1
+                node = right[node]
+        return rank
+
+    def select(self, k):
+        """
+        Gibt den Song an Position k der nach Titel sortierten Reihenfolge zurück.
+
+        Args:
+            k (int): Die Position (beginnend bei 0).
+
+        Returns:
+            Song: Der Song an dieser Position oder None, wenn k außerhalb des Baums liegt.
+        """
+        if not 0 <= k < len(self):
+            return None
+        left, right, size = self.left, self.right, self.size
+        node = self.root
+        while node:
+            left_size = size[left[node]]
+            if k < left_size:
+                node = left[node]
+            elif k == left_size:
+                return self.songs[node]
+            else:
+                k -= left_size + 1
+                node = right[node]
+        return None
+
+    def page(self, offset, limit):
+        """
+        Gibt einen Ausschnitt der nach Titel sortierten Songs zurück.
+
+        Args:
+            offset (int): Die Position des ersten Songs.
+            limit (int): Die maximale Anzahl der Songs.
+
+        Returns:
+            list: Die Songs des Ausschnitts.
+        """
+        result = []
+        if offset < 0 or limit <= 0:
+            return result
+        left, right, size = self.left, self.right, self.size
+        stack = []
+        node = self.root
+        k = offset
+        while node:
+            left_size = size[left[node]]
+            if k < left_size:
+                stack.append(node)
+                node = left[node]
+            elif k == left_size:
+                stack.append(node)
+                break
+            else:
+                k -= left_size + 1
+                node = right[node]
+
+        while stack and len(result) < limit:
+            node = stack.pop()
+            result.append(self.songs[node])
+            node = right[node]
+            while node:
+                stack.append(node)
+                node = left[node]
+        return result
+
+    def bfs_search(self, value, criteria):
+        """
+        Breitensuche nach einem Song basierend auf einem Kriterium.
+
+        Args:
+            value (str): Der Wert des Suchkriteriums.
+            criteria (str): Das Suchkriterium (z.B. 'title', 'artist').
+
+        Returns:
+            Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
+        """
+        if self.root == self.NIL:
+            return None
+        left, right, songs = self.left, self.right, self.songs
+        queue = deque([self.root])
+        while queue:
+            node = queue.popleft()
+            if getattr(songs[node], criteria) == value:
+                return songs[node]
+            if left[node]:
+                queue.append(left[node])
+            if right[node]:
+                queue.append(right[node])
+        return None
+
+    def dfs_search(self, node, value, criteria):
+        """
+        Führt eine Tiefensuche (DFS) nach einem Song-Objekt basierend auf einem Kriterium durch.
+
+        Args:
+            node (int): Die Nummer des aktuellen Knotens.
+            value (str): Der Wert des Suchkriteriums.
+            criteria (str): Das Suchkriterium (z.B. 'title', 'artist').
+
+        Returns:
+            Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
+        """
+        if node == self.NIL:
+            return None
+        if getattr(self.songs[node], criteria) == value:
+            return self.songs[node]
+        left_search = self.dfs_search(self.left[node], value, criteria)
+        if left_search is not None:
+            return left_search
+        return self.dfs_search(self.right[node], value, criteria)
+
+    def search(self, value, criteria):
+        #Sucht entlang des Suchpfads nach einem Song
+        left, right, songs = self.left, self.right, self.songs
+        node = self.root
+        while node:
+            current = getattr(songs[node], criteria)
+            if current == value:
+                return songs[node]
+            node = left[node] if value < current else right[node]
+        return None
+
+    def delete(self, song):
+        """
+        Löscht einen Song aus dem Baum und stellt die Rot-Schwarz-Eigenschaften wieder her.
+
+        Args:
+            song (Song): Das zu löschende Song-Objekt.
+
+        Returns:
+            bool: True, wenn genau dieses Song-Objekt gefunden und gelöscht wurde, sonst False.
+        """
+        z = self._find_node(song)
+        if z == self.NIL:
+            return False
+        left, right, parent, color, size = self.left, self.right, self.parent, self.color, self.size
+
+        y = z if left[z] == self.NIL or right[z] == self.NIL else self._min_value_node(right[z])
+        ancestor = parent[y]
+        while ancestor:
+            size[ancestor] -= 1
+            ancestor = parent[ancestor]
+
+        y_original_color = color[y]
+        if left[z] == self.NIL:
+            x = right[z]
+            self._transplant(z, right[z])
+        elif right[z] == self.NIL:
+            x = left[z]
+            self._transplant(z, left[z])
+        else:
+            x = right[y]
+            if parent[y] == z:
+                parent[x] = y
+            else:
+                self._transplant(y, right[y])
+                right[y] = right[z]
+                parent[right[y]] = y
+            self._transplant(z, y)
+            left[y] = left[z]
+            parent[left[y]] = y
+            color[y] = color[z]
+            size[y] = size[z]
+
+        if y_original_color == BLACK:
+            self.delete_fixup(x)
+        parent[self.NIL] = self.NIL
+        size[self.NIL] = 0
+
+        #Knotennummer zur Wiederverwendung freigeben
+        self.songs[z] = None
+        self.free.append(z)
+        return True
+
+    def _find_node(self, song):
+        #Sucht den Knoten genau dieses Songs, sonst NIL; ein anderer Song mit gleichem Titel wird nie geliefert
+        left, right, songs = self.left, self.right, self.songs
+        title = song.title
+        node = self.root
+        first = self.NIL
+        while node:
+            current = songs[node].title
+            if title <= current:
+                if title == current:
+                    first = node
+                node = left[node]
+            else:
+                node = right[node]
+
+        node = first
+        while node and songs[node].title == title:
+            if songs[node] is song:
+                return node
+            node = self._successor(node)
+        return self.NIL
+
+    def _successor(self, node):
+        #Findet den In-Order-Nachfolger eines Knotens über die Eltern-Nummern
+        if self.right[node]:
+            return self._min_value_node(self.right[node])
+        parent = self.parent[node]
+        while parent and node == self.right[parent]:
+            node = parent
+            parent = self.parent[parent]
+        return parent
+
+    def _min_value_node(self, node):
+        #Findet den Knoten mit dem minimalen Wert
+        while self.left[node]:
+            node = self.left[node]
+        return node
+
+    def _transplant(self, u, v):
+        #Ersetzt den Teilbaum mit Wurzel u durch den Teilbaum mit Wurzel v
+        parent = self.parent
+        if parent[u] == self.NIL:
+            self.root = v
+        elif u == self.left[parent[u]]:
+            self.left[parent[u]] = v
+        else:
+            self.right[parent[u]] = v
+        parent[v] = parent[u]
+
+    def delete_fixup(self, x):
+        """
+        Fixiert den Baum nach dem Löschen eines schwarzen Knotens.
+
+        Args:
+            x (int): Die Nummer des Knotens, der an die Stelle des entfernten Knotens gerückt ist.
+
+        Returns:
+            None
+        """
+        left, right, parent, color = self.left, self.right, self.parent, self.color
+        while x != self.root and color[x] == BLACK:
+            father = parent[x]
+            if x == left[father]:
+                sibling = right[father]
+                if color[sibling] == RED:
+                    color[sibling] = BLACK
+                    color[father] = RED
+                    self.left_rotate(father)
+                    sibling = right[father]
+                if color[left[sibling]] == BLACK and color[right[sibling]] == BLACK:
+                    color[sibling] = RED
+                    x = father
+                else:
+                    if color[right[sibling]] == BLACK:
+                        color[left[sibling]] = BLACK
+                        color[sibling] = RED
+                        self.right_rotate(sibling)
+                        sibling = right[father]
+                    color[sibling] = color[father]
+                    color[father] = BLACK
+                    color[right[sibling]] = BLACK
+                    self.left_rotate(father)
+                    x = self.root
+            else:
+                sibling = left[father]
+                if color[sibling] == RED:
+                    color[sibling] = BLACK
+                    color[father] = RED
+                    self.right_rotate(father)
+                    sibling = left[father]
+                if color[right[sibling]] == BLACK and color[left[sibling]] == BLACK:
+                    color[sibling] = RED
+                    x = father
+                else:
+                    if color[left[sibling]] == BLACK:
+                        color[right[sibling]] = BLACK
+                        color[sibling] = RED
+                        self.left_rotate(sibling)
+                        sibling = left[father]
+                    color[sibling] = color[father]
+                    color[father] = BLACK
+                    color[left[sibling]] = BLACK
+                    self.right_rotate(father)
+                    x = self.root
+        color[x] = BLACK
+
+    def height(self):
+        """
+        Berechnet die Höhe des Baums (Anzahl der Ebenen).
+
+        Returns:
+            int: Die Höhe des Baums, 0 für einen leeren Baum.
+        """
+        left, right = self.left, self.right
+        height = 0
+        level = [self.root] if self.root else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (left[node], right[node]) if child]
+        return height
+
+    def validate(self):
+        """
+        Überprüft alle Invarianten des Rot-Schwarz-Baums.
+
+        Returns:
+            int: Die Schwarzhöhe des Baums.
+
+        Raises:
+            ValueError: Wenn eine Invariante verletzt ist.
+        """
+        left, right, parent, color, size, songs = self.left, self.right, self.parent, self.color, self.size, self.songs
+        if color[self.NIL] != BLACK or size[self.NIL] != 0:
+            raise ValueError("Der NIL-Knoten muss schwarz sein und die Größe 0 haben.")
+        if self.root == self.NIL:
+            return 1
+        if color[self.root] != BLACK:
+            raise ValueError("Die Wurzel muss schwarz sein.")
+        if parent[self.root] != self.NIL:
+            raise ValueError("Die Wurzel darf keinen Elternknoten haben.")
+
+        black_heights = {}
+        stack = [(self.root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            title = songs[node].title
+            if not children_done:
+                for child in (left[node], right[node]):
+                    if child == self.NIL:
+                        continue
+                    if parent[child] != node:
+                        raise ValueError(f"Falscher Eltern-Verweis bei '{songs[child].title}'.")
+                    if color[node] == RED and color[child] == RED:
+                        raise ValueError(f"Roter Knoten '{title}' hat ein rotes Kind.")
+                if left[node] and songs[left[node]].title > title:
+                    raise ValueError(f"Sortierung verletzt links von '{title}'.")
+                if right[node] and songs[right[node]].title < title:
+                    raise ValueError(f"Sortierung verletzt rechts von '{title}'.")
+                stack.append((node, True))
+                if left[node]:
+                    stack.append((left[node], False))
+                if right[node]:
+                    stack.append((right[node], False))
+            else:
+                left_height = black_heights.pop(left[node]) if left[node] else 1
+                right_height = black_heights.pop(right[node]) if right[node] else 1
+                if left_height != right_height:
+                    raise ValueError(f"Unterschiedliche Schwarzhöhe unter '{title}'.")
+                if size[node] != size[left[node]] + size[right[node]] + 1:
+                    raise ValueError(f"Falsche Teilbaumgröße bei '{title}'.")
+                black_heights[node] = left_height + (color[node] == BLACK)
+        return black_heights[self.root]
@@ -0,0 +1,377 @@
+"""
+Nicht-interaktiver Benchmark der Such- und Sortieralgorithmen der Musik-App.
+
+Erzeugt für jede Datensatzgröße eine zufällige Bibliothek (reproduzierbar über --seed),
+führt die gewählten Algorithmen nach einigen Aufwärmläufen mehrfach aus und misst jeden
+Lauf mit time.perf_counter_ns. Die Ergebnisse (Median, Perzentile, Minimum, Maximum)
+werden als JSON und CSV gespeichert. Zusätzlich wird je Größe die Übersicht erzeugt, die
+bisher per Screenshot unter Bilder/Red_Black_Tree abgelegt wurde: als Textdatei im Format
+der App und, falls matplotlib installiert ist, als Balkendiagramm.
+
+Die Bibliothek des Benutzers (songs_RBT.csv) wird nicht verändert, alle Daten liegen in
+einem temporären Verzeichnis.
+
+Aufruf: python benchmark.py --sizes 10000 20000 --sort bubble merge quick --search all
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from music_app import MusicApp
+from numpy_engine import NUMPY_AVAILABLE
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+except ImportError:  #matplotlib ist optional, ohne matplotlib werden nur die Textübersichten erzeugt
+    plt = None
+
+SEARCH_METHODS = {
+    #CLI-Name: (Anzeigename, Aufruf mit App, Wert und Kriterium)
+    'linear': ('Lineare Suche', lambda app, value, criteria: app.linear_search(value, criteria)),
+    'binary': ('Binärsuche', lambda app, value, criteria: app.binary_search(value, criteria)),
+    'jump': ('Jump-Suche', lambda app, value, criteria: app.jump_search(value, criteria)),
+    'interpolation': ('Interpolationssuche', lambda app, value, criteria: app.interpolation_search(value, criteria)),
+    'bfs': ('Breitensuche', lambda app, value, criteria: app.rbt.bfs_search(value, criteria)),
+    'dfs': ('Tiefensuche', lambda app, value, criteria: app.rbt.dfs_search(app.rbt.root, value, criteria)),
+    'numpy': ('NumPy-Suche', lambda app, value, criteria: app.numpy_search(value, criteria)),
+    'prefix': ('Präfixsuche', lambda app, value, criteria: app.prefix_search(value[:3], criteria)),
+}
+
+SORT_METHODS = {
+    #CLI-Name: (Anzeigename, Aufruf mit App, Reihenfolge und Kriterium)
+    'bubble': ('Bubble Sort', lambda app, order, criteria: app.bubble_sort(order, criteria)),
+    'insertion': ('Insertion Sort', lambda app, order, criteria: app.insertion_sort(order, criteria)),
+    'merge': ('Merge Sort', lambda app, order, criteria: app.merge_sort(order, criteria)),
+    'quick': ('Quick Sort', lambda app, order, criteria: app.quick_sort(0, len(app.songs) - 1, order, criteria)),
+    'numpy': ('NumPy Sort', lambda app, order, criteria: app.numpy_sort(order, criteria)),
+    'parallel': ('Paralleler Merge Sort', lambda app, order, criteria: app.parallel_merge_sort(order, criteria)),
+}
+
+#Sortierkriterien der App ('1' Titel, '2' Künstler, '3' Genre) und Reihenfolgen ('1' auf-, '2' absteigend)
+SORT_CRITERIA = {'title': '1', 'artist': '2', 'genre': '3'}
+SORT_ORDERS = {'asc': '1', 'desc': '2'}
+
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values, percent):
+    """
+    Berechnet ein Perzentil nach dem Nearest-Rank-Verfahren.
+
+    Args:
+        sorted_values (list): Die aufsteigend sortierten Messwerte.
+        percent (int): Das gewünschte Perzentil (0-100).
+
+    Returns:
+        int: Der Messwert, unter dem percent Prozent der Messungen liegen.
+    """
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(timings):
+    """
+    Fasst die Laufzeiten einer Messreihe zusammen.
+
+    Args:
+        timings (list): Die Laufzeiten in Nanosekunden.
+
+    Returns:
+        dict: Minimum, Maximum, Mittelwert, Median und Perzentile in Nanosekunden.
+    """
+    ordered = sorted(timings)
+    summary = {
+        'min_ns': ordered[0],
+        'max_ns': ordered[-1],
+        'mean_ns': round(statistics.fmean(ordered)),
+        'median_ns': round(statistics.median(ordered)),
+    }
+    for percent in PERCENTILES:
+        summary[f'p{percent}_ns'] = percentile(ordered, percent)
+    return summary
+
+
+def create_app(directory, size, seed, backend):
+    """
+    Erzeugt eine Musik-App mit einer reproduzierbaren Zufallsbibliothek in einem eigenen Verzeichnis.
+
+    Args:
+        directory (str): Das Verzeichnis für Snapshot, Änderungsprotokoll und Playlists.
+        size (int): Die Anzahl der Songs.
+        seed (int): Der Startwert des Zufallsgenerators.
+        backend (str): Das Baum-Backend der App ('node' oder 'array').
+
+    Returns:
+        MusicApp: Die App mit size zufälligen Songs.
+    """
+    app_class = type('BenchmarkMusicApp', (MusicApp,), {
+        'FILENAME': os.path.join(directory, f'songs_{size}.csv'),
+        'BINARY_FILENAME': os.path.join(directory, f'songs_{size}.bin'),
+        'JOURNAL_FILENAME': os.path.join(directory, f'songs_{size}.journal'),
+        'PLAYLIST_DIRECTORY': os.path.join(directory, f'playlists_{size}'),
+    })
+    random.seed(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        app = app_class(backend)
+        app.create_random_songs(size)
+    return app
+
+
+def measure(run, setup, repeat, warmup, memory):
+    """
+    Führt einen Lauf nach Aufwärmläufen mehrfach aus und misst jede Ausführung.
+
+    Args:
+        run (function): Der zu messende Aufruf.
+        setup (function): Wird vor jedem Lauf außerhalb der Zeitmessung aufgerufen.
+        repeat (int): Die Anzahl der gemessenen Läufe.
+        warmup (int): Die Anzahl der ungemessenen Aufwärmläufe.
+        memory (bool): Ob in einem zusätzlichen Lauf der Speicher-Peak gemessen wird.
+
+    Returns:
+        tuple: Die Laufzeiten in Nanosekunden und der Speicher-Peak in Bytes (oder None).
+    """
+    timings = []
+    with contextlib.redirect_stdout(io.StringIO()):  #Debug-Ausgaben der Algorithmen unterdrücken
+        for _ in range(warmup):
+            setup()
+            run()
+        for _ in range(repeat):
+            setup()
+            start = time.perf_counter_ns()
+            run()
+            timings.append(time.perf_counter_ns() - start)
+        peak = None
+        if memory:
+            #Getrennt von der Zeitmessung, da tracemalloc die Laufzeit stark verfälscht
+            setup()
+            tracemalloc.start()
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    return timings, peak
+
+
+def benchmark_search(app, size, methods, criteria_list, args):
+    #Misst die Suchmethoden, jeder Lauf sucht einen zufällig gewählten, vorhandenen Wert
+    results = []
+    rng = random.Random(args.seed)
+    for criteria in criteria_list:
+        for name in methods:
+            label, method = SEARCH_METHODS[name]
+            if name == 'numpy':
+                with contextlib.redirect_stdout(io.StringIO()):
+                    app.numpy_index()  #Index vor der Messung aufbauen, gemessen wird nur die Suche
+            targets = iter([getattr(rng.choice(app.songs), criteria) for _ in range(args.warmup + args.repeat + 1)])
+            value = [None]
+            probes = []  #Geprüfte Positionen je Lauf, für Verfahren, die last_search_probes setzen
+
+            def setup():
+                value[0] = next(targets)
+                app.last_search_probes = None
+
+            def run():
+                method(app, value[0], criteria)
+                if app.last_search_probes is not None:
+                    probes.append(app.last_search_probes)
+
+            timings, peak = measure(run, setup, args.repeat, args.warmup, args.memory)
+            results.append(dict(kind='search', size=size, method=name, label=label, criteria=criteria,
+                                order=None, repeat=args.repeat, warmup=args.warmup, memory_peak=peak,
+                                probes_mean=round(statistics.fmean(probes), 2) if probes else None,
+                                probes_max=max(probes) if probes else None,
+                                **summarize(timings)))
+            line = f"  {label:<22} {criteria:<7} Median {results[-1]['median_ns'] / 1e9:.6f} s"
+            if probes:
+                line += f", Proben Mittel {results[-1]['probes_mean']:.1f} / Max {results[-1]['probes_max']}"
+            print(line)
+    return results
+
+
+def benchmark_sort(app, size, methods, criteria_list, orders, args):
+    #Misst die Sortieralgorithmen, jeder Lauf startet mit derselben unsortierten Bibliothek
+    results = []
+    original_songs = list(app.songs)
+
+    def setup():
+        app.songs = list(original_songs)  #Flache Kopie genügt, die Algorithmen ordnen nur die Liste um
+
+    for criteria in criteria_list:
+        for order in orders:
+            for name in methods:
+                label, method = SORT_METHODS[name]
+                if name == 'numpy':
+                    app.songs = original_songs
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        app.numpy_index()
+                timings, peak = measure(lambda: method(app, SORT_ORDERS[order], SORT_CRITERIA[criteria]),
+                                        setup, args.repeat, args.warmup, args.memory)
+                results.append(dict(kind='sort', size=size, method=name, label=label, criteria=criteria,
+                                    order=order, repeat=args.repeat, warmup=args.warmup, memory_peak=peak,
+                                    **summarize(timings)))
+                print(f"  {label:<22} {criteria:<7} {order:<4} Median {results[-1]['median_ns'] / 1e9:.6f} s")
+    app.songs = original_songs
+    return results
+
+
+def write_results(results, metadata, output_dir):
+    #Schreibt die Ergebnisse als JSON (mit Metadaten) und als CSV (eine Zeile je Messreihe)
+    with open(os.path.join(output_dir, 'results.json'), 'w', encoding='utf-8') as file:
+        json.dump({'metadata': metadata, 'results': results}, file, indent=2, ensure_ascii=False)
+    fields = ['kind', 'size', 'method', 'label', 'criteria', 'order', 'repeat', 'warmup',
+              'min_ns', 'median_ns', 'mean_ns'] + [f'p{percent}_ns' for percent in PERCENTILES] + \
+             ['max_ns', 'memory_peak', 'probes_mean', 'probes_max']
+    with open(os.path.join(output_dir, 'results.csv'), 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def write_overviews(results, output_dir):
+    """
+    Erzeugt je Größe und Art (Suche/Sortierung) die Übersicht wie unter Bilder/Red_Black_Tree.
+
+    Die Übersicht wird als RBT_<Größe>/RBT_<Größe>_<Search|Sort>.txt im Format der App
+    geschrieben, mit matplotlib zusätzlich als gleichnamiges Balkendiagramm (.png).
+
+    Args:
+        results (list): Die Ergebnisse aller Messreihen.
+        output_dir (str): Das Ausgabeverzeichnis.
+
+    Returns:
+        list: Die Pfade der erzeugten Dateien.
+    """
+    titles = {'search': ('Search', 'Übersicht über alle Suchalgorithmen:'),
+              'sort': ('Sort', 'Übersicht über alle Sortieralgorithmen:')}
+    groups = {}
+    for result in results:
+        groups.setdefault((result['size'], result['kind']), []).append(result)
+
+    written = []
+    for (size, kind), group in sorted(groups.items()):
+        suffix, heading = titles[kind]
+        directory = os.path.join(output_dir, f'RBT_{size}')
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f'RBT_{size}_{suffix}')
+
+        with open(base + '.txt', 'w', encoding='utf-8') as file:
+            file.write(heading + '\n')
+            for result in group:
+                variant = result['criteria'] if result['order'] is None else f"{result['criteria']}, {result['order']}"
+                line = f"{result['label']} ({variant}): Benötigte Zeit: {result['median_ns'] / 1e9:.6f} Sekunden (Median)."
+                if result['memory_peak'] is not None:
+                    line += f" Verwendete Speicherkapazität: {result['memory_peak']} Bytes."
+                if result.get('probes_mean') is not None:
+                    line += f" Geprüfte Positionen: {result['probes_mean']:.1f} im Mittel."
+                file.write(line + '\n')
+        written.append(base + '.txt')
+
+        if plt is not None:
+            variants = len({(result['criteria'], result['order']) for result in group})
+            labels = [result['label'] if variants == 1 else f"{result['label']}\n{result['criteria']} {result['order'] or ''}".rstrip()
+                      for result in group]
+            medians = [result['median_ns'] / 1e9 for result in group]
+            upper = [result['p90_ns'] / 1e9 - median for result, median in zip(group, medians)]
+            figure, axis = plt.subplots(figsize=(max(6, len(group) * 1.2), 4.5))
+            axis.bar(range(len(group)), medians, yerr=[[0] * len(group), upper], capsize=4)
+            axis.set_xticks(range(len(group)))
+            axis.set_xticklabels(labels, rotation=30, ha='right')
+            axis.set_yscale('log')
+            axis.set_ylabel('Sekunden (Median, Fehlerbalken bis p90)')
+            axis.set_title(f"{heading.rstrip(':')} ({size} Songs)")
+            figure.tight_layout()
+            figure.savefig(base + '.png', dpi=120)
+            plt.close(figure)
+            written.append(base + '.png')
+    return written
+
+
+def parse_methods(values, available):
+    #Löst 'all' auf und prüft die angegebenen Methodennamen
+    if values is None:
+        return []
+    if 'all' in values:
+        return [name for name in available if name != 'numpy' or NUMPY_AVAILABLE]
+    unknown = [name for name in values if name not in available]
+    if unknown:
+        raise SystemExit(f"Unbekannte Methode(n): {', '.join(unknown)}. Erlaubt: {', '.join(available)}, all")
+    if 'numpy' in values and not NUMPY_AVAILABLE:
+        raise SystemExit("Die NumPy-Methoden benötigen NumPy (pip install numpy).")
+    return values
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark der Such- und Sortieralgorithmen der Musik-App.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000], help="Datensatzgrößen (Anzahl Songs)")
+    parser.add_argument('--search', nargs='*', metavar='METHODE',
+                        help=f"Suchmethoden: {', '.join(SEARCH_METHODS)} oder all")
+    parser.add_argument('--sort', nargs='*', metavar='METHODE',
+                        help=f"Sortieralgorithmen: {', '.join(SORT_METHODS)} oder all")
+    parser.add_argument('--criteria', nargs='+', choices=sorted(SORT_CRITERIA), default=['title'],
+                        help="Such-/Sortierkriterien")
+    parser.add_argument('--order', nargs='+', choices=sorted(SORT_ORDERS), default=['asc'],
+                        help="Sortierreihenfolgen")
+    parser.add_argument('--repeat', type=int, default=5, help="Gemessene Läufe je Messreihe")
+    parser.add_argument('--warmup', type=int, default=1, help="Ungemessene Aufwärmläufe je Messreihe")
+    parser.add_argument('--seed', type=int, default=42, help="Startwert für Daten und Suchwerte")
+    parser.add_argument('--backend', choices=sorted(MusicApp.TREE_BACKENDS), default='node',
+                        help="Baum-Backend der App")
+    parser.add_argument('--memory', action='store_true',
+                        help="Speicher-Peak in einem zusätzlichen, nicht zeitgemessenen Lauf erfassen")
+    parser.add_argument('--output', default='benchmark_results', help="Ausgabeverzeichnis")
+    args = parser.parse_args(argv)
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat muss mindestens 1 und --warmup mindestens 0 sein.")
+    if args.search is None and args.sort is None:
+        args.search = args.sort = ['all']
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    search_methods = parse_methods(args.search, SEARCH_METHODS)
+    sort_methods = parse_methods(args.sort, SORT_METHODS)
+    os.makedirs(args.output, exist_ok=True)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            print(f"{size} Songs (Seed {args.seed}, Backend {args.backend}):")
+            app = create_app(directory, size, args.seed, args.backend)
+            if search_methods:
+                results.extend(benchmark_search(app, size, search_methods, args.criteria, args))
+            if sort_methods:
+                results.extend(benchmark_sort(app, size, sort_methods, args.criteria, args.order, args))
+
+    metadata = {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': NUMPY_AVAILABLE,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'arguments': vars(args),
+    }
+    write_results(results, metadata, args.output)
+    written = write_overviews(results, args.output)
+    print(f"Ergebnisse in {os.path.join(args.output, 'results.json')} und {os.path.join(args.output, 'results.csv')} gespeichert.")
+    for path in written:
+        print(f"Übersicht: {path}")
+    if plt is None:
+        print("matplotlib ist nicht installiert, es wurden nur Textübersichten erzeugt.")
+
+
+if __name__ == "__main__":
+    main()
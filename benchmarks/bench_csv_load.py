@@ -0,0 +1,96 @@
+"""
+Misst Durchsatz und Speicher-Peak des batchweisen CSV-Ladens und -Speicherns.
+
+Erzeugt einen Snapshot mit zufälligen Songs (ein Teil der Titel enthält Kommas und
+Anführungszeichen), schreibt ihn mit write_songs und liest ihn mit read_song_batches wieder
+ein. Zusätzlich wird eine vollständige MusicApp aus dem Snapshot geladen (Songs, sortierte
+Indizes und Rot-Schwarz-Baum). Der Speicher-Peak wird in einem zweiten Lauf mit tracemalloc
+gemessen und dem Speicher der fertig geladenen Daten gegenübergestellt.
+
+Aufruf: python benchmarks/bench_csv_load.py [Anzahl Zeilen]
+"""
+import contextlib
+import gc
+import io
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from music_app import MusicApp
+from song import Song
+from song_csv import read_song_batches, write_songs
+
+
+def random_songs(count):
+    random.seed(11)
+
+    def word():
+        return ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
+
+    songs = []
+    for position in range(count):
+        title = word()
+        if position % 100 == 0:
+            title = f'{title}, "{word()}"'  #Felder, die maskiert werden müssen
+        songs.append(Song(title, word(), word(), word()))
+    return songs
+
+
+def measure(label, count, function):
+    #Zeit und Speicher in getrennten Läufen, da tracemalloc die Laufzeit stark erhöht
+    gc.collect()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = function()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<31} {elapsed:>7.2f} s {count / elapsed:>10.0f} Zeilen/s "
+          f"Peak {peak / 1e6:>7.1f} MB, danach belegt {current / 1e6:>7.1f} MB")
+    return result
+
+
+def main(count):
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'songs.csv')
+        songs = random_songs(count)
+        measure("write_songs", count, lambda: write_songs(filename, songs))
+        del songs
+        print(f"Dateigröße: {os.path.getsize(filename) / 1e6:.1f} MB")
+
+        def read():
+            songs = []
+            for batch in read_song_batches(filename):
+                songs.extend([Song(*row) for row in batch])
+            return songs
+
+        songs = measure("read_song_batches + Song", count, read)
+        assert len(songs) == count
+        del songs
+
+        app_class = type('BenchmarkMusicApp', (MusicApp,), {
+            'FILENAME': filename,
+            'BINARY_FILENAME': os.path.join(directory, 'songs.bin'),  #Existiert nicht, geladen wird die CSV-Datei
+            'JOURNAL_FILENAME': os.path.join(directory, 'songs.journal'),
+            'PLAYLIST_DIRECTORY': os.path.join(directory, 'playlists'),
+        })
+
+        def load():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return app_class()
+
+        app = measure("MusicApp laden (inkl. Indizes)", count, load)
+        assert len(app.songs) == count
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
@@ -0,0 +1,111 @@
+"""
+Misst Aufbauzeit, Speicherbedarf und Anfragelatenz des Trigramm-Index der unscharfen Suche
+und vergleicht ihn mit einer Brute-Force-Suche über die Editierdistanz aller Titel.
+
+Die Anfragen sind Titel zufälliger Songs mit einem Tippfehler (zwei vertauschte Buchstaben
+oder ein ersetzter Buchstabe). Gezählt wird zusätzlich, wie oft der ursprüngliche Song unter
+den ersten zehn Treffern ist. Die Brute-Force-Suche ist sehr langsam und wird deshalb nur
+mit wenigen Anfragen gemessen.
+
+Aufruf: python benchmarks/bench_fuzzy_search.py [Anzahl Songs ...]
+"""
+import gc
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fuzzy_index import FuzzyIndex
+from song import Song
+
+QUERIES = 1000
+BRUTE_FORCE_QUERIES = 3
+
+
+def word(rng):
+    return ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 10)))
+
+
+def random_songs(count):
+    rng = random.Random(5)
+    return [Song(word(rng), word(rng), word(rng), word(rng), song_id) for song_id in range(count)]
+
+
+def typo(rng, text):
+    #Vertauscht zwei benachbarte Buchstaben oder ersetzt einen Buchstaben
+    position = rng.randrange(len(text) - 1)
+    if rng.random() < 0.5:
+        return text[:position] + text[position + 1] + text[position] + text[position + 2:]
+    return text[:position] + rng.choice(string.ascii_uppercase) + text[position + 1:]
+
+
+def edit_distance(first, second):
+    #Levenshtein-Distanz mit einer Zeile der Tabelle
+    previous = list(range(len(second) + 1))
+    for i, char in enumerate(first, 1):
+        current = [i]
+        for j, other in enumerate(second, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other)))
+        previous = current
+    return previous[-1]
+
+
+def brute_force(songs, query):
+    return min(songs, key=lambda song: edit_distance(query.lower(), song.title.lower()))
+
+
+def percentile(values, percent):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(percent / 100 * len(values)))]
+
+
+def main(counts):
+    for count in counts:
+        songs = random_songs(count)
+        songs_by_id = {song.song_id: song for song in songs}
+
+        gc.collect()
+        start = time.perf_counter()
+        index = FuzzyIndex(songs_by_id)
+        index.update(songs)
+        build_time = time.perf_counter() - start
+        del index
+        gc.collect()
+        tracemalloc.start()
+        index = FuzzyIndex(songs_by_id)
+        index.update(songs)
+        traced = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        rng = random.Random(count)
+        targets = [rng.choice(songs) for _ in range(QUERIES)]
+        queries = [typo(rng, song.title) for song in targets]
+        timings = []
+        found = 0
+        for song, query in zip(targets, queries):
+            start = time.perf_counter_ns()
+            results = index.search(query)
+            timings.append(time.perf_counter_ns() - start)
+            found += any(result is song for result, _ in results)
+
+        start = time.perf_counter()
+        for query in queries[:BRUTE_FORCE_QUERIES]:
+            brute_force(songs, query)
+        brute_force_time = (time.perf_counter() - start) / BRUTE_FORCE_QUERIES
+
+        print(f"{count} Songs:")
+        print(f"  Aufbau des Index:     {build_time:.2f} s")
+        print(f"  Speicher des Index:   {traced / 1e6:.1f} MB (tracemalloc), {index.get_size() / 1e6:.1f} MB (get_size)")
+        print(f"  Anfrage Trigramm:     p50 {percentile(timings, 50) / 1e6:.3f} ms, p99 {percentile(timings, 99) / 1e6:.3f} ms, "
+              f"Song unter den ersten 10: {found / QUERIES:.1%}")
+        print(f"  Anfrage Brute-Force:  {brute_force_time * 1000:.1f} ms (Mittel über {BRUTE_FORCE_QUERIES} Anfragen)")
+        del index, songs, songs_by_id
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main([int(count) for count in sys.argv[1:]] or [100000, 1000000])
@@ -0,0 +1,46 @@
+"""
+Vergleicht die Kosten eines einzelnen Schreibvorgangs: vollständiger Snapshot (bisheriges
+Verhalten von save_data nach jeder Änderung) gegenüber einem Eintrag im Änderungsprotokoll.
+
+Aufruf: python benchmarks/bench_journal.py [Anzahl Songs ...]
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from journal import SongJournal
+from music_app import MusicApp
+
+
+def measure(sizes, repetitions=5):
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            with contextlib.redirect_stdout(io.StringIO()):
+                app = MusicApp()
+                app.create_random_songs(size)
+
+                start = time.perf_counter()
+                for _ in range(repetitions):
+                    app.save_data()
+                snapshot_time = (time.perf_counter() - start) / repetitions
+
+                start = time.perf_counter()
+                for i in range(repetitions):
+                    app.log_change(SongJournal.ADD, size + i, f"TITLE{i}", "ARTIST", "ALBUM", "GENRE")
+                journal_time = (time.perf_counter() - start) / repetitions
+            os.chdir(os.path.dirname(directory))
+
+        print(f"{size} Songs: Snapshot {snapshot_time * 1000:.3f} ms, "
+              f"Protokolleintrag {journal_time * 1000:.3f} ms, "
+              f"Faktor {snapshot_time / journal_time:.0f}x")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10000, 100000]
+    measure(sizes)
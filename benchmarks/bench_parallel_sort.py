@@ -0,0 +1,63 @@
+"""
+Misst parallel_sort_order gegenüber sorted() und den Anteil des Zusammenführens der Läufe.
+
+Je Prozessanzahl wird die gesamte Sortierreihenfolge gemessen; zusätzlich wird das
+Zusammenführen allein verglichen: merge_runs (Timsort über die hintereinandergehängten
+Läufe) gegenüber dem früheren heapq.merge mit Schlüsselfunktion. Der Speedup durch mehrere
+Prozesse ist nur aussagekräftig, wenn mindestens so viele Kerne wie Prozesse verfügbar sind;
+sonst weist die Ausgabe ausdrücklich darauf hin.
+
+Aufruf: python benchmarks/bench_parallel_sort.py [Anzahl Schlüssel] [Prozesse ...]
+"""
+import heapq
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parallel_sort import merge_runs, parallel_sort_order
+
+
+def best_of(run, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = run()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main(count, worker_counts):
+    rng = random.Random(1)
+    keys = [''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 10))) for _ in range(count)]
+    cores = os.cpu_count() or 1
+
+    sequential, reference = best_of(lambda: sorted(range(count), key=keys.__getitem__))
+    print(f"{count} Schlüssel, {cores} Kern(e) verfügbar")
+    print(f"  sorted() in einem Prozess: {sequential:.3f} s")
+    for workers in worker_counts:
+        elapsed, order = best_of(lambda: parallel_sort_order(keys, workers=workers))
+        assert order == reference
+        note = "" if workers <= cores else "  (mehr Prozesse als Kerne, Speedup nicht überprüft)"
+        print(f"  {workers} Prozesse: {elapsed:.3f} s, Faktor {sequential / elapsed:.2f}x{note}")
+
+    print("Zusammenführen der Läufe allein (im Elternprozess):")
+    for workers in worker_counts:
+        chunk_size = -(-count // workers)
+        runs = [sorted(range(start, min(start + chunk_size, count)), key=keys.__getitem__)
+                for start in range(0, count, chunk_size)]
+        heap_time, heap_order = best_of(lambda: list(heapq.merge(*runs, key=keys.__getitem__)))
+        merge_time, merge_order = best_of(lambda: merge_runs(keys, runs))
+        assert heap_order == merge_order == reference
+        print(f"  {workers} Läufe: heapq.merge {heap_time:.3f} s, merge_runs {merge_time:.3f} s")
+
+    if cores < 2 or cores < max(worker_counts):
+        print(f"Hinweis: Nur {cores} Kern(e) verfügbar; der Mehrkern-Speedup ist auf diesem Rechner nicht überprüft.")
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(arguments[0] if arguments else 1000000, arguments[1:] or [2, 4])
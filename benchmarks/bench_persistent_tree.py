@@ -0,0 +1,140 @@
+"""
+Misst den Mehraufwand je Schreibvorgang des PersistentRedBlackTree gegenüber dem
+veränderlichen RedBlackTree und prüft Lesezugriffe ohne Sperre während laufender Schreibvorgänge.
+
+Je Baum werden abwechselnd Songs eingefügt und gelöscht. Gemessen werden die Laufzeit je
+Schreibvorgang und mit tracemalloc der belegte Speicher, einmal ohne und einmal mit
+festgehaltenen alten Versionen (snapshot() nach jedem Schreibvorgang, z.B. für Rückgängig).
+Danach bestimmt ein zweiter Thread ohne Sperre ständig Rang und Song an diesem Rang für
+Titel, die nie gelöscht werden (rank und select), während der Haupt-Thread schreibt; gezählt
+werden Abfragen, die einen falschen Song lieferten oder mit einem Fehler abbrachen.
+
+Aufruf: python benchmarks/bench_persistent_tree.py [Anzahl Songs] [Schreibvorgänge]
+"""
+import gc
+import os
+import random
+import string
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from persistent_red_black_tree import PersistentNode, PersistentRedBlackTree
+from red_black_tree import RedBlackTree
+from song import Song
+
+
+def random_songs(rng, count):
+    return [Song(''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 10))), "ARTIST", "ALBUM", "GENRE")
+            for _ in range(count)]
+
+
+def write_load(tree, new_songs, keep_versions):
+    #Abwechselnd einen neuen Song einfügen und den zuletzt eingefügten vorherigen wieder löschen
+    versions = []
+    for position, song in enumerate(new_songs):
+        tree.insert(song)
+        if position % 2:
+            tree.delete(new_songs[position - 1])
+        if keep_versions:
+            versions.append(tree.snapshot())
+    return versions
+
+
+def measure_writes(tree_class, library, new_songs, keep_versions=False):
+    writes = len(new_songs) + len(new_songs) // 2
+    gc.collect()
+    #Schon beim Aufbau messen, damit Knoten, die ein Schreibvorgang ersetzt und freigibt, abgezogen werden
+    tracemalloc.start()
+    tree = tree_class.from_sorted(library)
+    baseline = tracemalloc.get_traced_memory()[0]
+    versions = write_load(tree, new_songs, keep_versions)
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del versions
+    tree.validate()
+    #Die Laufzeit ohne tracemalloc messen, das die Allokationen sonst stark verlangsamt
+    tree = tree_class.from_sorted(library)
+    gc.collect()
+    start = time.perf_counter()
+    write_load(tree, new_songs, keep_versions)
+    elapsed = time.perf_counter() - start
+    return elapsed / writes, retained / writes
+
+
+def concurrent_reads(tree_class, library, new_songs, seconds=2.0):
+    #Fragt in einem Thread ohne Sperre stabile Titel ab, während der Haupt-Thread schreibt
+    tree = tree_class.from_sorted(library)
+    stable = [song.title for song in library[::max(1, len(library) // 1000)]]
+    snapshots = hasattr(tree, 'snapshot')
+    stop = threading.Event()
+    counts = {'searches': 0, 'misses': 0, 'errors': 0}
+
+    def reader():
+        rng = random.Random(2)
+        while not stop.is_set():
+            title = rng.choice(stable)
+            #Der persistente Baum liest aus einer festgehaltenen Version, der veränderliche direkt
+            view = tree.snapshot() if snapshots else tree
+            try:
+                song = view.select(view.rank(title))
+                if song is None or song.title != title:
+                    counts['misses'] += 1
+            except (AttributeError, TypeError):
+                counts['errors'] += 1
+            counts['searches'] += 1
+
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)  #Häufige Thread-Wechsel, damit Leser auch mitten in Rotationen laufen
+    thread = threading.Thread(target=reader)
+    thread.start()
+    deadline = time.perf_counter() + seconds
+    writes = 0
+    try:
+        while time.perf_counter() < deadline:
+            for song in new_songs:
+                tree.insert(song)
+            for song in new_songs:
+                tree.delete(song)
+            writes += 2 * len(new_songs)
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(previous)
+    return writes, counts
+
+
+def main(library_size, write_count):
+    rng = random.Random(11)
+    library = sorted(random_songs(rng, library_size), key=lambda song: song.title)
+    new_songs = random_songs(rng, write_count)
+    trees = (('veränderlich', RedBlackTree), ('persistent', PersistentRedBlackTree))
+
+    print(f"{library_size} Songs im Baum, {write_count} Einfügungen und {write_count // 2} Löschungen im Wechsel:")
+    print(f"  {'Baum':<14}{'µs/Schreibvorgang':>19}{'Bytes/Schreibvorgang':>22}{'mit allen Versionen':>21}{'Knoten/Version':>16}")
+    node_size = sys.getsizeof(PersistentNode.__new__(PersistentNode))
+    for name, tree_class in trees:
+        per_write, retained = measure_writes(tree_class, library, new_songs)
+        if tree_class is PersistentRedBlackTree:
+            _, per_version = measure_writes(tree_class, library, new_songs, keep_versions=True)
+            history = f"{per_version:>19.0f} B"
+            nodes = f"{per_version / node_size:>16.1f}"
+        else:
+            history = f"{'-':>21}"
+            nodes = f"{'-':>16}"
+        print(f"  {name:<14}{per_write * 1e6:>19.2f}{retained:>20.0f} B{history}{nodes}")
+
+    print("Lesen ohne Sperre während laufender Schreibvorgänge (ein Lese-Thread):")
+    for name, tree_class in trees:
+        writes, counts = concurrent_reads(tree_class, library, new_songs[:1000])
+        print(f"  {name:<14}{writes:>9} Schreibvorgänge, {counts['searches']:>9} Abfragen, "
+              f"{counts['misses']} falsch, {counts['errors']} mit Fehler")
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    defaults = [1000000, 20000]
+    main(*(arguments + defaults[len(arguments):]))
@@ -0,0 +1,98 @@
+"""
+Vergleicht das Speichern von Playlists als Kopien der Songs (eine JSON-Datei mit den
+vollständigen Songs jeder Playlist) mit den Playlist-Dateien aus playlist_store, die nur
+die Song-Nummern enthalten.
+
+Gemessen werden Dateigröße, Ladezeit (einschließlich des Auflösens der Nummern gegen die
+Bibliothek in einem Durchlauf), die Anzahl unterschiedlicher Song-Objekte nach dem Laden
+und die Zeit, um nach der Änderung einer Playlist zu speichern.
+
+Aufruf: python benchmarks/bench_playlist_store.py [Anzahl Playlists] [Songs je Playlist] [Songs in der Bibliothek]
+"""
+import json
+import os
+import random
+import shutil
+import string
+import sys
+import tempfile
+import time
+from itertools import chain
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playlist import Playlist
+from playlist_store import read_playlists, write_playlist
+from song import Song
+
+
+def word(rng):
+    return ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 10)))
+
+
+def directory_size(directory):
+    return sum(os.path.getsize(os.path.join(directory, entry)) for entry in os.listdir(directory))
+
+
+def main(playlist_count, playlist_size, library_size):
+    rng = random.Random(3)
+    library = [Song(word(rng), word(rng), word(rng), word(rng), song_id) for song_id in range(library_size)]
+    playlists = []
+    for number in range(playlist_count):
+        playlist = Playlist(f"Playlist {number}")
+        for song in rng.sample(library, playlist_size):
+            playlist.add_song(song)
+        playlists.append(playlist)
+
+    workdir = tempfile.mkdtemp()
+    try:
+        #Bisher: vollständige Kopien der Songs in einer Datei
+        copies_file = os.path.join(workdir, 'playlists_copies.json')
+        start = time.perf_counter()
+        with open(copies_file, 'w', encoding='utf-8') as file:
+            json.dump([{'name': playlist.name, 'songs': [song.to_dict() for song in playlist.songs]}
+                       for playlist in playlists], file, ensure_ascii=False, separators=(',', ':'))
+        copies_save = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with open(copies_file, 'r', encoding='utf-8') as file:
+            loaded = [(data['name'], [Song.from_dict(song) for song in data['songs']]) for data in json.load(file)]
+        copies_load = time.perf_counter() - start
+        copies_objects = len({id(song) for _, songs in loaded for song in songs})
+        del loaded
+
+        #Neu: eine Datei je Playlist mit Song-Nummern
+        directory = os.path.join(workdir, 'playlists')
+        start = time.perf_counter()
+        for playlist in playlists:
+            write_playlist(directory, playlist)
+        ids_save = time.perf_counter() - start
+
+        start = time.perf_counter()
+        stored = read_playlists(directory)
+        wanted = set(chain.from_iterable(data['song_ids'] for data in stored))
+        songs_by_id = {song.song_id: song for song in library if song.song_id in wanted}
+        loaded = [Playlist.from_dict(data, songs_by_id) for data in stored]
+        ids_load = time.perf_counter() - start
+        ids_objects = len({id(song) for playlist in loaded for song in playlist.songs})
+        assert sorted(playlist.name for playlist in loaded) == sorted(playlist.name for playlist in playlists)
+
+        #Nach der Änderung einer Playlist wird nur deren Datei geschrieben
+        start = time.perf_counter()
+        write_playlist(directory, playlists[0])
+        dirty_save = time.perf_counter() - start
+
+        entries = playlist_count * playlist_size
+        print(f"{playlist_count} Playlists mit je {playlist_size} Songs ({entries} Einträge), Bibliothek mit {library_size} Songs:")
+        print(f"  {'Format':<22}{'Größe':>10}{'Laden':>10}{'Speichern':>12}{'Song-Objekte':>14}")
+        print(f"  {'Kopien der Songs':<22}{os.path.getsize(copies_file) / 1e6:>8.1f}MB{copies_load:>9.2f}s{copies_save:>11.2f}s{copies_objects:>14}")
+        print(f"  {'Song-Nummern':<22}{directory_size(directory) / 1e6:>8.1f}MB{ids_load:>9.2f}s{ids_save:>11.2f}s{ids_objects:>14}")
+        print(f"  Speichern nach Änderung einer Playlist: {dirty_save * 1000:.2f} ms statt {copies_save:.2f} s für alle")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    defaults = [10000, 100, 1000000]
+    main(*(arguments + defaults[len(arguments):]))
@@ -0,0 +1,96 @@
+"""
+Vergleicht Anfragen mit mehreren Bedingungen (Künstler UND Genre UND Album) über die
+invertierten Indizes der QueryEngine mit einem vollständigen Durchlauf der Bibliothek und,
+falls NumPy installiert ist, mit den booleschen Masken von NumpySongIndex.filter.
+
+Die Songs haben realistische Häufigkeiten: wenige Genres, einige tausend Künstler und
+deutlich mehr Alben, sodass die Posting-Listen sehr unterschiedlich lang sind.
+
+Aufruf: python benchmarks/bench_query_engine.py [Anzahl Songs ...]
+"""
+import gc
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from numpy_engine import NUMPY_AVAILABLE, NumpySongIndex
+from query_engine import QueryEngine
+from song import Song
+
+QUERIES = 200
+
+
+def word(rng):
+    return ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 10)))
+
+
+def random_songs(count):
+    rng = random.Random(9)
+    genres = [word(rng) for _ in range(20)]
+    artists = [word(rng) for _ in range(max(1, count // 100))]
+    albums = [word(rng) for _ in range(max(1, count // 10))]
+    return [Song(word(rng), rng.choice(artists), rng.choice(albums), rng.choice(genres), song_id)
+            for song_id in range(count)]
+
+
+def linear_filter(songs, conditions):
+    items = list(conditions.items())
+    return [song for song in songs if all(getattr(song, field) == value for field, value in items)]
+
+
+def timed(function, queries):
+    start = time.perf_counter()
+    for conditions in queries:
+        function(conditions)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def main(counts):
+    for count in counts:
+        songs = random_songs(count)
+        songs_by_id = {song.song_id: song for song in songs}
+
+        gc.collect()
+        start = time.perf_counter()
+        engine = QueryEngine(songs_by_id)
+        engine.update(songs)
+        build_time = time.perf_counter() - start
+        del engine
+        gc.collect()
+        tracemalloc.start()
+        engine = QueryEngine(songs_by_id)
+        engine.update(songs)
+        traced = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        rng = random.Random(count)
+        samples = [rng.choice(songs) for _ in range(QUERIES)]
+        workloads = {
+            'Künstler UND Genre': [{'artist': song.artist, 'genre': song.genre} for song in samples],
+            'Genre UND Album': [{'genre': song.genre, 'album': song.album} for song in samples],
+            'Künstler UND Genre UND Album': [{'artist': song.artist, 'genre': song.genre, 'album': song.album} for song in samples],
+        }
+        numpy_index = NumpySongIndex(songs) if NUMPY_AVAILABLE else None
+
+        print(f"{count} Songs: Aufbau {build_time:.2f} s, Speicher {traced / 1e6:.1f} MB")
+        for name, queries in workloads.items():
+            for conditions in queries[:20]:
+                assert list(engine.query(conditions)) == linear_filter(songs, conditions)
+            engine_time = timed(lambda conditions: list(engine.query(conditions)), queries)
+            linear_time = timed(lambda conditions: linear_filter(songs, conditions), queries[:5])
+            line = f"  {name:<30} Posting-Listen {engine_time * 1e6:>9.1f} µs   Durchlauf {linear_time * 1e3:>9.1f} ms"
+            if numpy_index is not None:
+                numpy_time = timed(lambda conditions: numpy_index.filter(**conditions), queries[:50])
+                line += f"   NumPy {numpy_time * 1e3:>7.2f} ms"
+            print(line)
+        del engine, songs, songs_by_id, numpy_index
+        gc.collect()
+
+
+if __name__ == "__main__":
+    main([int(count) for count in sys.argv[1:]] or [100000, 1000000])
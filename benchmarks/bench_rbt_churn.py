@@ -0,0 +1,68 @@
+"""
+Gemischte Einfüge-/Lösch-Last auf dem Rot-Schwarz-Baum.
+
+Gibt je Runde die Baumhöhe und die mittlere Latenz von Einfügen, Löschen und Suchen aus
+und prüft am Ende alle Invarianten mit RedBlackTree.validate.
+
+Aufruf: python benchmarks/bench_rbt_churn.py [Startgröße] [Runden] [Operationen pro Runde]
+"""
+import math
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from red_black_tree import RedBlackTree
+from song import Song
+
+
+def random_song():
+    title = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
+    return Song(title, "ARTIST", "ALBUM", "GENRE")
+
+
+def churn(initial_size, rounds, operations):
+    random.seed(42)
+    live = [random_song() for _ in range(initial_size)]
+    tree = RedBlackTree.from_sorted(sorted(live))
+
+    print(f"{'Runde':>5} {'Songs':>9} {'Höhe':>5} {'2log2(n+1)':>10} {'Einfügen µs':>12} {'Löschen µs':>11} {'Suchen µs':>10}")
+    for round_number in range(1, rounds + 1):
+        insert_time = delete_time = search_time = 0.0
+        inserts = deletes = 0
+        for _ in range(operations):
+            if live and random.random() < 0.5:
+                song = live.pop(random.randrange(len(live)))
+                start = time.perf_counter()
+                tree.delete(song)
+                delete_time += time.perf_counter() - start
+                deletes += 1
+            else:
+                song = random_song()
+                live.append(song)
+                start = time.perf_counter()
+                tree.insert(song)
+                insert_time += time.perf_counter() - start
+                inserts += 1
+
+            if live:
+                target = live[random.randrange(len(live))].title
+                start = time.perf_counter()
+                tree.search(target, 'title')
+                search_time += time.perf_counter() - start
+
+        n = len(tree)
+        print(f"{round_number:>5} {n:>9} {tree.height():>5} {2 * math.log2(n + 1):>10.1f} "
+              f"{insert_time / max(inserts, 1) * 1e6:>12.2f} {delete_time / max(deletes, 1) * 1e6:>11.2f} "
+              f"{search_time / operations * 1e6:>10.2f}")
+
+    print(f"Invarianten erfüllt, Schwarzhöhe {tree.validate()}.")
+
+
+if __name__ == "__main__":
+    arguments = [int(arg) for arg in sys.argv[1:]]
+    initial_size, rounds, operations = (arguments + [100000, 10, 20000][len(arguments):])[:3]
+    churn(initial_size, rounds, operations)
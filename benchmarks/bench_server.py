@@ -0,0 +1,186 @@
+"""
+Lastgenerator für server.py: misst Durchsatz und Latenz (p50/p99) bei gleichzeitigen Clients.
+
+Der Server wird als eigener Prozess in einem temporären Verzeichnis mit einer zufälligen
+Bibliothek gestartet. Danach senden mehrere Verbindungen gleichzeitig Anfragen, jede hält
+bis zu --pipeline Anfragen offen. Ein Anteil --writes der Anfragen schreibt (Hinzufügen und
+Löschen im Wechsel), die übrigen lesen (Binärsuche, Präfixsuche, sortierte Seite, Filter).
+Mit --batch werden je Zeile mehrere Anfragen als Batch gesendet.
+
+Aufruf: python benchmarks/bench_server.py --songs 100000 --clients 8 --pipeline 16 --requests 20000 --writes 0.05
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from binary_snapshot import write_snapshot
+from song import Song
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def word(rng):
+    return ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 10)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class Workload:
+    #Erzeugt die Anfragen: lesende über vorhandene Songs, schreibende als Paare aus Hinzufügen und Löschen
+
+    def __init__(self, songs, writes, seed):
+        self.rng = random.Random(seed)
+        self.songs = songs
+        self.writes = writes
+        self.added = []
+
+    def next(self, request_id):
+        rng = self.rng
+        if rng.random() < self.writes:
+            if self.added and rng.random() < 0.5:
+                return {'id': request_id, 'op': 'delete', 'title': self.added.pop()}
+            song = Song(word(rng), word(rng), word(rng), word(rng))
+            self.added.append(song.title)
+            return dict(song.to_dict(), id=request_id, op='add')
+        song = rng.choice(self.songs)
+        kind = rng.random()
+        if kind < 0.4:
+            return {'id': request_id, 'op': 'search', 'method': 'binary', 'field': 'title', 'value': song.title}
+        if kind < 0.7:
+            return {'id': request_id, 'op': 'search', 'method': 'prefix', 'field': 'artist', 'value': song.artist[:2], 'limit': 10}
+        if kind < 0.9:
+            return {'id': request_id, 'op': 'sorted', 'field': 'genre', 'offset': rng.randrange(len(self.songs)), 'limit': 20}
+        return {'id': request_id, 'op': 'filter', 'conditions': {'artist': song.artist}, 'limit': 20}
+
+
+async def client(port, workload, count, pipeline, batch, latencies, errors):
+    #Eine Verbindung mit bis zu pipeline offenen Zeilen; die Latenz zählt vom Senden bis zur Antwortzeile
+    reader, writer = await asyncio.open_connection('127.0.0.1', port, limit=1 << 22)
+    sent_at = []
+    window = asyncio.Semaphore(pipeline)
+
+    async def receive(lines):
+        for position in range(lines):
+            line = await reader.readline()
+            latencies.append(time.perf_counter() - sent_at[position])
+            responses = json.loads(line)
+            for response in responses if isinstance(responses, list) else [responses]:
+                if not response['ok']:
+                    errors.append(response['error'])
+            window.release()
+
+    lines = (count + batch - 1) // batch
+    receiver = asyncio.create_task(receive(lines))
+    request_id = 0
+    for _ in range(lines):
+        await window.acquire()
+        requests = [workload.next(request_id + offset) for offset in range(min(batch, count - request_id))]
+        request_id += len(requests)
+        payload = requests if batch > 1 else requests[0]
+        sent_at.append(time.perf_counter())
+        writer.write(json.dumps(payload, separators=(',', ':')).encode('utf-8') + b'\n')
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+async def request(port, payload):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port, limit=1 << 22)
+    writer.write(json.dumps(payload).encode('utf-8') + b'\n')
+    response = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return response
+
+
+async def run_load(port, songs, args):
+    #Baut die Indizes vor der Messung auf, damit nur der eingeschwungene Zustand gemessen wird
+    await request(port, [{'op': 'search', 'field': 'title', 'value': ''}, {'op': 'sorted', 'field': 'artist'},
+                         {'op': 'sorted', 'field': 'genre'}, {'op': 'filter', 'conditions': {'artist': ''}},
+                         {'op': 'add', 'title': '', 'artist': '', 'album': '', 'genre': ''}, {'op': 'delete', 'title': ''}])
+    latencies = []
+    errors = []
+    per_client = args.requests // args.clients
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, Workload(songs, args.writes, seed), per_client, args.pipeline, args.batch, latencies, errors)
+                           for seed in range(args.clients)))
+    elapsed = time.perf_counter() - start
+    stats = await request(port, {'op': 'stats'})
+    return per_client * args.clients, elapsed, latencies, errors, stats['result']['latency']
+
+
+def wait_for_server(port, process, timeout=600):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server beendet mit Code {process.returncode}")
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError("Server nicht erreichbar")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--songs', type=int, default=100000)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--pipeline', type=int, default=16, help="offene Zeilen je Verbindung")
+    parser.add_argument('--batch', type=int, default=1, help="Anfragen je Zeile")
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--writes', type=float, default=0.05, help="Anteil schreibender Anfragen")
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    songs = [Song(word(rng), word(rng), word(rng), word(rng), song_id) for song_id in range(args.songs)]
+    workdir = tempfile.mkdtemp()
+    process = None
+    try:
+        write_snapshot(os.path.join(workdir, 'songs_RBT.bin'), songs)
+        port = free_port()
+        process = subprocess.Popen([sys.executable, os.path.join(ROOT, 'server.py'), '--port', str(port), '--workers', str(args.workers)],
+                                   cwd=workdir, stdout=subprocess.DEVNULL)
+        wait_for_server(port, process)
+        total, elapsed, latencies, errors, server_latency = asyncio.run(run_load(port, songs, args))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+        shutil.rmtree(workdir)
+
+    print(f"{args.songs} Songs, {args.clients} Verbindungen, Pipeline {args.pipeline}, Batch {args.batch}, "
+          f"{args.writes:.0%} schreibend, {args.workers} Threads:")
+    print(f"  {total} Anfragen in {elapsed:.2f} s: {total / elapsed:,.0f} Anfragen/s, Fehler: {len(errors)}")
+    label = 'Zeile' if args.batch > 1 else 'Anfrage'
+    print(f"  Latenz je {label} (Client): p50 {percentile(latencies, 50) * 1000:.2f} ms, p99 {percentile(latencies, 99) * 1000:.2f} ms")
+    for operation, stats in server_latency.items():
+        print(f"  {operation:<16} Server: {stats['count']:>7}x  p50 {stats['p50_ns'] / 1e6:.3f} ms  p99 {stats['p99_ns'] / 1e6:.3f} ms")
+    if errors:
+        print(f"  Erster Fehler: {errors[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Misst den residenten Speicher (RSS) für eine Bibliothek mit vielen Songs in drei Varianten:
+
+- dict:     Song-Objekte mit __dict__ und eigenen Strings je Feld (bisheriges Verhalten)
+- slots:    Song mit __slots__ und internierten Künstler-/Album-/Genre-Strings
+- columnar: SongStore mit wörterbuch-kodierten Spalten und SongView-Zeilen
+
+Künstler, Alben und Genres werden wie in echten Bibliotheken aus begrenzten Mengen gezogen,
+die Strings aber für jede Zeile neu erzeugt (wie beim Einlesen einer CSV-Datei).
+Jede Variante läuft in einem eigenen Prozess.
+
+Aufruf: python benchmarks/bench_song_memory.py [Anzahl Songs ...]
+"""
+import os
+import random
+import string
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+VARIANTS = ('dict', 'slots', 'columnar')
+
+
+class DictSong:
+    #Nachbildung des Songs ohne __slots__ und ohne Internierung
+    def __init__(self, title, artist, album, genre):
+        self.title = title
+        self.artist = artist
+        self.album = album
+        self.genre = genre
+
+
+def resident_memory():
+    #Aktueller residenter Speicher des Prozesses in Bytes
+    with open('/proc/self/statm') as file:
+        return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def random_word(rng):
+    return ''.join(rng.choices(string.ascii_uppercase, k=rng.randint(5, 10)))
+
+
+def rows(count):
+    rng = random.Random(3)
+    artists = [random_word(rng) for _ in range(max(1, count // 20))]
+    albums = [random_word(rng) for _ in range(max(1, count // 8))]
+    genres = [random_word(rng) for _ in range(40)]
+    for _ in range(count):
+        #Strings neu aufbauen, damit gleiche Werte wie beim Parsen eigene Objekte sind
+        yield (random_word(rng), ''.join(rng.choice(artists)), ''.join(rng.choice(albums)),
+               ''.join(rng.choice(genres)))
+
+
+def run_variant(variant, count):
+    from song import Song
+    from song_store import SongStore
+
+    before = resident_memory()
+    if variant == 'dict':
+        songs = [DictSong(*row) for row in rows(count)]
+    elif variant == 'slots':
+        songs = [Song(*row) for row in rows(count)]
+    else:
+        store = SongStore()
+        songs = [store.append(*row) for row in rows(count)]
+    after = resident_memory()
+    print(after - before)
+    return songs
+
+
+def main(sizes):
+    print(f"{'Songs':>9} " + " ".join(f"{variant + ' MB':>12}" for variant in VARIANTS))
+    for size in sizes:
+        results = []
+        for variant in VARIANTS:
+            output = subprocess.run([sys.executable, __file__, '--variant', variant, str(size)],
+                                    capture_output=True, text=True, check=True).stdout
+            results.append(int(output.strip()) / 1e6)
+        print(f"{size:>9} " + " ".join(f"{value:>12.1f}" for value in results))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == '--variant':
+        run_variant(sys.argv[2], int(sys.argv[3]))
+    else:
+        main([int(arg) for arg in sys.argv[1:]] or [100000, 1000000])
@@ -0,0 +1,76 @@
+"""
+Vergleicht Speicherbedarf und Durchsatz des Knoten-basierten RedBlackTree mit dem
+Array-basierten ArrayRedBlackTree und dem PersistentRedBlackTree aus unveränderlichen Knoten.
+
+Der Speicher wird mit tracemalloc gemessen und enthält nur die Baumstruktur, nicht die
+Songs selbst (die bei beiden Varianten identisch sind).
+
+Aufruf: python benchmarks/bench_tree_backends.py [Anzahl Songs ...]
+"""
+import gc
+import os
+import random
+import string
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from array_red_black_tree import ArrayRedBlackTree
+from persistent_red_black_tree import PersistentRedBlackTree
+from red_black_tree import RedBlackTree
+from song import Song
+
+
+def random_songs(count):
+    random.seed(7)
+    return [Song(''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10))), "ARTIST", "ALBUM", "GENRE")
+            for _ in range(count)]
+
+
+def measure_memory(tree_class, sorted_songs):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = tree_class.from_sorted(sorted_songs)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del tree
+    return used
+
+
+def measure_throughput(tree_class, songs):
+    tree = tree_class()
+    start = time.perf_counter()
+    for song in songs:
+        tree.insert(song)
+    insert_rate = len(songs) / (time.perf_counter() - start)
+
+    targets = [song.title for song in songs[::max(1, len(songs) // 100000)]]
+    start = time.perf_counter()
+    for title in targets:
+        tree.search(title, 'title')
+    search_rate = len(targets) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for song in songs:
+        tree.delete(song)
+    delete_rate = len(songs) / (time.perf_counter() - start)
+    return insert_rate, search_rate, delete_rate
+
+
+def main(sizes):
+    print(f"{'Songs':>9} {'Backend':>10} {'Speicher MB':>12} {'Bytes/Knoten':>13} {'Einfügen/s':>11} {'Suchen/s':>10} {'Löschen/s':>10}")
+    for size in sizes:
+        songs = random_songs(size)
+        sorted_songs = sorted(songs)
+        for name, tree_class in (('node', RedBlackTree), ('array', ArrayRedBlackTree), ('persistent', PersistentRedBlackTree)):
+            memory = measure_memory(tree_class, sorted_songs)
+            insert_rate, search_rate, delete_rate = measure_throughput(tree_class, songs)
+            print(f"{size:>9} {name:>10} {memory / 1e6:>12.1f} {memory / size:>13.1f} "
+                  f"{insert_rate:>11.0f} {search_rate:>10.0f} {delete_rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100000, 1000000])
@@ -0,0 +1,303 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+from itertools import chain, repeat
+
+from song_store import SongView
+
+MAGIC = b'MRBTSNAP'
+VERSION = 2  #Version 2 speichert die Song-Nummern, Version 1 wird weiterhin gelesen
+
+FIELDS = ('title', 'artist', 'album', 'genre')
+SORTED_FIELDS = ('title', 'artist', 'genre')  #Felder mit gespeicherter Sortierpermutation
+
+#Abschnitte der Datei: je Feld Werte-Blob, Offsets, Häufigkeiten und Codes, danach die Permutationen,
+#ab Version 2 die Song-Nummer je Zeile und die nächste freie Song-Nummer
+SECTIONS_V1 = [(field, part) for field in FIELDS for part in ('blob', 'offsets', 'counts', 'codes')] + \
+              [(field, 'perm') for field in SORTED_FIELDS]
+SECTIONS = SECTIONS_V1 + [('song_id', 'ids'), ('song_id', 'next')]
+
+SEPARATOR = b'\0'  #Trennt die Werte im Blob, damit alle Werte mit einem split dekodiert werden können
+
+HEADER = struct.Struct('<8sII')           #Magic, Version, Anzahl Songs
+SECTION = struct.Struct('<QQ')            #Offset und Länge eines Abschnitts in Bytes
+DATA_START = HEADER.size + SECTION.size * len(SECTIONS)
+
+
+def _pending_filename(filename):
+    #Neuer Snapshot, der die alte Datei noch nicht ersetzen konnte (z.B. weil sie unter Windows gemappt ist)
+    return filename + '.new'
+
+
+def _to_little_endian(values):
+    #Integer-Arrays werden immer little-endian gespeichert
+    if sys.byteorder == 'big':
+        values = array('I', values)
+        values.byteswap()
+    return values
+
+
+def _column(songs, field):
+    #Liest ein Feld aller Songs; Sichten auf einen gemappten Snapshot werden über dessen Codes
+    #gelesen, sodass jeder Wert nur einmal dekodiert wird; alle anderen Songs (auch Sichten auf
+    #einen spaltenorientierten SongStore) über ihre Attribute
+    store = getattr(songs[0], '_store', None) if songs else None
+    if not isinstance(store, MappedSongStore):
+        return [getattr(song, field) for song in songs]
+    values = store.values(field)
+    codes = store.codes[field]
+    view_class = store.view_class
+    return [values[codes[song]] if type(song) is view_class else getattr(song, field) for song in songs]
+
+
+def _song_ids(songs, next_song_id=None):
+    #Liest die Song-Nummern aller Songs, für Sichten auf einen gemappten Snapshot direkt aus
+    #dessen Nummern-Array; Songs ohne Nummer erhalten neue Nummern ab der nächsten freien,
+    #damit sie mit keiner vorhandenen Nummer zusammenfallen
+    store = getattr(songs[0], '_store', None) if songs else None
+    ids = store.ids if isinstance(store, MappedSongStore) else None
+    view_class = store.view_class if ids is not None else None
+    song_ids = [ids[song] if type(song) is view_class else song.song_id for song in songs]
+    known = [song_id for song_id in song_ids if song_id is not None]
+    fresh = max(next_song_id or 0, max(known) + 1 if known else 0)
+    for row, song_id in enumerate(song_ids):
+        if song_id is None:
+            song_ids[row] = fresh
+            fresh += 1
+    return array('I', song_ids), fresh
+
+
+def _encode(column, permutation):
+    #Wörterbuch-Kodierung entlang der Sortierpermutation: gleiche Werte folgen aufeinander,
+    #dadurch sind die Werte sortiert und die Codes erhalten die Sortierreihenfolge
+    values = []
+    counts = array('I')
+    codes = array('I', bytes(4 * len(column)))
+    previous = None
+    code = -1
+    for row in permutation:
+        value = column[row]
+        if value != previous or code < 0:
+            values.append(value)
+            counts.append(0)
+            previous = value
+            code += 1
+        counts[code] += 1
+        codes[row] = code
+    return values, counts, codes
+
+
+def write_snapshot(filename, songs, permutations=None, next_song_id=None):
+    """
+    Schreibt die Songs als binären Snapshot.
+
+    Jedes Feld wird wörterbuch-kodiert: die unterschiedlichen Werte liegen sortiert und
+    UTF-8-kodiert hintereinander in einem Blob, ein Offset-Array fester Breite zeigt auf den
+    Anfang jedes Werts, ein Array zählt die Songs je Wert und ein Code-Array enthält je Song
+    die Nummer seines Werts. Für Titel, Künstler und Genre wird zusätzlich die
+    Sortierpermutation gespeichert, sodass beim Laden nicht sortiert werden muss. Die
+    Song-Nummern werden mitgespeichert und bleiben so über das Speichern hinweg gültig,
+    z.B. für Verweise aus Playlists.
+
+    Geschrieben wird in eine neue Datei, die die alte danach ersetzt. Ist die alte Datei noch
+    gemappt und lässt sich nicht ersetzen, bleibt die neue Datei liegen und wird beim
+    nächsten Öffnen übernommen.
+
+    Args:
+        filename (str): Der Pfad der Snapshot-Datei.
+        songs (list): Die zu speichernden Songs.
+        permutations (dict): Optional Feld -> Songpositionen in sortierter Reihenfolge;
+            fehlende Permutationen werden hier berechnet.
+        next_song_id (int): Die nächste freie Song-Nummer; ohne Angabe die größte Nummer plus eins.
+            Songs ohne Nummer erhalten neue Nummern ab dieser, die gespeicherte nächste freie
+            Nummer liegt dahinter.
+
+    Returns:
+        bool: True, wenn die Datei ersetzt wurde, False, wenn der neue Snapshot noch aussteht.
+    """
+    permutations = dict(permutations or {})
+    sections = {}
+    for field in FIELDS:
+        column = _column(songs, field)
+        permutation = permutations.get(field)
+        if permutation is None:
+            permutation = permutations[field] = sorted(range(len(songs)), key=column.__getitem__)
+        values, counts, column = _encode(column, permutation)
+        encoded = [value.encode('utf-8') for value in values]
+        offsets = array('I', [0])
+        position = 0
+        for value in encoded:
+            position += len(value) + len(SEPARATOR)
+            offsets.append(position)
+        sections[field, 'blob'] = SEPARATOR.join(encoded) + SEPARATOR if encoded else b''
+        sections[field, 'offsets'] = _to_little_endian(offsets)
+        sections[field, 'counts'] = _to_little_endian(counts)
+        sections[field, 'codes'] = _to_little_endian(column)
+    for field in SORTED_FIELDS:
+        sections[field, 'perm'] = _to_little_endian(array('I', permutations[field]))
+    ids, next_song_id = _song_ids(songs, next_song_id)
+    sections['song_id', 'ids'] = _to_little_endian(ids)
+    sections['song_id', 'next'] = _to_little_endian(array('I', [next_song_id]))
+
+    pending = _pending_filename(filename)
+    with open(pending, 'wb') as file:
+        file.write(b'\0' * DATA_START)
+        directory = []
+        for key in SECTIONS:
+            file.write(b'\0' * (-file.tell() % 8))  #Arrays an 8 Bytes ausrichten
+            data = sections[key]
+            directory.append((file.tell(), len(data) * getattr(data, 'itemsize', 1)))
+            file.write(data)
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, len(songs)))
+        for offset, length in directory:
+            file.write(SECTION.pack(offset, length))
+    try:
+        os.replace(pending, filename)
+    except PermissionError:
+        return False
+    return True
+
+
+def snapshot_exists(filename):
+    #Prüft, ob ein Snapshot (oder ein noch nicht übernommener neuer Snapshot) vorhanden ist
+    return os.path.exists(filename) or os.path.exists(_pending_filename(filename))
+
+
+class MappedSongStore:
+    """
+    Nur lesender Zugriff auf einen binären Snapshot über mmap.
+
+    Beim Öffnen wird nur der Kopf gelesen; die Arrays sind Sichten direkt auf die gemappte
+    Datei. Die Songs werden als MappedSongView herausgegeben, die ihre Felder erst beim
+    Zugriff aus der Datei dekodieren.
+    """
+
+    def __init__(self, filename):
+        """
+        Öffnet den Snapshot und übernimmt vorher einen noch ausstehenden neuen Snapshot.
+
+        Args:
+            filename (str): Der Pfad der Snapshot-Datei.
+
+        Raises:
+            ValueError: Wenn die Datei kein gültiger Snapshot ist.
+        """
+        pending = _pending_filename(filename)
+        if os.path.exists(pending):
+            os.replace(pending, filename)
+        self.filename = filename
+        with open(filename, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version not in (1, VERSION):
+            self._mmap.close()
+            raise ValueError(f"{filename} ist kein Snapshot im Format {MAGIC.decode()} Version {VERSION}.")
+
+        data = memoryview(self._mmap)
+        self.blobs = {}
+        self.offsets = {}
+        self.counts = {}
+        self.codes = {}
+        self.permutations = {}
+        #Version 1 hat keine Song-Nummern, dort ist die Zeile die Nummer
+        self.ids = range(self.count)
+        self.next_song_id = self.count
+        for position, (field, part) in enumerate(SECTIONS if version >= 2 else SECTIONS_V1):
+            offset, length = SECTION.unpack_from(self._mmap, HEADER.size + position * SECTION.size)
+            section = data[offset:offset + length]
+            if part == 'blob':
+                self.blobs[field] = section
+                continue
+            if sys.byteorder == 'big':
+                values = array('I', section)
+                values.byteswap()
+            else:
+                values = section.cast('I')
+            if part == 'ids':
+                self.ids = values
+            elif part == 'next':
+                self.next_song_id = values[0]
+            else:
+                {'offsets': self.offsets, 'counts': self.counts, 'codes': self.codes, 'perm': self.permutations}[part][field] = values
+        #Eigene Sicht-Klasse je Store, damit die Sichten selbst nur die Zeilennummer tragen
+        self.view_class = type('MappedSongView', (MappedSongView,), {'__slots__': (), '_store': self})
+
+    def __len__(self):
+        return self.count
+
+    def value(self, field, row):
+        #Dekodiert den Wert eines Felds für eine Zeile direkt aus der gemappten Datei
+        code = self.codes[field][row]
+        offsets = self.offsets[field]
+        return str(self.blobs[field][offsets[code]:offsets[code + 1] - len(SEPARATOR)], 'utf-8')
+
+    def views(self):
+        #Gibt je Zeile eine Sicht zurück, in der Reihenfolge der Datei
+        return list(map(self.view_class, range(self.count)))
+
+    def values(self, field):
+        """
+        Dekodiert alle unterschiedlichen Werte eines Felds in sortierter Reihenfolge.
+
+        Args:
+            field (str): Das Feld ('title', 'artist', 'album' oder 'genre').
+
+        Returns:
+            list: Die Werte, die Position entspricht dem Code.
+        """
+        blob = self.blobs[field]
+        offsets = self.offsets[field]
+        count = len(offsets) - 1
+        values = str(blob, 'utf-8').split(SEPARATOR.decode())[:-1] if count else []
+        if len(values) != count:
+            #Ein Wert enthält selbst das Trennzeichen, dann wird jeder Wert einzeln dekodiert
+            values = [str(blob[offsets[code]:offsets[code + 1] - len(SEPARATOR)], 'utf-8') for code in range(count)]
+        return values
+
+    def sorted_keys(self, field):
+        """
+        Gibt die Werte eines Felds in der gespeicherten Sortierreihenfolge zurück.
+
+        Da die Werte sortiert gespeichert sind, wird jeder Wert nur einmal dekodiert und so oft
+        wiederholt, wie Songs ihn haben.
+
+        Args:
+            field (str): Ein Feld aus SORTED_FIELDS.
+
+        Returns:
+            list: Die Werte des Felds, sortiert wie die Permutation.
+        """
+        values = self.values(field)
+        counts = self.counts[field]
+        if all(count == 1 for count in counts):
+            return values
+        return list(chain.from_iterable(map(repeat, values, counts)))
+
+    def get_size(self):
+        #Größe der gemappten Datei in Bytes (wird vom Betriebssystem bei Bedarf eingelesen)
+        return len(self._mmap)
+
+
+class MappedSongView(SongView):
+    """
+    Sicht auf eine Zeile eines MappedSongStore mit derselben Schnittstelle wie Song.
+
+    Alle Felder, auch der Titel, werden bei jedem Zugriff aus der gemappten Datei dekodiert.
+    Die Song-Nummer steht im Snapshot neben den Feldern.
+    """
+
+    __slots__ = ()
+
+    @property
+    def song_id(self):
+        return self._store.ids[self]
+
+    @property
+    def title(self):
+        return self._store.value('title', self)
+
+    def __repr__(self):
+        return f"MappedSongView({int(self)}: {self.title!r})"
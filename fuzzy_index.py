@@ -0,0 +1,183 @@
+import sys
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import chain, compress
+from operator import attrgetter
+
+
+def trigrams(text):
+    """
+    Zerlegt einen Text in seine Trigramme (Folgen von drei Zeichen).
+
+    Der Text wird kleingeschrieben, Leerraum zusammengefasst und mit Leerzeichen umrahmt,
+    damit auch Wortanfang und Wortende eigene Trigramme bilden.
+
+    Args:
+        text (str): Der zu zerlegende Text.
+
+    Returns:
+        set: Die unterschiedlichen Trigramme des Texts.
+    """
+    text = f"  {' '.join(text.lower().split())} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def similarity(query_trigrams, text):
+    #Dice-Koeffizient zweier Trigramm-Mengen: 1.0 bei gleichen Mengen, 0.0 ohne Gemeinsamkeiten
+    text_trigrams = trigrams(text)
+    return 2 * len(query_trigrams & text_trigrams) / (len(query_trigrams) + len(text_trigrams))
+
+
+class FuzzyIndex:
+    """
+    Invertierter Trigramm-Index für die unscharfe Suche über Titel, Künstler und Album.
+
+    Je Feld wird zu jedem Trigramm die nach Nummer sortierte Liste der Song-Nummern gespeichert,
+    deren Wert es enthält; Entfernen findet eine Nummer so per Binärsuche.
+    Eine Anfrage zählt je Feld, wie viele ihrer Trigramme bei jeder Song-Nummer vorkommen, und
+    bewertet nur die Songs mit den meisten Treffern genauer. Tippfehler wie "Bohemain Rapsody"
+    zerstören nur wenige Trigramme, der gesuchte Song bleibt vorne.
+    """
+
+    FIELDS = ('title', 'artist', 'album')
+    CANDIDATES = 50    #Anzahl der Kandidaten, die genau bewertet werden
+    MIN_SCORE = 0.3    #Mindestähnlichkeit eines Treffers
+
+    def __init__(self, songs_by_id, fields=FIELDS):
+        """
+        Initialisiert einen leeren Index.
+
+        Args:
+            songs_by_id (dict): Die Zuordnung Song-Nummer -> Song, über die Treffer aufgelöst werden.
+            fields (tuple): Die indizierten Song-Attribute.
+        """
+        self.songs_by_id = songs_by_id
+        self.fields = fields
+        self._postings = {field: {} for field in fields}  #Feld -> Trigramm -> Song-Nummern (array)
+
+    def add(self, song):
+        """
+        Nimmt einen Song in den Index auf.
+
+        Args:
+            song (Song): Der Song, er muss eine song_id haben.
+
+        Returns:
+            None
+        """
+        song_id = song.song_id
+        for field in self.fields:
+            postings = self._postings[field]
+            for trigram in trigrams(getattr(song, field)):
+                posting = postings.get(trigram)
+                if posting is None:
+                    posting = postings[trigram] = array('I')
+                if not posting or posting[-1] < song_id:
+                    posting.append(song_id)  #Neue Songs haben die größte Nummer, die Liste bleibt sortiert
+                else:
+                    insort(posting, song_id)
+
+    def update(self, songs):
+        #Nimmt viele Songs in den Index auf; nach Nummer geordnet bleiben die Listen durch Anhängen
+        #sortiert, nur Listen mit älteren Nummern aus früheren Aufrufen werden am Ende einmal sortiert
+        unsorted = set()
+        for song in sorted(songs, key=attrgetter('song_id')):
+            song_id = song.song_id
+            for field in self.fields:
+                postings = self._postings[field]
+                for trigram in trigrams(getattr(song, field)):
+                    posting = postings.get(trigram)
+                    if posting is None:
+                        posting = postings[trigram] = array('I')
+                    elif posting[-1] > song_id:
+                        unsorted.add((field, trigram))
+                    posting.append(song_id)
+        for field, trigram in unsorted:
+            postings = self._postings[field]
+            postings[trigram] = array('I', sorted(postings[trigram]))
+
+    def remove(self, song):
+        """
+        Entfernt einen Song aus den Listen seiner Trigramme.
+
+        Die Position in jeder Liste wird per Binärsuche bestimmt; danach rücken nur noch die
+        folgenden Nummern im Array nach (ein Kopiervorgang in C).
+
+        Args:
+            song (Song): Der zu entfernende Song.
+
+        Returns:
+            None
+        """
+        song_id = song.song_id
+        for field in self.fields:
+            postings = self._postings[field]
+            for trigram in trigrams(getattr(song, field)):
+                posting = postings.get(trigram)
+                if posting is None:
+                    continue
+                position = bisect_left(posting, song_id)  #Statt posting.remove, das die Liste linear durchsucht
+                if position == len(posting) or posting[position] != song_id:
+                    continue
+                del posting[position]
+                if not posting:
+                    del postings[trigram]
+
+    def _candidates(self, query_trigrams, field):
+        #Song-Nummern mit den meisten gemeinsamen Trigrammen in einem Feld
+        postings = self._postings[field]
+        #Zählen in C über alle Listen der Anfrage
+        counts = Counter(chain.from_iterable(postings[trigram] for trigram in query_trigrams if trigram in postings))
+        if len(counts) <= self.CANDIDATES:
+            return list(counts)
+        #Kleinste Trefferzahl bestimmen, mit der genug Kandidaten übrig bleiben, ohne alle Nummern zu sortieren
+        histogram = Counter(counts.values())
+        selected = 0
+        for threshold in sorted(histogram, reverse=True):
+            selected += histogram[threshold]
+            if selected >= self.CANDIDATES:
+                break
+        candidates = list(compress(counts.keys(), map(threshold.__le__, counts.values())))
+        if len(candidates) > self.CANDIDATES:
+            candidates.sort(key=counts.__getitem__, reverse=True)
+            del candidates[self.CANDIDATES:]
+        return candidates
+
+    def search(self, query, limit=10):
+        """
+        Sucht die Songs, deren Titel, Künstler oder Album der Anfrage am ähnlichsten sind.
+
+        Args:
+            query (str): Der Suchtext, darf Tippfehler enthalten.
+            limit (int): Die maximale Anzahl Treffer.
+
+        Returns:
+            list: Paare (Song, Ähnlichkeit), die ähnlichsten zuerst.
+        """
+        query_trigrams = trigrams(query)
+        scores = {}  #Song-Nummer -> beste Ähnlichkeit über die Felder
+        for field in self.fields:
+            for song_id in self._candidates(query_trigrams, field):
+                song = self.songs_by_id.get(song_id)
+                if song is None:
+                    continue
+                score = similarity(query_trigrams, getattr(song, field))
+                if score >= self.MIN_SCORE and score > scores.get(song_id, 0):
+                    scores[song_id] = score
+        best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+        return [(self.songs_by_id[song_id], score) for song_id, score in best]
+
+    def get_size(self):
+        """
+        Berechnet den Speicherbedarf des Index (ohne die Songs selbst).
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        size = sys.getsizeof(self._postings)
+        for postings in self._postings.values():
+            size += sys.getsizeof(postings)
+            for trigram, posting in postings.items():
+                size += sys.getsizeof(trigram) + sys.getsizeof(posting)
+        return size
@@ -0,0 +1,232 @@
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class LatencyHistogram:
+    """
+    Logarithmisches Latenz-Histogramm einer Operation.
+
+    Jede Messung wird einem Eimer zugeordnet, der die vier höchstwertigen Bits der Laufzeit
+    in Nanosekunden enthält. Damit liegt der relative Fehler der Perzentile unter 12,5 %,
+    während Speicher und Aufwand je Messung unabhängig von der Anzahl der Messungen bleiben.
+    """
+
+    SIGNIFICANT_BITS = 4
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.buckets = {}       #Untergrenze des Eimers -> Anzahl Messungen
+        self.max_memory = None  #Größter Speicher-Peak, nur im Speichermodus
+
+    def record(self, elapsed_ns, memory=None):
+        """
+        Nimmt eine Messung in das Histogramm auf.
+
+        Args:
+            elapsed_ns (int): Die Laufzeit in Nanosekunden.
+            memory (int): Der Speicher-Peak in Bytes oder None im Zeitmodus.
+
+        Returns:
+            None
+        """
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if self.min_ns is None or elapsed_ns < self.min_ns:
+            self.min_ns = elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        shift = max(0, elapsed_ns.bit_length() - self.SIGNIFICANT_BITS)
+        bucket = (elapsed_ns >> shift) << shift
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        if memory is not None and (self.max_memory is None or memory > self.max_memory):
+            self.max_memory = memory
+
+    def percentile(self, percent):
+        """
+        Schätzt ein Perzentil aus den Eimern (Obergrenze des Eimers, höchstens das Maximum).
+
+        Args:
+            percent (float): Das gewünschte Perzentil (0-100).
+
+        Returns:
+            int: Die geschätzte Laufzeit in Nanosekunden oder 0 ohne Messungen.
+        """
+        if not self.count:
+            return 0
+        target = max(1, -(-percent * self.count // 100))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                shift = max(0, bucket.bit_length() - self.SIGNIFICANT_BITS)
+                return min(bucket + (1 << shift) - 1, self.max_ns)
+        return self.max_ns
+
+    def to_dict(self):
+        #Kennzahlen der Operation als Wörterbuch, z.B. für die JSON-Ausgabe
+        return {
+            'count': self.count,
+            'mean_ns': self.total_ns // self.count if self.count else 0,
+            'min_ns': self.min_ns or 0,
+            'p50_ns': self.percentile(50),
+            'p90_ns': self.percentile(90),
+            'p99_ns': self.percentile(99),
+            'max_ns': self.max_ns,
+            'max_memory': self.max_memory,
+        }
+
+
+class Measurement:
+    #Ergebnis einer einzelnen Messung, wird nach Ende des gemessenen Blocks gefüllt
+    __slots__ = ('operation', 'elapsed', 'memory')
+
+    def __init__(self, operation):
+        self.operation = operation
+        self.elapsed = 0.0  #Laufzeit in Sekunden
+        self.memory = None  #Speicher-Peak in Bytes, None im Zeitmodus
+
+
+class Instrumentation:
+    """
+    Register für die Messwerte der Musik-App (Suche, Einfügen, Löschen, Sortieren, Speichern, Laden).
+
+    Im Zeitmodus wird nur time.perf_counter_ns gelesen. Im Speichermodus läuft tracemalloc
+    dauerhaft mit, je Messung werden nur der aktuelle Stand und der Peak abgefragt
+    (tracemalloc.reset_peak), statt zwei vollständige Snapshots zu vergleichen.
+    """
+
+    TIMING = 'timing'
+    MEMORY = 'memory'
+
+    def __init__(self, mode=TIMING):
+        """
+        Initialisiert ein leeres Register.
+
+        Args:
+            mode (str): Der Messmodus (Instrumentation.TIMING oder Instrumentation.MEMORY).
+        """
+        self.histograms = {}
+        self._peaks = []  #Speicher-Peaks der gerade laufenden, verschachtelten Messungen
+        self.mode = self.TIMING
+        self.set_mode(mode)
+
+    def set_mode(self, mode):
+        """
+        Wechselt zwischen reiner Zeitmessung und Zeit- plus Speichermessung.
+
+        Args:
+            mode (str): Der neue Messmodus.
+
+        Raises:
+            ValueError: Wenn der Modus unbekannt ist.
+
+        Returns:
+            None
+        """
+        if mode not in (self.TIMING, self.MEMORY):
+            raise ValueError(f"Unbekannter Messmodus '{mode}'. Erlaubt: {self.TIMING}, {self.MEMORY}")
+        if mode == self.MEMORY and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        elif mode == self.TIMING and self.mode == self.MEMORY and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.mode = mode
+
+    @contextmanager
+    def track(self, operation):
+        """
+        Misst den umschlossenen Block und trägt ihn unter der Operation ein.
+
+        Args:
+            operation (str): Der Name der Operation (z.B. 'insert' oder 'search/Binärsuche').
+
+        Returns:
+            generator: Liefert ein Measurement, das nach dem Block Laufzeit und Speicher enthält.
+        """
+        measurement = Measurement(operation)
+        tracing = self.mode == self.MEMORY
+        if tracing:
+            baseline, peak = tracemalloc.get_traced_memory()
+            if self._peaks:
+                #Verschachtelte Messung: Peak des äußeren Blocks sichern, bevor er zurückgesetzt wird
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            self._peaks.append(0)
+            tracemalloc.reset_peak()
+        start = time.perf_counter_ns()
+        try:
+            yield measurement
+        finally:
+            elapsed_ns = time.perf_counter_ns() - start
+            if tracing:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                measurement.memory = peak - baseline
+            measurement.elapsed = elapsed_ns / 1e9
+            self.record(operation, elapsed_ns, measurement.memory)
+
+    def measure(self, operation, method, *args):
+        """
+        Führt eine Methode aus und misst sie unter der angegebenen Operation.
+
+        Args:
+            operation (str): Der Name der Operation.
+            method (function): Die auszuführende Methode.
+            *args: Argumente, die an die Methode übergeben werden.
+
+        Returns:
+            tuple: Das Ergebnis der Methode und das Measurement.
+        """
+        with self.track(operation) as measurement:
+            result = method(*args)
+        return result, measurement
+
+    def record(self, operation, elapsed_ns, memory=None):
+        #Trägt eine extern gemessene Laufzeit ein
+        histogram = self.histograms.get(operation)
+        if histogram is None:
+            histogram = self.histograms[operation] = LatencyHistogram()
+        histogram.record(elapsed_ns, memory)
+
+    def snapshot(self):
+        """
+        Gibt die Kennzahlen aller Operationen zurück.
+
+        Returns:
+            dict: Operation -> Kennzahlen (Anzahl, Mittelwert, Perzentile, Maximum in Nanosekunden).
+        """
+        return {operation: self.histograms[operation].to_dict() for operation in sorted(self.histograms)}
+
+    def dump(self, filename=None):
+        """
+        Gibt die Messwerte als Tabelle aus oder schreibt sie als JSON in eine Datei.
+
+        Args:
+            filename (str): Optionaler Pfad der JSON-Datei.
+
+        Returns:
+            None
+        """
+        snapshot = self.snapshot()
+        if filename is not None:
+            with open(filename, 'w', encoding='utf-8') as file:
+                json.dump({'mode': self.mode, 'operations': snapshot}, file, indent=2, ensure_ascii=False)
+            print(f"Messwerte in {filename} gespeichert.")
+            return
+        if not snapshot:
+            print("Noch keine Messwerte vorhanden.")
+            return
+        print(f"Messwerte (Modus: {self.mode}, Zeiten in Millisekunden):")
+        print(f"{'Operation':<32} {'Anzahl':>7} {'Mittel':>10} {'p50':>10} {'p90':>10} {'p99':>10} {'Max':>10} {'Speicher':>10}")
+        for operation, stats in snapshot.items():
+            memory = '' if stats['max_memory'] is None else stats['max_memory']
+            print(f"{operation:<32} {stats['count']:>7} {stats['mean_ns'] / 1e6:>10.3f} {stats['p50_ns'] / 1e6:>10.3f} "
+                  f"{stats['p90_ns'] / 1e6:>10.3f} {stats['p99_ns'] / 1e6:>10.3f} {stats['max_ns'] / 1e6:>10.3f} {memory:>10}")
+
+    def reset(self):
+        #Verwirft alle bisherigen Messwerte
+        self.histograms.clear()
@@ -0,0 +1,88 @@
+import csv
+import os
+
+
+class SongJournal:
+    """
+    Append-only Änderungsprotokoll neben dem Basis-Snapshot der Musikbibliothek.
+
+    Jede Änderung (Song hinzufügen/löschen, Playlist-Operationen) wird als eine Zeile
+    angehängt, statt die komplette Bibliothek neu zu schreiben. Beim Laden wird das
+    Protokoll auf den Snapshot und die gespeicherten Playlists angewendet; wird es zu lang,
+    faltet die App es per Kompaktierung wieder in den Snapshot und die Playlist-Dateien.
+    """
+
+    COMPACTION_THRESHOLD = 10000  #Anzahl neuer Einträge, ab der kompaktiert wird
+
+    ADD = 'ADD_ID'                    #Song-Nummer, Titel, Künstler, Album, Genre
+    DELETE = 'DEL_ID'                 #Song-Nummer, da mehrere Songs denselben Titel haben können
+    PLAYLIST_CREATE = 'PL_CREATE'
+    PLAYLIST_ADD = 'PL_ADD_ID'        #Playlist-Name und Song-Nummer
+    PLAYLIST_REMOVE = 'PL_REMOVE_ID'
+    PLAYLIST_ADD_TITLE = 'PL_ADD'     #Ältere Protokolle mit Titel statt Song-Nummer, werden nur noch gelesen
+    PLAYLIST_REMOVE_TITLE = 'PL_REMOVE'
+    DELETE_TITLE = 'DEL'
+    ADD_WITHOUT_ID = 'ADD'
+
+    def __init__(self, filename):
+        """
+        Initialisiert das Protokoll und zählt die vorhandenen Einträge.
+
+        Args:
+            filename (str): Der Pfad der Protokolldatei.
+        """
+        self.filename = filename
+        self.entries = sum(1 for _ in self.replay())
+        self.base_entries = 0  #Einträge, die direkt nach der letzten Kompaktierung geschrieben wurden
+
+    def append(self, operation, *fields):
+        """
+        Hängt eine Änderung an das Protokoll an.
+
+        Args:
+            operation (str): Die Art der Änderung (z.B. SongJournal.ADD).
+            *fields: Die Daten der Änderung (z.B. Titel, Künstler, Album, Genre).
+
+        Returns:
+            None
+        """
+        with open(self.filename, 'a', newline='') as file:
+            csv.writer(file).writerow((operation,) + fields)
+        self.entries += 1
+
+    def replay(self):
+        """
+        Liest alle Einträge des Protokolls in der geschriebenen Reihenfolge.
+
+        Returns:
+            generator: Tupel aus Operation und Liste der Felder.
+        """
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, 'r', newline='') as file:
+            for row in csv.reader(file):
+                if row:
+                    yield row[0], row[1:]
+
+    def needs_compaction(self):
+        #Prüft, ob seit der letzten Kompaktierung genug Einträge angefallen sind
+        return self.entries - self.base_entries >= self.COMPACTION_THRESHOLD
+
+    def reset(self, entries=()):
+        """
+        Ersetzt das Protokoll nach einer Kompaktierung durch die übergebenen Einträge.
+
+        Args:
+            entries (iterable): Einträge als Tupel (Operation, *Felder), die erhalten bleiben sollen.
+
+        Returns:
+            None
+        """
+        with open(self.filename, 'w', newline='') as file:
+            writer = csv.writer(file)
+            count = 0
+            for entry in entries:
+                writer.writerow(entry)
+                count += 1
+        self.entries = count
+        self.base_entries = count
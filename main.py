@@ -1,6 +1,10 @@
+import sys
 from music_app import MusicApp
 
 if __name__ == "__main__":
     # Startet die Musik-App, wenn das Skript direkt ausgeführt wird
-    app = MusicApp()
+    # Optional: "python main.py array" wählt den Array-basierten Rot-Schwarz-Baum,
+    # "python main.py persistent" den Baum aus unveränderlichen Knoten
+    tree_backend = sys.argv[1] if len(sys.argv) > 1 else 'node'
+    app = MusicApp(tree_backend)
     app.main_menu()
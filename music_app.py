@@ -1,160 +1,629 @@
+import gc
 import os
 import time
 import random
 import string
-import sys
-import tracemalloc
-import copy
+from array import array
+from itertools import chain, repeat
+from operator import attrgetter, gt, le
 from song import Song
 from playlist import Playlist
+from playlist_store import read_playlists, write_playlist
+from journal import SongJournal
+from song_csv import read_song_batches, write_songs
+from binary_snapshot import MappedSongStore, snapshot_exists, write_snapshot
 from red_black_tree import RedBlackTree
+from array_red_black_tree import ArrayRedBlackTree
+from persistent_red_black_tree import PersistentRedBlackTree
+from sorted_index import SortedIndex
+from song_store import SongStore
+from numpy_engine import NumpySongIndex, NUMPY_AVAILABLE
+from fuzzy_index import FuzzyIndex
+from query_engine import QueryEngine, parse_query
+from title_index import TitleIndex
+from parallel_sort import parallel_sort_order
+from instrumentation import Instrumentation
 
 class MusicApp:
-    FILENAME = "songs_RBT.csv"
+    FILENAME = "songs_RBT.csv"            #CSV für Import und Export
+    BINARY_FILENAME = "songs_RBT.bin"     #Binärer Snapshot, schneller Weg für Laden und Speichern
+    JOURNAL_FILENAME = "songs_RBT.journal"
+    PLAYLIST_DIRECTORY = "playlists"      #Eine JSON-Datei je Playlist mit den Song-Nummern ihrer Songs
+    PAGE_SIZE = 20  #Anzahl der Songs pro Seite in der seitenweisen Anzeige
+    INDEX_FIELDS = ('title', 'artist', 'genre')  #Felder mit sortiertem Index
+    PREFIX_LIMIT = 10  #Anzahl der Vorschläge der Präfixsuche
+    TREE_BACKENDS = {
+        'node': RedBlackTree,        #Ein Python-Objekt pro Knoten
+        'array': ArrayRedBlackTree,  #Knoten in parallelen Integer-Arrays
+        'persistent': PersistentRedBlackTree,  #Unveränderliche Knoten, jede Änderung ergibt eine neue Version
+    }
+
+    def __init__(self, tree_backend='node', columnar=False, measure_memory=False):
+        """
+        Initialisiert die Musik-App und lädt Songs.
 
-    def __init__(self):
-        #Initialisiert die Musik-App und lädt Songs
+        Args:
+            tree_backend (str): Die Speicherform des Rot-Schwarz-Baums ('node', 'array' oder 'persistent').
+            columnar (bool): Ob die Songs spaltenorientiert in einem SongStore abgelegt werden.
+            measure_memory (bool): Ob neben der Laufzeit auch der Speicher-Peak gemessen wird.
+        """
+        if tree_backend not in self.TREE_BACKENDS:
+            raise ValueError(f"Unbekanntes Baum-Backend '{tree_backend}'. Erlaubt: {', '.join(self.TREE_BACKENDS)}")
+        self.tree_class = self.TREE_BACKENDS[tree_backend]
+        self.song_store = SongStore() if columnar else None
+        self.snapshot = None  #Gemappter binärer Snapshot, aus dem die geladenen Songs gelesen werden
+        self._snapshot_intact = False  #Ob die ersten Songs noch in der Reihenfolge des Snapshots stehen
         self.songs = []
-        self.sorted_songs_by_title = []
-        self.sorted_songs_by_artist = []
-        self.sorted_songs_by_genre = []
-        self.playlists = []
-        self.rbt = RedBlackTree()
-        self.load_songs()
+        #Die sortierten Indizes und der Baum werden erst bei der ersten Abfrage aufgebaut
+        self._sorted_indexes_by_field = dict.fromkeys(self.INDEX_FIELDS)
+        self.playlists = {}  #Name -> Playlist, in der Reihenfolge des Anlegens
+        self._playlists_by_song = {}  #Song-Nummer -> Playlists, die den Song enthalten
+        self._dirty_playlists = set()  #Namen der Playlists, die seit dem letzten Speichern geändert wurden
+        self._rbt = None
+        self._numpy_index = None  #Wird bei der ersten NumPy-Abfrage aufgebaut
+        self._songs_by_id = None  #Song-Nummer -> Song, wird bei der ersten Abfrage aufgebaut
+        self._songs_by_title = None  #Titel -> Song, wird beim ersten Nachschlagen eines Titels aufgebaut
+        self._positions = None  #Song-Nummer -> Position in self.songs, für das Entfernen in O(1)
+        self._fuzzy_index = None  #Wird bei der ersten unscharfen Suche aufgebaut
+        self._query_engine = None  #Wird bei der ersten Anfrage mit Bedingungen aufgebaut
+        self._next_song_id = 0
+        self.last_search_probes = None  #Anzahl der verglichenen Positionen der letzten Suche
+        self.journal = SongJournal(self.JOURNAL_FILENAME)
+        self.instrumentation = Instrumentation(Instrumentation.MEMORY if measure_memory else Instrumentation.TIMING)
+        with self.instrumentation.track('load'):
+            self.load_songs()
 
     def load_songs(self):
-        if os.path.exists(self.FILENAME):
-            with open(self.FILENAME, 'r') as file:
-                for line in file:
-                    title, artist, album, genre = line.strip().split(',')
-                    song = Song(title, artist, album, genre)
-                    self.songs.append(song)
-                    self.rbt.insert(song)
-            self.sorted_songs_by_title = sorted(self.songs, key=lambda song: song.title)
-            self.sorted_songs_by_artist = sorted(self.songs, key=lambda song: song.artist)
-            self.sorted_songs_by_genre = sorted(self.songs, key=lambda song: song.genre)
-            print(f"{len(self.songs)} Songs aus {self.FILENAME} geladen.")
-            # Überprüfe die ersten paar Songs in jeder Liste
-            print("Erste paar Songs nach Titel sortiert:", [song.title for song in self.sorted_songs_by_title[:5]])
-            print("Erste paar Songs nach Künstler sortiert:", [song.artist for song in self.sorted_songs_by_artist[:5]])
-            print("Erste paar Songs nach Genre sortiert:", [song.genre for song in self.sorted_songs_by_genre[:5]])
+        #Lädt den binären Snapshot (oder beim ersten Start die CSV-Datei) und wendet das Änderungsprotokoll an;
+        #die Indizes werden erst bei der ersten Abfrage aufgebaut
+        binary_exists = snapshot_exists(self.BINARY_FILENAME)
+        csv_exists = not binary_exists and os.path.exists(self.FILENAME)
+        source = self.BINARY_FILENAME if binary_exists else self.FILENAME
+        #Beim Laden entstehen nur neue, langlebige Objekte; die GC-Läufe würden nichts finden,
+        #aber bei jedem Durchlauf den wachsenden Bestand erneut durchsuchen
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if binary_exists:
+                #Die Songs sind nur Zeilennummern, ihre Felder werden erst beim Zugriff dekodiert
+                self.snapshot = MappedSongStore(self.BINARY_FILENAME)
+                self.songs = self.snapshot.views()
+                self._snapshot_intact = True
+                self._next_song_id = self.snapshot.next_song_id
+            elif csv_exists:
+                start_time = time.perf_counter()
+                for batch in read_song_batches(self.FILENAME):
+                    self.songs.extend([self.new_song(*row) for row in batch])
+                    rate = len(self.songs) / max(time.perf_counter() - start_time, 1e-9)
+                    print(f"\r{len(self.songs)} Zeilen geladen ({rate:.0f} Zeilen/s)", end='', flush=True)
+                print()
+            #Vor dem Protokoll, damit dessen Playlist-Änderungen auf den gespeicherten Stand folgen
+            playlist_count = self.load_playlists()
+            replayed = self.replay_journal()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        if binary_exists or csv_exists or replayed:
+            print(f"{len(self.songs)} Songs aus {source} geladen ({replayed} Änderungen aus {self.JOURNAL_FILENAME}).")
+            if playlist_count:
+                print(f"{playlist_count} Playlists aus {self.PLAYLIST_DIRECTORY} geladen.")
+            print("Die Suchindizes werden bei der ersten Abfrage aufgebaut.")
         else:
             print("Keine Songs gefunden. Starte mit einer leeren Musikbibliothek.")
 
 
+    def load_playlists(self):
+        """
+        Lädt die gespeicherten Playlists und löst ihre Song-Nummern gesammelt auf.
+
+        Die Nummern aller Playlists werden in einem einzigen Durchlauf über die Bibliothek
+        aufgelöst, statt für jede Playlist oder jeden Eintrag einzeln zu suchen. Ein Song in
+        vielen Playlists ist danach in allen dasselbe Objekt.
+
+        Returns:
+            int: Die Anzahl der geladenen Playlists.
+        """
+        stored = read_playlists(self.PLAYLIST_DIRECTORY)
+        if not stored:
+            return 0
+        songs_by_id = self._songs_for_ids(chain.from_iterable(data['song_ids'] for data in stored))
+        for data in stored:
+            playlist = Playlist.from_dict(data, songs_by_id)
+            self.playlists[playlist.name] = playlist
+            for song in playlist.songs:
+                self._playlists_by_song.setdefault(song.song_id, []).append(playlist)
+        return len(stored)
+
+    def _songs_for_ids(self, song_ids):
+        #Löst viele Song-Nummern in einem Durchlauf über die Bibliothek auf; solange die Songs
+        #in der Reihenfolge des Snapshots stehen, werden dafür nur dessen Nummern gelesen
+        wanted = set(song_ids)
+        if self._songs_by_id is not None:
+            return {song_id: self._songs_by_id[song_id] for song_id in wanted if song_id in self._songs_by_id}
+        if self._snapshot_intact:
+            songs = self.songs
+            return {song_id: songs[row] for row, song_id in enumerate(self.snapshot.ids) if song_id in wanted}
+        return {song.song_id: song for song in self.songs if song.song_id in wanted}
+
+    def new_song(self, title, artist, album, genre):
+        """
+        Erzeugt einen Song mit der nächsten freien Song-Nummer, als eigenständiges Objekt oder als Zeile im SongStore.
+
+        Args:
+            title (str): Der Titel des Songs.
+            artist (str): Der Künstler des Songs.
+            album (str): Das Album, zu dem der Song gehört.
+            genre (str): Das Genre des Songs.
+
+        Returns:
+            Song: Der neue Song bzw. eine SongView mit derselben Schnittstelle.
+        """
+        song_id = self._next_song_id
+        self._next_song_id += 1
+        if self.song_store is not None:
+            return self.song_store.append(title, artist, album, genre, song_id)
+        return Song(title, artist, album, genre, song_id)
+
+    def replay_journal(self):
+        """
+        Wendet die Einträge des Änderungsprotokolls auf die geladenen Songs und Playlists an.
+
+        Hinzugefügte Songs, deren Nummer unter der nächsten freien Nummer des geladenen Snapshots
+        liegt, sind bereits darin enthalten (z.B. wenn save_data vor dem Leeren des Protokolls
+        abbrach) und werden übersprungen, statt sie ein zweites Mal hinzuzufügen.
+
+        Returns:
+            int: Die Anzahl der angewendeten Einträge.
+        """
+        count = 0
+        saved_ids = self._next_song_id  #Alle kleineren Nummern hat der Snapshot bereits vergeben
+        for operation, fields in self.journal.replay():
+            count += 1
+            if operation == SongJournal.ADD:
+                song_id = int(fields[0])
+                if song_id < saved_ids:
+                    continue
+                self._next_song_id = song_id  #new_song vergibt dieselbe Nummer wie beim Protokollieren
+                self._add_to_library([self.new_song(*fields[1:])])
+            elif operation == SongJournal.ADD_WITHOUT_ID:
+                self._add_to_library([self.new_song(*fields)])
+            elif operation == SongJournal.DELETE:
+                song = self.songs_by_id.get(int(fields[0]))
+                if song is None:
+                    continue
+                self._remove_from_library(song)
+            elif operation == SongJournal.DELETE_TITLE:
+                song = self.songs_by_title.get(fields[0])  #Der Titelindex wird erst hier bei Bedarf aufgebaut
+                if song is None:
+                    continue
+                self._remove_from_library(song)
+            elif operation == SongJournal.PLAYLIST_CREATE:
+                if fields[0] not in self.playlists:
+                    self.playlists[fields[0]] = Playlist(fields[0])
+                    self._dirty_playlists.add(fields[0])
+            elif operation in (SongJournal.PLAYLIST_ADD, SongJournal.PLAYLIST_REMOVE):
+                playlist = self.playlists.get(fields[0])
+                song = self.songs_by_id.get(int(fields[1]))
+                if playlist is None or song is None:
+                    continue
+                if operation == SongJournal.PLAYLIST_ADD:
+                    self._link_playlist_song(playlist, song)
+                else:
+                    self._unlink_playlist_song(playlist, song)
+            elif operation == SongJournal.PLAYLIST_ADD_TITLE:
+                playlist = self.playlists.get(fields[0])
+                song = self.songs_by_title.get(fields[1])
+                if playlist is not None and song is not None:
+                    self._link_playlist_song(playlist, song)
+            elif operation == SongJournal.PLAYLIST_REMOVE_TITLE:
+                playlist = self.playlists.get(fields[0])
+                if playlist is not None:
+                    for song in self.songs_by_title.get_all(fields[1]):
+                        self._unlink_playlist_song(playlist, song)
+        return count
+
+    def log_change(self, operation, *fields):
+        """
+        Hängt eine Änderung an das Protokoll an und kompaktiert bei Erreichen des Schwellwerts.
+
+        Args:
+            operation (str): Die Art der Änderung (z.B. SongJournal.ADD).
+            *fields: Die Daten der Änderung.
+
+        Returns:
+            None
+        """
+        try:
+            self.journal.append(operation, *fields)
+        except Exception as e:
+            print(f"Fehler beim Schreiben des Änderungsprotokolls: {e}")
+            return
+        if self.journal.needs_compaction():
+            self.save_data()
+
     def save_data(self):
+        """
+        Schreibt einen vollständigen Snapshot aller Songs und kompaktiert das Änderungsprotokoll.
+
+        Die Songänderungen sind danach im Snapshot enthalten, die Playlist-Änderungen in den
+        Dateien der geänderten Playlists; das Protokoll wird geleert.
+
+        Returns:
+            None
+        """
         print("save_data wurde aufgerufen.")  # Debug-Ausgabe
         # Ausgabe der Songs vor dem Speichern zur Überprüfung (zum Debuggen genutzt)
         #print("Songs vor dem Speichern:")
         #for song in self.songs:
         #    print(f"{song.title} - {song.artist} - {song.album} - {song.genre}")
 
-        # Speichert alle Songs in einer Datei
-        try:
-            with open(self.FILENAME, 'w') as file:
-                for song in self.songs:
-                    file.write(f"{song.title},{song.artist},{song.album},{song.genre}\n")
-            print(f"{len(self.songs)} Songs in {self.FILENAME} gespeichert.")
-        except Exception as e:
-            print(f"Fehler beim Speichern der Datei: {e}")
+        # Speichert alle Songs im binären Snapshot, die Sortierreihenfolgen der Indizes werden mitgespeichert
+        with self.instrumentation.track('save'):
+            try:
+                #Nur bereits aufgebaute Indizes liefern ihre Reihenfolge, die übrigen sortiert write_snapshot selbst
+                rows = {id(song): row for row, song in enumerate(self.songs)}
+                permutations = {index.attribute: list(map(rows.__getitem__, map(id, index))) for index in self._built_sorted_indexes()}
+                if write_snapshot(self.BINARY_FILENAME, self.songs, permutations, self._next_song_id):
+                    print(f"{len(self.songs)} Songs in {self.BINARY_FILENAME} gespeichert.")
+                else:
+                    print(f"{len(self.songs)} Songs gespeichert, {self.BINARY_FILENAME} wird beim nächsten Start ersetzt.")
+            except Exception as e:
+                print(f"Fehler beim Speichern der Datei: {e}")
+                return
+
+            try:
+                count = self.save_playlists()
+                if count:
+                    print(f"{count} geänderte Playlists in {self.PLAYLIST_DIRECTORY} gespeichert.")
+            except Exception as e:
+                print(f"Fehler beim Speichern der Playlists: {e}")
+                return  #Das Protokoll enthält die Playlist-Änderungen weiterhin
+
+            try:
+                self.journal.reset()
+            except Exception as e:
+                print(f"Fehler beim Kompaktieren des Änderungsprotokolls: {e}")
 
         # Überprüfe die Datei nach dem Speichern (zum Debuggen genutzt)
         #self.verify_saved_data() 
 
+    def save_playlists(self):
+        """
+        Schreibt die seit dem letzten Speichern geänderten Playlists, unveränderte bleiben unberührt.
+
+        Returns:
+            int: Die Anzahl der geschriebenen Playlists.
+        """
+        count = 0
+        for name in sorted(self._dirty_playlists):
+            playlist = self.playlists.get(name)
+            if playlist is not None:
+                write_playlist(self.PLAYLIST_DIRECTORY, playlist)
+                count += 1
+        self._dirty_playlists.clear()
+        return count
+
     def verify_saved_data(self):
         # Funktion zum Debuggen, überprüft, wie die Songs nach dem Speichern geordnet sind
         try:
-            with open(self.FILENAME, 'r') as file:
-                lines = file.readlines()
-                print("Gespeicherte Songs:")
-                for line in lines:
-                    print(line.strip())
+            snapshot = MappedSongStore(self.BINARY_FILENAME)
+            print("Gespeicherte Songs:")
+            for song in snapshot.views():
+                print(f"{song.title},{song.artist},{song.album},{song.genre}")
+        except Exception as e:
+            print(f"Fehler beim Lesen der Datei: {e}")
+
+    def export_csv(self, filename=None):
+        """
+        Exportiert alle Songs als CSV-Datei.
+
+        Args:
+            filename (str): Der Pfad der CSV-Datei, Standard ist FILENAME.
+
+        Returns:
+            None
+        """
+        filename = filename or self.FILENAME
+        try:
+            count = write_songs(filename, self.songs)
+            print(f"{count} Songs nach {filename} exportiert.")
+        except Exception as e:
+            print(f"Fehler beim Exportieren der Datei: {e}")
+
+    def import_csv(self, filename=None):
+        """
+        Importiert die Songs einer CSV-Datei zusätzlich zu den vorhandenen Songs.
+
+        Args:
+            filename (str): Der Pfad der CSV-Datei, Standard ist FILENAME.
+
+        Returns:
+            None
+        """
+        filename = filename or self.FILENAME
+        try:
+            new_songs = [self.new_song(*row) for batch in read_song_batches(filename) for row in batch]
         except Exception as e:
             print(f"Fehler beim Lesen der Datei: {e}")
+            return
+        self.add_songs(new_songs)
+        print(f"{len(new_songs)} Songs aus {filename} importiert.")
 
 
     def add_song(self, title, artist, album, genre):
-        #Fügt einen neuen Song zur Bibliothek hinzu und speichert die Daten
-        song = Song(title, artist, album, genre)
-        self.songs.append(song)
-        self.sorted_songs_by_title = sorted(self.songs, key=lambda song: song.title)
-        self.sorted_songs_by_artist = sorted(self.songs, key=lambda song: song.artist)
-        self.sorted_songs_by_genre = sorted(self.songs, key=lambda song: song.genre)
-        self.rbt.insert(song)  #Fügt den Song in den Rot-Schwarz-Baum ein
-        self.save_data()  #Speichert die Daten nach dem Hinzufügen eines Songs
+        #Fügt einen neuen Song zur Bibliothek hinzu, speichert die Daten und gibt den Song zurück
+        with self.instrumentation.track('insert'):
+            song = self.new_song(title, artist, album, genre)
+            self._add_to_library([song])
+        self.log_change(SongJournal.ADD, song.song_id, title, artist, album, genre)  #Protokolliert die Änderung statt alles neu zu schreiben
         print(f"'{song}' zur Musikbibliothek hinzugefügt.")
+        return song
 
     def delete_song(self, title):
-        #Löscht einen Song aus der Bibliothek und speichert die Daten
-        song_to_delete = next((s for s in self.songs if s.title == title), None)
-        if song_to_delete:
-            self.songs.remove(song_to_delete)
-            self.rbt.delete(song_to_delete)  #Löscht den Song aus dem Rot-Schwarz-Baum
-            for playlist in self.playlists:
-                playlist.remove_song(title)  #Entfernt den Song aus allen Playlists
-            self.save_data()  #Speichert die Daten nach dem Löschen eines Songs
+        #Löscht einen Song aus der Bibliothek, speichert die Daten und gibt den gelöschten Song (oder None) zurück
+        song_to_delete = self.songs_by_title.get(title)  #Hash-Index statt Durchlauf durch alle Songs
+        if song_to_delete is not None:
+            with self.instrumentation.track('delete'):
+                self._remove_from_library(song_to_delete)  #Entfernt den Song auch aus seinen Playlists
+            self.log_change(SongJournal.DELETE, song_to_delete.song_id)  #Protokolliert die Änderung statt alles neu zu schreiben
             print(f"'{song_to_delete}' aus der Musikbibliothek entfernt.")
         else:
             print(f"'{title}' nicht in der Musikbibliothek gefunden.")
+        return song_to_delete
 
-    def display_all_songs(self):
-        #Zeigt alle Songs in der Bibliothek an
-        if not self.songs:
-            print("Keine Songs verfügbar.")
+    def _add_to_library(self, new_songs):
+        """
+        Hängt Songs an die Bibliothek an und führt alle bereits aufgebauten Indizes nach.
+
+        Noch nicht aufgebaute Indizes enthalten die Songs bei ihrem Aufbau.
+
+        Args:
+            new_songs (list): Die neuen Songs.
+
+        Returns:
+            None
+        """
+        start = len(self.songs)
+        self.songs.extend(new_songs)
+        positions = self._positions
+        if positions is not None:
+            if len(positions) < self._next_song_id:
+                positions.extend(repeat(-1, self._next_song_id - len(positions)))
+            for position, song in enumerate(new_songs, start):
+                positions[song.song_id] = position
+        if self._songs_by_title is not None:
+            self._songs_by_title.update(new_songs)
+        if self._songs_by_id is not None:
+            self._songs_by_id.update((song.song_id, song) for song in new_songs)
+        if len(new_songs) == 1:
+            for index in self._built_sorted_indexes():
+                index.insert(new_songs[0])  #O(log n) statt erneutem Sortieren der ganzen Bibliothek
+            if self._rbt is not None:
+                self._rbt.insert(new_songs[0])  #Fügt den Song in den Rot-Schwarz-Baum ein
         else:
-            for song in self.songs:
-                print(song)
+            # Sortierte Indizes einmalig mit allen neuen Songs aktualisieren
+            for index in self._built_sorted_indexes():
+                index.update(new_songs)
+            if self._rbt is not None:
+                self._rbt.bulk_insert(new_songs)  #Fügt die Songs gesammelt in den Rot-Schwarz-Baum ein
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.update(new_songs)
+        if self._query_engine is not None:
+            self._query_engine.update(new_songs)
+        self._numpy_index = None
+
+    def _remove_from_library(self, song):
+        """
+        Entfernt einen Song in O(1) aus self.songs und aus allen bereits aufgebauten Indizes.
+
+        Der letzte Song der Liste rückt an die frei gewordene Position, statt alle folgenden
+        Songs zu verschieben; die Reihenfolge von self.songs ändert sich dadurch. Aus Playlists
+        wird der Song über den Rückwärtsindex entfernt.
 
-    def measure_memory_and_time(self, method, *args):
+        Args:
+            song (Song): Der zu entfernende Song, er muss in der Bibliothek sein.
+
+        Returns:
+            None
+        """
+        position = self._song_position(song)
+        last = self.songs.pop()
+        if last is not song:
+            self.songs[position] = last
+            self._positions[last.song_id] = position
+        self._positions[song.song_id] = -1
+        self._snapshot_intact = False  #Die Positionen der Snapshot-Songs haben sich verschoben
+        #Nur die Playlists, die den Song enthalten, statt alle Playlists zu durchlaufen
+        for playlist in self._playlists_by_song.pop(song.song_id, ()):
+            playlist.remove_song(song)
+            self._dirty_playlists.add(playlist.name)
+        if self._songs_by_title is not None:
+            self._songs_by_title.remove(song)
+        if self._songs_by_id is not None:
+            del self._songs_by_id[song.song_id]
+        for index in self._built_sorted_indexes():
+            index.remove(song)
+        if self._rbt is not None:
+            self._rbt.delete(song)  #Löscht den Song aus dem Rot-Schwarz-Baum
+        if self._fuzzy_index is not None:
+            self._fuzzy_index.remove(song)
+        if self._query_engine is not None:
+            self._query_engine.remove(song)
+        self._numpy_index = None
+
+    def _song_position(self, song):
+        #Position eines Songs in self.songs; die Zuordnung wird beim ersten Aufruf und nach einem
+        #Umsortieren von self.songs (z.B. durch die Sortierverfahren) einmalig neu aufgebaut
+        positions = self._positions
+        songs = self.songs
+        if positions is not None and song.song_id < len(positions):
+            position = positions[song.song_id]
+            if 0 <= position < len(songs) and songs[position] is song:
+                return position
+        self._positions = positions = array('q', [-1]) * self._next_song_id
+        for position, other in enumerate(songs):
+            positions[other.song_id] = position
+        return positions[song.song_id]
+
+    def sorted_index(self, field):
         """
-        Misst die Ausführungszeit und den Speicherverbrauch einer Methode.
+        Gibt den sortierten Index für ein Feld zurück und baut ihn bei der ersten Abfrage auf.
+
+        Solange die geladenen Songs noch in der Reihenfolge des binären Snapshots stehen, wird die
+        dort gespeicherte Sortierpermutation übernommen, statt neu zu sortieren.
 
         Args:
-            method (function): Die auszuführende Methode.
-            *args: Argumente, die an die Methode übergeben werden.
+            field (str): Das Feld ('title', 'artist' oder 'genre').
 
         Returns:
-            tuple: Ein Tuple bestehend aus dem Ergebnis der Methode, der benötigten Zeit und dem verwendeten Speicher.
+            SortedIndex: Der Index über alle Songs.
+        """
+        index = self._sorted_indexes_by_field[field]
+        if index is None:
+            with self.instrumentation.track(f'build/{field}_index') as measurement:
+                index = SortedIndex(field)
+                if self._snapshot_intact:
+                    songs = self.songs
+                    index.set_sorted([songs[row] for row in self.snapshot.permutations[field]],
+                                     self.snapshot.sorted_keys(field))
+                    for song in songs[len(self.snapshot):]:
+                        index.insert(song)  #Seit dem Snapshot hinzugefügte Songs
+                else:
+                    index.update(self.songs)
+            self._sorted_indexes_by_field[field] = index
+            print(f"Sortierter Index nach '{field}' aufgebaut in {measurement.elapsed:.6f} Sekunden.")
+        return index
+
+    @property
+    def sorted_songs_by_title(self):
+        return self.sorted_index('title')
+
+    @property
+    def sorted_songs_by_artist(self):
+        return self.sorted_index('artist')
+
+    @property
+    def sorted_songs_by_genre(self):
+        return self.sorted_index('genre')
+
+    @property
+    def rbt(self):
+        #Der Rot-Schwarz-Baum wird bei der ersten Abfrage linear aus dem Titelindex aufgebaut
+        if self._rbt is None:
+            with self.instrumentation.track('build/rbt') as measurement:
+                self._rbt = self.tree_class.from_sorted(list(self.sorted_songs_by_title))
+            print(f"Rot-Schwarz-Baum aufgebaut in {measurement.elapsed:.6f} Sekunden.")
+        return self._rbt
+
+    @property
+    def songs_by_title(self):
+        #Hash-Index Titel -> Song, wird beim ersten Nachschlagen eines Titels aufgebaut
+        if self._songs_by_title is None:
+            with self.instrumentation.track('build/songs_by_title'):
+                self._songs_by_title = TitleIndex(self.songs)
+        return self._songs_by_title
+
+    @property
+    def songs_by_id(self):
+        #Zuordnung Song-Nummer -> Song, wird bei der ersten Abfrage aufgebaut
+        if self._songs_by_id is None:
+            with self.instrumentation.track('build/songs_by_id'):
+                self._songs_by_id = {song.song_id: song for song in self.songs}
+        return self._songs_by_id
+
+    def built_indexes(self):
+        #Gibt die Namen der bereits aufgebauten Indizes zurück
+        names = [field for field, index in self._sorted_indexes_by_field.items() if index is not None]
+        if self._rbt is not None:
+            names.append('rbt')
+        if self._songs_by_title is not None:
+            names.append('songs_by_title')
+        if self._songs_by_id is not None:
+            names.append('songs_by_id')
+        if self._fuzzy_index is not None:
+            names.append('fuzzy')
+        if self._query_engine is not None:
+            names.append('query')
+        if self._numpy_index is not None:
+            names.append('numpy')
+        return names
+
+    def _sorted_indexes(self):
+        #Gibt die sortierten Indizes für Titel, Künstler und Genre zurück (baut fehlende auf)
+        return tuple(self.sorted_index(field) for field in self.INDEX_FIELDS)
+
+    def _built_sorted_indexes(self):
+        #Gibt nur die bereits aufgebauten sortierten Indizes zurück
+        return tuple(index for index in self._sorted_indexes_by_field.values() if index is not None)
+
+    def _sorted_songs(self, criteria):
         """
-        # Starten der Speicherverfolgung
-        tracemalloc.start()
+        Gibt den sortierten Index für ein Suchkriterium zurück.
 
-        # Messen der Speicherkapazität vor der Suche
-        initial_snapshot = tracemalloc.take_snapshot()
+        Args:
+            criteria (str): Das Suchkriterium ('title', 'artist' oder 'genre').
 
-        # Startzeit messen
-        start_time = time.time()
+        Returns:
+            SortedIndex: Der passende Index oder None bei einem unbekannten Kriterium.
+        """
+        if criteria in self._sorted_indexes_by_field:
+            return self.sorted_index(criteria)
+        return None
 
-        # Ausführen der Suchmethode
-        result = method(*args)
-        
-        # Endzeit messen
-        end_time = time.time()
+    def display_all_songs(self, page=None):
+        """
+        Zeigt alle Songs oder eine Seite der nach Titel sortierten Bibliothek an.
 
-        # Messen der Speicherkapazität nach der Suche
-        final_snapshot = tracemalloc.take_snapshot()
+        Args:
+            page (int): Die anzuzeigende Seite (beginnend bei 1) oder None für alle Songs.
 
-        # Benötigte Zeit berechnen
-        elapsed_time = end_time - start_time
+        Returns:
+            None
+        """
+        if not self.songs:
+            print("Keine Songs verfügbar.")
+        elif page is None:
+            for song in self.songs:
+                print(song)
+        else:
+            page_count = (len(self.songs) + self.PAGE_SIZE - 1) // self.PAGE_SIZE
+            for song in self.rbt.page((page - 1) * self.PAGE_SIZE, self.PAGE_SIZE):
+                print(song)
+            print(f"Seite {page} von {page_count}.")
 
-        # Verwendete Speicherkapazität berechnen
-        stats = final_snapshot.compare_to(initial_snapshot, 'lineno')
-        used_memory = sum(stat.size_diff for stat in stats)
+    def measure_memory_and_time(self, method, *args, operation='search'):
+        """
+        Misst die Ausführungszeit und (im Speichermodus) den Speicherverbrauch einer Methode.
 
-        # Speicherverfolgung stoppen
-        tracemalloc.stop()
+        Die Messung läuft über das Instrumentation-Register der App und wird dort unter
+        der angegebenen Operation im Latenz-Histogramm eingetragen.
 
-        return result, elapsed_time, used_memory
-    
-    
+        Args:
+            method (function): Die auszuführende Methode.
+            *args: Argumente, die an die Methode übergeben werden.
+            operation (str): Der Name der Operation im Register (z.B. 'search/Binärsuche').
+
+        Returns:
+            tuple: Ein Tuple bestehend aus dem Ergebnis der Methode, der benötigten Zeit und dem verwendeten Speicher (None im Zeitmodus).
+        """
+        result, measurement = self.instrumentation.measure(operation, method, *args)
+        return result, measurement.elapsed, measurement.memory
+
+    def describe_measurement(self, elapsed_time, used_memory):
+        #Formatiert Zeit und Speicher wie in den bisherigen Ausgaben, ohne Speicherangabe im Zeitmodus
+        text = f"Benötigte Zeit: {elapsed_time:.6f} Sekunden."
+        if used_memory is not None:
+            text += f" Verwendete Speicherkapazität: {used_memory} Bytes."
+        return text
 
     def search_song(self):
         """
         Sucht nach einem Song basierend auf einem Kriterium und einer Suchmethode.
 
         Fragt den Benutzer nach dem Suchkriterium (Titel, Künstler oder Genre) und der Suchmethode
-        (Lineare Suche, Binärsuche, Jump-Suche, Interpolationssuche, Breitensuche, Tiefensuche oder alle).
-        Führt die ausgewählte Suchmethode aus und gibt die Ergebnisse aus.
+        (Lineare Suche, Binärsuche, Jump-Suche, Interpolationssuche, Breitensuche, Tiefensuche,
+        Präfixsuche, unscharfe Suche oder alle). Führt die ausgewählte Suchmethode aus und gibt die Ergebnisse aus.
 
         Returns:
             None
@@ -172,7 +641,36 @@ class MusicApp:
             return
 
         value = input(f"Gib {criteria} ein: ").strip()
-        search_method_input = input("Wähle Suchmethode - (L)ineare Suche, (Bi)närsuche, (J)ump-Suche, (I)nterpolationssuche, (Br)eitensuche, (T)iefensuche oder (A)lle: ").strip().lower()
+        numpy_option = "(N)umPy-Suche, " if NUMPY_AVAILABLE else ""
+        search_method_input = input(f"Wähle Suchmethode - (L)ineare Suche, (Bi)närsuche, (J)ump-Suche, (I)nterpolationssuche, (Br)eitensuche, (T)iefensuche, {numpy_option}(P)räfixsuche, (U)nscharfe Suche oder (A)lle: ").strip().lower()
+
+        if search_method_input == 'u':
+            #Sucht unabhängig vom Kriterium in Titel, Künstler und Album
+            self.fuzzy_index()  #Index vor der Zeitmessung aufbauen, gemessen wird nur die Suche
+            results, elapsed_time, used_memory = self.measure_memory_and_time(
+                self.fuzzy_search, value, self.PREFIX_LIMIT, operation='search/Unscharfe Suche')
+            if results:
+                print(f"Ähnlichste Songs zu '{value}' (Titel, Künstler oder Album):")
+                for song, score in results:
+                    print(f"  - {song} (Ähnlichkeit {score:.2f})")
+            else:
+                print(f"Kein ähnlicher Song zu '{value}' gefunden.")
+            print(self.describe_measurement(elapsed_time, used_memory))
+            return
+
+        if search_method_input == 'p':
+            #Liefert mehrere Vorschläge statt eines Treffers und ist daher nicht Teil des Vergleichs
+            self.sorted_index(criteria)  #Index vor der Zeitmessung aufbauen, gemessen wird nur die Suche
+            results, elapsed_time, used_memory = self.measure_memory_and_time(
+                self.prefix_search, value, criteria, self.PREFIX_LIMIT, operation='search/Präfixsuche')
+            if results:
+                print(f"{len(results)} Songs beginnen mit '{value}':")
+                for song in results:
+                    print(f"  - {song}")
+            else:
+                print(f"Kein Song beginnt mit '{value}'.")
+            print(self.describe_measurement(elapsed_time, used_memory))
+            return
 
         search_methods_map = {
             'l': ('Lineare Suche', self.linear_search),
@@ -182,30 +680,39 @@ class MusicApp:
             'br': ('Breitensuche', lambda v, c: self.rbt.bfs_search(v, c)),
             't': ('Tiefensuche', lambda v, c: self.rbt.dfs_search(self.rbt.root, v, c))
         }
+        if search_method_input in ('i', 'a'):
+            self._interpolation_index(criteria)  #Zahlenwerte vor der Zeitmessung berechnen
+        if NUMPY_AVAILABLE:
+            search_methods_map['n'] = ('NumPy-Suche', self.numpy_search)
+            if search_method_input in ('n', 'a'):
+                self.numpy_index()  #Index vor der Zeitmessung aufbauen, gemessen wird nur die Suche
 
         if search_method_input == 'a':
             results = []
             for method_key, (method_name, method) in search_methods_map.items():
                 print(f"{method_name} wird ausgeführt...")  # Anzeige, dass der Algorithmus läuft
-                result, elapsed_time, used_memory = self.measure_memory_and_time(method, value, criteria)
+                result, elapsed_time, used_memory = self.measure_memory_and_time(method, value, criteria, operation=f'search/{method_name}')
                 results.append((method_name, result, elapsed_time, used_memory))
-                print(f"{method_name}: '{result}' in der Musikbibliothek gefunden. Benötigte Zeit: {elapsed_time:.6f} Sekunden. Verwendete Speicherkapazität: {used_memory} Bytes.")
+                print(f"{method_name}: '{result}' in der Musikbibliothek gefunden. {self.describe_measurement(elapsed_time, used_memory)}")
 
             # Übersicht über alle Suchalgorithmen
             print("\nÜbersicht über alle Suchalgorithmen:")
             for method_name, result, elapsed_time, used_memory in results:
-                print(f"{method_name}: Benötigte Zeit: {elapsed_time:.6f} Sekunden. Verwendete Speicherkapazität: {used_memory} Bytes.")
+                print(f"{method_name}: {self.describe_measurement(elapsed_time, used_memory)}")
 
         elif search_method_input in search_methods_map:
             method_name, method = search_methods_map[search_method_input]
             print(f"{method_name} wird ausgeführt...")  # Anzeige, dass der Algorithmus läuft
-            result, elapsed_time, used_memory = self.measure_memory_and_time(method, value, criteria)
+            self.last_search_probes = None  #Nur Verfahren über Listen und Indizes zählen ihre Proben
+            result, elapsed_time, used_memory = self.measure_memory_and_time(method, value, criteria, operation=f'search/{method_name}')
             if result:
                 print(f"'{result}' in der Musikbibliothek gefunden.")
             else:
                 print(f"'{value}' nicht in der Musikbibliothek gefunden.")
+            if self.last_search_probes is not None:
+                print(f"Geprüfte Positionen: {self.last_search_probes}")
 
-            print(f"Benötigte Zeit: {elapsed_time:.6f} Sekunden. Verwendete Speicherkapazität: {used_memory} Bytes.")
+            print(self.describe_measurement(elapsed_time, used_memory))
     
    
 
@@ -221,10 +728,15 @@ class MusicApp:
         Returns:
             Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
         """
+        song, self.last_search_probes = self._linear_search(value, criteria)
+        return song
+
+    def _linear_search(self, value, criteria):
+        #Lineare Suche, gibt den Song (oder None) und die Anzahl der geprüften Positionen zurück
         for index, song in enumerate(self.songs):
             if getattr(song, criteria) == value:
-                return song
-        return None
+                return song, index + 1
+        return None, len(self.songs)
     
     def binary_search(self, value, criteria):
         """
@@ -237,14 +749,15 @@ class MusicApp:
         Returns:
             Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
         """
-        if criteria == 'title':
-            sorted_songs = self.sorted_songs_by_title
-        elif criteria == 'artist':
-            sorted_songs = self.sorted_songs_by_artist
-        elif criteria == 'genre':
-            sorted_songs = self.sorted_songs_by_genre
-        else:
-            return None
+        song, self.last_search_probes = self._binary_search(value, criteria)
+        return song
+
+    def _binary_search(self, value, criteria):
+        #Binärsuche, gibt den Song (oder None) und die Anzahl der geprüften Positionen zurück
+        sorted_songs = self._sorted_songs(criteria)
+        probes = 0
+        if sorted_songs is None:
+            return None, probes
 
         low = 0
         high = len(sorted_songs) - 1
@@ -252,15 +765,16 @@ class MusicApp:
         while low <= high:
             mid = (low + high) // 2
             mid_value = getattr(sorted_songs[mid], criteria)
+            probes += 1
 
             if mid_value == value:
-                return sorted_songs[mid]
+                return sorted_songs[mid], probes
             elif mid_value < value:
                 low = mid + 1
             else:
                 high = mid - 1
 
-        return None
+        return None, probes
 
 
     
@@ -275,14 +789,15 @@ class MusicApp:
         Returns:
             Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
         """
-        if criteria == 'title':
-            sorted_songs = self.sorted_songs_by_title
-        elif criteria == 'artist':
-            sorted_songs = self.sorted_songs_by_artist
-        elif criteria == 'genre':
-            sorted_songs = self.sorted_songs_by_genre
-        else:
-            return None
+        song, self.last_search_probes = self._jump_search(value, criteria)
+        return song
+
+    def _jump_search(self, value, criteria):
+        #Jump-Suche, gibt den Song (oder None) und die Anzahl der geprüften Positionen zurück
+        sorted_songs = self._sorted_songs(criteria)
+        probes = 0
+        if sorted_songs is None:
+            return None, probes
 
         n = len(sorted_songs)
         step = int(n ** 0.5)  # Die Blockgröße für den Jump Search
@@ -290,23 +805,28 @@ class MusicApp:
 
         # Springe durch die Liste in Schritten von 'step'
         while prev < n and getattr(sorted_songs[min(step, n) - 1], criteria) < value:
+            probes += 1
             prev = step
             step += int(n ** 0.5)
             if prev >= n:
-                return None
+                return None, probes
 
         # Lineare Suche innerhalb des Blocks
         for i in range(prev, min(step, n)):
+            probes += 1
             if getattr(sorted_songs[i], criteria) == value:
-                return sorted_songs[i]
+                return sorted_songs[i], probes
 
-        return None
+        return None, probes
 
 
     def interpolation_search(self, value, criteria):
         """
         Führt eine Interpolationssuche nach einem Song-Objekt in der sortierten Liste basierend auf einem Kriterium durch.
 
+        Die Schlüssel des sortierten Index werden dafür einmalig als Zahlen kodiert (siehe
+        SortedIndex.interpolation_search); die Anzahl der Proben steht danach in last_search_probes.
+
         Args:
             value (str): Der Wert des Suchkriteriums.
             criteria (str): Das Suchkriterium (z.B. 'title', 'artist', 'genre').
@@ -314,31 +834,180 @@ class MusicApp:
         Returns:
             Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
         """
-        if criteria == 'title':
-            sorted_songs = self.sorted_songs_by_title
-        elif criteria == 'artist':
-            sorted_songs = self.sorted_songs_by_artist
-        elif criteria == 'genre':
-            sorted_songs = self.sorted_songs_by_genre
-        else:
-            return None
+        song, self.last_search_probes = self._interpolation_search(value, criteria)
+        return song
 
-        low = 0
-        high = len(sorted_songs) - 1
+    def _interpolation_search(self, value, criteria):
+        #Interpolationssuche, gibt den Song (oder None) und die Anzahl der Proben zurück
+        sorted_songs = self._interpolation_index(criteria)
+        if sorted_songs is None:
+            return None, 0
+        return sorted_songs.interpolation_search(value)
 
-        while low <= high:
-            mid = low + (high - low) // 2
-            mid_value = getattr(sorted_songs[mid], criteria)
+    def counted_search(self, method, value, criteria):
+        """
+        Sucht mit einem der Suchverfahren und gibt die Anzahl der geprüften Positionen mit zurück.
 
-            if mid_value == value:
-                return sorted_songs[mid]
-            elif mid_value < value:
-                low = mid + 1
-            else:
-                high = mid - 1
+        Anders als die einzelnen Suchmethoden wird last_search_probes nicht gesetzt, sodass
+        gleichzeitige Suchen (z.B. im Server) sich ihre Zählung nicht gegenseitig überschreiben.
 
-        return None
+        Args:
+            method (str): Das Suchverfahren ('linear', 'binary', 'jump' oder 'interpolation').
+            value (str): Der Wert des Suchkriteriums.
+            criteria (str): Das Suchkriterium (z.B. 'title', 'artist', 'genre').
+
+        Returns:
+            tuple: Der gefundene Song (oder None) und die Anzahl der geprüften Positionen.
+        """
+        return getattr(self, f'_{method}_search')(value, criteria)
+
+    def _interpolation_index(self, criteria):
+        #Sortierter Index mit berechneten Zahlenwerten der Schlüssel, oder None bei einem unbekannten Kriterium
+        sorted_songs = self._sorted_songs(criteria)
+        if sorted_songs is not None and not sorted_songs.numbers_built():
+            with self.instrumentation.track(f'build/{criteria}_numbers') as measurement:
+                sorted_songs.build_numbers()
+            print(f"Zahlenwerte nach '{criteria}' für die Interpolationssuche berechnet in {measurement.elapsed:.6f} Sekunden.")
+        return sorted_songs
     
+    def prefix_search(self, prefix, criteria, limit=PREFIX_LIMIT):
+        """
+        Sucht die ersten Songs, deren Kriterium mit dem Präfix beginnt (z.B. für Autovervollständigung).
+
+        Die Treffer liegen im sortierten Index direkt hintereinander und werden mit einer
+        Bereichsabfrage gelesen, ein zusätzlicher Index wird dafür nicht benötigt.
+
+        Args:
+            prefix (str): Der Anfang des gesuchten Werts.
+            criteria (str): Das Suchkriterium ('title', 'artist' oder 'genre').
+            limit (int): Die maximale Anzahl Treffer.
+
+        Returns:
+            list: Die passenden Songs in sortierter Reihenfolge.
+        """
+        index = self._sorted_songs(criteria)
+        if index is None:
+            return []
+        return index.prefix(prefix, limit)
+
+    def fuzzy_index(self):
+        """
+        Gibt den Trigramm-Index der unscharfen Suche zurück und baut ihn beim ersten Aufruf auf.
+
+        Danach wird er bei jedem Hinzufügen und Löschen nachgeführt, nicht neu aufgebaut.
+
+        Returns:
+            FuzzyIndex: Der Index über Titel, Künstler und Album aller Songs.
+        """
+        if self._fuzzy_index is None:
+            with self.instrumentation.track('build/fuzzy_index') as measurement:
+                index = FuzzyIndex(self.songs_by_id)
+                index.update(self.songs)
+                self._fuzzy_index = index
+            print(f"Trigramm-Index aufgebaut in {measurement.elapsed:.6f} Sekunden.")
+        return self._fuzzy_index
+
+    def fuzzy_search(self, query, limit=PREFIX_LIMIT):
+        """
+        Sucht Songs, deren Titel, Künstler oder Album dem Suchtext ähneln, auch bei Tippfehlern.
+
+        Args:
+            query (str): Der Suchtext.
+            limit (int): Die maximale Anzahl Treffer.
+
+        Returns:
+            list: Paare (Song, Ähnlichkeit zwischen 0 und 1), die ähnlichsten zuerst.
+        """
+        return self.fuzzy_index().search(query, limit)
+
+    def numpy_index(self):
+        """
+        Gibt die NumPy-Engine zurück und baut sie nach Änderungen der Bibliothek neu auf.
+
+        Returns:
+            NumpySongIndex: Die Engine über den aktuellen Songs.
+        """
+        if self._numpy_index is None:
+            with self.instrumentation.track('build/numpy_index') as measurement:
+                self._numpy_index = NumpySongIndex(self.songs)
+            print(f"NumPy-Index aufgebaut in {measurement.elapsed:.6f} Sekunden.")
+        return self._numpy_index
+
+    def numpy_search(self, value, criteria):
+        """
+        Sucht vektorisiert mit np.searchsorted nach einem Song-Objekt basierend auf einem Kriterium.
+
+        Args:
+            value (str): Der Wert des Suchkriteriums.
+            criteria (str): Das Suchkriterium (z.B. 'title', 'artist', 'genre').
+
+        Returns:
+            Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
+        """
+        return self.numpy_index().search(value, criteria)
+
+    def numpy_filter(self, **criteria):
+        """
+        Filtert die Bibliothek vektorisiert mit booleschen Masken nach mehreren Feldern.
+
+        Args:
+            **criteria: Feldname und gesuchter Wert (z.B. artist='X', genre='Y').
+
+        Returns:
+            list: Alle passenden Songs.
+        """
+        return self.numpy_index().filter(**criteria)
+
+    def query_engine(self):
+        """
+        Gibt die invertierten Indizes für Anfragen mit Bedingungen zurück und baut sie beim ersten Aufruf auf.
+
+        Returns:
+            QueryEngine: Die Indizes über Künstler, Album und Genre aller Songs.
+        """
+        if self._query_engine is None:
+            with self.instrumentation.track('build/query_engine') as measurement:
+                engine = QueryEngine(self.songs_by_id)
+                engine.update(self.songs)
+                self._query_engine = engine
+            print(f"Invertierte Indizes aufgebaut in {measurement.elapsed:.6f} Sekunden.")
+        return self._query_engine
+
+    def filter_songs(self, **conditions):
+        """
+        Liefert alle Songs, die alle Bedingungen erfüllen (z.B. artist='X', genre='Y', album='Z').
+
+        Statt die ganze Bibliothek zu durchlaufen, werden die Posting-Listen der Bedingungen
+        geschnitten, beginnend mit der kürzesten. Die Songs werden nacheinander geliefert.
+
+        Args:
+            **conditions: Feldname ('artist', 'album' oder 'genre') und gesuchter Wert.
+
+        Returns:
+            generator: Die passenden Songs.
+        """
+        return self.query_engine().query(conditions)
+
+    def filter_songs_menu(self):
+        #Fragt eine Anfrage wie "artist=X AND genre=Y" ab und zeigt die ersten Treffer an
+        text = input("Gib die Bedingungen ein (z.B. artist=X AND genre=Y AND album=Z): ")
+        try:
+            conditions = parse_query(text)
+        except ValueError as e:
+            print(e)
+            return
+        self.query_engine()  #Indizes vor der Zeitmessung aufbauen, gemessen wird nur die Anfrage
+        with self.instrumentation.track('search/Filter') as measurement:
+            count = 0
+            for song in self.filter_songs(**conditions):
+                if count < self.PAGE_SIZE:
+                    print(f"  - {song}")
+                count += 1
+        if count > self.PAGE_SIZE:
+            print(f"  ... und {count - self.PAGE_SIZE} weitere.")
+        print(f"{count} Songs erfüllen alle Bedingungen.")
+        print(self.describe_measurement(measurement.elapsed, measurement.memory))
+
     def search_all_methods(self, value, criteria):
         """
         Führt alle Suchmethoden nacheinander aus und gibt die Ergebnisse aus.
@@ -360,45 +1029,34 @@ class MusicApp:
         }
 
         for method_name, method in search_methods.items():
-            start_time = time.time()
-            result = method(value, criteria)
-            end_time = time.time()
-            elapsed_time = end_time - start_time
+            result, measurement = self.instrumentation.measure(f'search/{method_name}', method, value, criteria)
+            elapsed_time = measurement.elapsed
 
             if result:
                 print(f"{method_name}: '{result}' in der Musikbibliothek gefunden. Benötigte Zeit: {elapsed_time:.6f} Sekunden.")
             else:
                 print(f"{method_name}: '{value}' nicht in der Musikbibliothek gefunden. Benötigte Zeit: {elapsed_time:.6f} Sekunden.")
                 
-    def measure_memory_and_time_sort(self, sort_method, *args):
+    def measure_memory_and_time_sort(self, sort_method, *args, operation='sort'):
         """
-        Misst die Ausführungszeit und den Speicherverbrauch eines Sortieralgorithmus.
-
-        Diese Funktion startet die Speicherverfolgung, misst die Speicherkapazität vor und nach der Ausführung des Sortieralgorithmus,
-        berechnet die benötigte Zeit und den verwendeten Speicher und gibt diese Werte zurück.
+        Misst die Ausführungszeit und (im Speichermodus) den Speicherverbrauch eines Sortieralgorithmus.
 
         Args:
             sort_method (function): Der auszuführende Sortieralgorithmus.
             *args: Argumente, die an den Sortieralgorithmus übergeben werden.
+            operation (str): Der Name der Operation im Register (z.B. 'sort/Merge Sort').
 
         Returns:
-            tuple: Ein Tuple bestehend aus der benötigten Zeit (in Sekunden) und dem verwendeten Speicher (in Bytes).
+            tuple: Ein Tuple bestehend aus der benötigten Zeit (in Sekunden) und dem Speicher-Peak (in Bytes, None im Zeitmodus).
         """
-        tracemalloc.start()
-        start_time = time.time()
-
-        # Aufruf des Sortieralgorithmus
-        sort_method(*args)
+        _, measurement = self.instrumentation.measure(operation, sort_method, *args)
+        return measurement.elapsed, measurement.memory
 
-        elapsed_time = time.time() - start_time
-        current, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
-
-        return  elapsed_time, peak
-
-    def print_songs(self, message):
+    def print_songs(self, message, page=None):
+        #Gibt eine Nachricht und die Songs aus, bei Angabe einer Seite nur diese Seite nach Titel sortiert
         print(message)
-        for song in self.songs:
+        songs = self.songs if page is None else self.rbt.page((page - 1) * self.PAGE_SIZE, self.PAGE_SIZE)
+        for song in songs:
             print(f"{song.title} - {song.artist} - {song.album} - {song.genre}")
 
 
@@ -422,6 +1080,9 @@ class MusicApp:
        print("3. Merge Sort")
        print("4. Quick Sort")
        print("5. Alle")
+       if NUMPY_AVAILABLE:
+           print("6. NumPy Sort")
+       print("7. Paralleler Merge Sort")
 
        choice = input("Gib deine Wahl ein: ").strip()
 
@@ -429,8 +1090,11 @@ class MusicApp:
            '1': ('Bubble Sort', self.bubble_sort),
            '2': ('Insertion Sort', self.insertion_sort),
            '3': ('Merge Sort', self.merge_sort),
-           '4': ('Quick Sort', self.quick_sort)
+           '4': ('Quick Sort', self.quick_sort),
+           '7': ('Paralleler Merge Sort', self.parallel_merge_sort)
        }
+       if NUMPY_AVAILABLE:
+           sort_methods_map['6'] = ('NumPy Sort', self.numpy_sort)
 
        criteria_map = {
            '1': 'Titel',
@@ -444,29 +1108,38 @@ class MusicApp:
                return
 
            criteria_name = criteria_map[criteria]
+           if NUMPY_AVAILABLE:
+               self.numpy_index()  #Index vor der Zeitmessung aufbauen, gemessen wird nur die Sortierung
            results = []
-           original_songs = copy.deepcopy(self.songs)  # Originaldatenstruktur kopieren
+           #Gemeinsame, unveränderliche Ausgangsreihenfolge; die Songs selbst werden nie kopiert,
+           #damit Rot-Schwarz-Baum, Indizes und Playlists weiter auf dieselben Objekte zeigen
+           original_songs = tuple(self.songs)
+           reference = sorted(original_songs, key=self.sort_key(criteria), reverse=(order == '2'))
 
            for method_key, (method_name, method) in sort_methods_map.items():
                #print(f"{method_name} wird ausgeführt.")  # Debug-Ausgabe
-               self.songs = copy.deepcopy(original_songs)  # Datenstruktur für jeden Algorithmus zurücksetzen
+               self.songs = list(original_songs)  # Flache Kopie: nur die Reihenfolge wird für jeden Algorithmus zurückgesetzt
 
                if method_key == '4':  # Quick Sort
                    print("quick_sort wurde aufgerufen.")  # Debug-Ausgabe
-                   elapsed_time, used_memory = self.measure_memory_and_time_sort(method, 0, len(self.songs) - 1, order, criteria)
+                   elapsed_time, used_memory = self.measure_memory_and_time_sort(method, 0, len(self.songs) - 1, order, criteria, operation=f'sort/{method_name}')
                else:
-                   elapsed_time, used_memory = self.measure_memory_and_time_sort(method, order, criteria)
+                   elapsed_time, used_memory = self.measure_memory_and_time_sort(method, order, criteria, operation=f'sort/{method_name}')
 
 
             
-               print(f"{method_name} (Sortierung nach {criteria_name}, {'aufsteigend' if order == '1' else 'absteigend'}): Sortierung abgeschlossen. Benötigte Zeit: {elapsed_time:.6f} Sekunden. Verwendete Speicherkapazität: {used_memory} Bytes.")
+               print(f"{method_name} (Sortierung nach {criteria_name}, {'aufsteigend' if order == '1' else 'absteigend'}): Sortierung abgeschlossen. {self.describe_measurement(elapsed_time, used_memory)}")
+               if not self.verify_sorted(self.songs, reference, original_songs, criteria):
+                   print(f"Fehler: {method_name} liefert nicht die erwartete Reihenfolge.")
                results.append((method_name, elapsed_time, used_memory))
 
            # Übersicht über alle Laufzeiten und Speicherverbräuche
            print("\nÜbersicht über alle Sortieralgorithmen:")
            for method_name, elapsed_time, used_memory in results:
-               print(f"{method_name}: Benötigte Zeit: {elapsed_time:.6f} Sekunden. Verwendete Speicherkapazität: {used_memory} Bytes.")
+               print(f"{method_name}: {self.describe_measurement(elapsed_time, used_memory)}")
 
+           self.songs = reference  #Sortierte Bibliothek mit den ursprünglichen Song-Objekten
+           self._snapshot_intact = False
            self.save_data()  # Speichern der Daten nach Abschluss aller Sortierungen
 
        else:
@@ -476,14 +1149,16 @@ class MusicApp:
                if order and criteria:
                    criteria_name = criteria_map[criteria]
                    #print(f"{method_name} wird ausgeführt.")  # Debug-Ausgabe
+                   if choice == '6':
+                       self.numpy_index()  #Index vor der Zeitmessung aufbauen, gemessen wird nur die Sortierung
                    if method_name == 'Quick Sort':
                        print("quick_sort wurde aufgerufen.")  # Debug-Ausgabe
-                       elapsed_time, used_memory = self.measure_memory_and_time_sort(method, 0, len(self.songs) - 1, order, criteria)
+                       elapsed_time, used_memory = self.measure_memory_and_time_sort(method, 0, len(self.songs) - 1, order, criteria, operation=f'sort/{method_name}')
                    else:
-                       elapsed_time, used_memory = self.measure_memory_and_time_sort(method, order, criteria)
+                       elapsed_time, used_memory = self.measure_memory_and_time_sort(method, order, criteria, operation=f'sort/{method_name}')
 
                    
-                   print(f"{method_name} (Sortierung nach {criteria_name}, {'aufsteigend' if order == '1' else 'absteigend'}): Sortierung abgeschlossen. Benötigte Zeit: {elapsed_time:.6f} Sekunden. Verwendete Speicherkapazität: {used_memory} Bytes.")
+                   print(f"{method_name} (Sortierung nach {criteria_name}, {'aufsteigend' if order == '1' else 'absteigend'}): Sortierung abgeschlossen. {self.describe_measurement(elapsed_time, used_memory)}")
                    self.save_data()  # Speichern der Daten nach Abschluss der Sortierung
            else:
                print("Ungültige Wahl. Bitte versuche es erneut.")
@@ -491,6 +1166,30 @@ class MusicApp:
 
 
 
+    def verify_sorted(self, songs, reference, original_songs, criteria):
+        """
+        Prüft das Ergebnis eines Sortieralgorithmus gegen eine Referenzsortierung.
+
+        Die Schlüsselfolge muss der Referenz entsprechen (die Reihenfolge gleicher Schlüssel ist
+        bei nicht stabilen Verfahren beliebig), und das Ergebnis muss genau die ursprünglichen
+        Song-Objekte enthalten.
+
+        Args:
+            songs (list): Das Ergebnis des Algorithmus.
+            reference (list): Die Referenzsortierung.
+            original_songs (tuple): Die unsortierten Ausgangssongs.
+            criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
+
+        Returns:
+            bool: True, wenn das Ergebnis korrekt sortiert ist, sonst False.
+        """
+        if len(songs) != len(reference):
+            return False
+        key = self.sort_key(criteria)
+        if any(key(song) != key(expected) for song, expected in zip(songs, reference)):
+            return False
+        return set(map(id, songs)) == set(map(id, original_songs))
+
     def get_sort_order_and_criteria(self, method_name):
         """
         Fragt die Sortierreihenfolge und das Sortierkriterium ab.
@@ -523,10 +1222,39 @@ class MusicApp:
         return order, criteria
 
             
+    def sort_key(self, criteria):
+        """
+        Gibt die Funktion zurück, die den Sortierschlüssel eines Songs liest.
+
+        Args:
+            criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
+
+        Returns:
+            operator.attrgetter: Liefert zu einem Song den Wert des Kriteriums.
+        """
+        return attrgetter({'1': 'title', '2': 'artist', '3': 'genre'}[criteria])
+
+    def sort_comparator(self, order):
+        """
+        Gibt den Vergleich zurück, der entscheidet, ob ein Schlüssel hinter einen anderen gehört.
+
+        Entspricht compare() für bereits extrahierte Schlüssel, wird aber nur einmal pro
+        Sortierung bestimmt statt bei jedem Vergleich.
+
+        Args:
+            order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
+
+        Returns:
+            function: operator.gt für aufsteigend, operator.le für absteigend.
+        """
+        return gt if order == '1' else le
+
     def bubble_sort(self, order, criteria):
         """
         Implementiert den Bubble Sort Algorithmus.
 
+        Die Sortierschlüssel werden einmal vorab extrahiert und parallel zu den Songs vertauscht.
+
         Args:
             order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
             criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
@@ -535,18 +1263,22 @@ class MusicApp:
             None
         """
         print("bubble_sort wurde aufgerufen.")  # Debug-Ausgabe
-        n = len(self.songs)
+        self._snapshot_intact = False  #Die Songs stehen danach nicht mehr in der Reihenfolge des Snapshots
+        songs = self.songs
+        keys = list(map(self.sort_key(criteria), songs))
+        after = self.sort_comparator(order)
+        n = len(songs)
         for i in range(n):
             swapped = False
             for j in range(0, n - i - 1):
-                if self.compare(self.songs[j], self.songs[j + 1], order, criteria):
-                    #print(f"Tausche {self.songs[j].title} mit {self.songs[j + 1].title}")  # Debug-Ausgabe
-                    self.songs[j], self.songs[j + 1] = self.songs[j + 1], self.songs[j]
+                if after(keys[j], keys[j + 1]):
+                    keys[j], keys[j + 1] = keys[j + 1], keys[j]
+                    songs[j], songs[j + 1] = songs[j + 1], songs[j]
                     swapped = True
             if not swapped:
                 break
         #self.print_songs("Songs nach dem Sortieren:")  # Debug-Ausgabe
-        
+
 
     def insertion_sort(self, order, criteria):
         """
@@ -560,19 +1292,28 @@ class MusicApp:
             None
         """
         print("insertion_sort wurde aufgerufen.")  # Debug-Ausgabe
-        for i in range(1, len(self.songs)):
-            key_song = self.songs[i]
+        self._snapshot_intact = False  #Die Songs stehen danach nicht mehr in der Reihenfolge des Snapshots
+        songs = self.songs
+        keys = list(map(self.sort_key(criteria), songs))
+        after = self.sort_comparator(order)
+        for i in range(1, len(songs)):
+            key_value = keys[i]
+            key_song = songs[i]
             j = i - 1
-            while j >= 0 and self.compare(self.songs[j], key_song, order, criteria):
-                self.songs[j + 1] = self.songs[j]
+            while j >= 0 and after(keys[j], key_value):
+                keys[j + 1] = keys[j]
+                songs[j + 1] = songs[j]
                 j -= 1
-            self.songs[j + 1] = key_song
-    
+            keys[j + 1] = key_value
+            songs[j + 1] = key_song
+
 
     def merge_sort(self, order, criteria):
         """
         Implementiert den Merge Sort Algorithmus.
 
+        Sortiert wird eine Liste von Paaren (Schlüssel, Song), die am Ende wieder entpackt wird.
+
         Args:
             order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
             criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
@@ -581,62 +1322,82 @@ class MusicApp:
             None
         """
         print("merge_sort wurde aufgerufen.")  # Debug-Ausgabe
-        self.songs = self._merge_sort(self.songs, order, criteria)
-        
+        self._snapshot_intact = False  #Die Songs stehen danach nicht mehr in der Reihenfolge des Snapshots
+        decorated = list(zip(map(self.sort_key(criteria), self.songs), self.songs))
+        self.songs = [song for _, song in self._merge_sort(decorated, self.sort_comparator(order))]
+
 
-    def _merge_sort(self, array, order, criteria):
+    def _merge_sort(self, array, after):
         """
         Implementiert den rekursiven Merge Sort Algorithmus.
 
         Diese Funktion teilt das Array rekursiv in zwei Hälften, sortiert jede Hälfte und führt sie dann zusammen.
 
         Args:
-            array (list): Die zu sortierende Liste von Songs.
-            order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
-            criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
+            array (list): Die zu sortierende Liste von Paaren (Schlüssel, Song).
+            after (function): Der Vergleich aus sort_comparator.
 
         Returns:
-            list: Die sortierte Liste von Songs.
+            list: Die sortierte Liste von Paaren.
         """
         if len(array) <= 1:
             return array
 
         mid = len(array) // 2
-        left_half = self._merge_sort(array[:mid], order, criteria)
-        right_half = self._merge_sort(array[mid:], order, criteria)
+        left_half = self._merge_sort(array[:mid], after)
+        right_half = self._merge_sort(array[mid:], after)
 
-        return self.merge(left_half, right_half, order, criteria)
+        return self.merge(left_half, right_half, after)
 
-    def merge(self, left, right, order, criteria):
+    def merge(self, left, right, after):
         """
         Führt zwei sortierte Listen zusammen.
 
-        Diese Funktion führt zwei sortierte Listen basierend auf dem angegebenen Kriterium und der Sortierreihenfolge zusammen.
-
         Args:
-            left (list): Die linke Hälfte der sortierten Liste.
-            right (list): Die rechte Hälfte der sortierten Liste.
-            order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
-            criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
+            left (list): Die linke Hälfte als sortierte Paare (Schlüssel, Song).
+            right (list): Die rechte Hälfte als sortierte Paare (Schlüssel, Song).
+            after (function): Der Vergleich aus sort_comparator.
 
         Returns:
             list: Die zusammengeführte und sortierte Liste.
         """
         result = []
+        append = result.append
         i = j = 0
+        left_length = len(left)
+        right_length = len(right)
 
-        while i < len(left) and j < len(right):
-            if self.compare(left[i], right[j], order, criteria):
-                result.append(right[j])
+        while i < left_length and j < right_length:
+            if after(left[i][0], right[j][0]):
+                append(right[j])
                 j += 1
             else:
-                result.append(left[i])
+                append(left[i])
                 i += 1
 
         result.extend(left[i:])
         result.extend(right[j:])
         return result
 
+    def parallel_merge_sort(self, order, criteria):
+        """
+        Sortiert die Songs mit mehreren Prozessen und führt die sortierten Blöcke per k-Wege-Merge zusammen.
+
+        An die Prozesse werden nur die Sortierschlüssel übergeben, nicht die Song-Objekte.
+
+        Args:
+            order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
+            criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
+
+        Returns:
+            None
+        """
+        print("parallel_merge_sort wurde aufgerufen.")  # Debug-Ausgabe
+        self._snapshot_intact = False  #Die Songs stehen danach nicht mehr in der Reihenfolge des Snapshots
+        field = {'1': 'title', '2': 'artist', '3': 'genre'}[criteria]
+        keys = [getattr(song, field) for song in self.songs]
+        songs = self.songs
+        self.songs = [songs[position] for position in parallel_sort_order(keys, reverse=(order == '2'))]
 
     def quick_sort(self, low, high, order, criteria):
         """
@@ -652,35 +1413,65 @@ class MusicApp:
             None
         """
         #print("quick_sort wurde aufgerufen.")  #an andere Stelle verschoben, da nur einmal gezeigt werden soll
+        self._snapshot_intact = False  #Die Songs stehen danach nicht mehr in der Reihenfolge des Snapshots
+        keys = list(map(self.sort_key(criteria), self.songs))
+        self._quick_sort(self.songs, keys, low, high, self.sort_comparator(order))
+
+    def _quick_sort(self, songs, keys, low, high, after):
+        #Rekursiver Quick Sort über die parallel geführten Songs und Schlüssel
         if low < high:
-            pi = self.partition(low, high, order, criteria)
-            self.quick_sort(low, pi - 1, order, criteria)
-            self.quick_sort(pi + 1, high, order, criteria)
+            pi = self.partition(songs, keys, low, high, after)
+            self._quick_sort(songs, keys, low, pi - 1, after)
+            self._quick_sort(songs, keys, pi + 1, high, after)
 
-    def partition(self, low, high, order, criteria):
+    def partition(self, songs, keys, low, high, after):
         """
         Hilfsmethode für Quick Sort.
 
         Args:
+            songs (list): Die zu sortierenden Songs.
+            keys (list): Die Sortierschlüssel, parallel zu songs.
             low (int): Der Startindex.
             high (int): Der Endindex.
-            order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
-            criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
+            after (function): Der Vergleich aus sort_comparator.
 
         Returns:
             int: Der Index des Pivotelements.
         """
-        pivot = self.songs[high]
+        pivot = keys[high]
         i = low - 1
 
         for j in range(low, high):
-            if not self.compare(pivot, self.songs[j], order, criteria):
+            if not after(keys[j], pivot):
                 i += 1
-                self.songs[i], self.songs[j] = self.songs[j], self.songs[i]
+                keys[i], keys[j] = keys[j], keys[i]
+                songs[i], songs[j] = songs[j], songs[i]
 
-        self.songs[i + 1], self.songs[high] = self.songs[high], self.songs[i + 1]
+        keys[i + 1], keys[high] = keys[high], keys[i + 1]
+        songs[i + 1], songs[high] = songs[high], songs[i + 1]
         return i + 1
 
+    def numpy_sort(self, order, criteria):
+        """
+        Sortiert die Songs vektorisiert mit np.argsort/np.lexsort über die kodierten Spalten.
+
+        Bei gleichem Sortierkriterium wird aufsteigend nach Titel sortiert (mehrstufiger Schlüssel).
+
+        Args:
+            order (str): Die Sortierreihenfolge ('1' für aufsteigend, '2' für absteigend).
+            criteria (str): Das Sortierkriterium ('1' für Titel, '2' für Künstler, '3' für Genre).
+
+        Returns:
+            None
+        """
+        print("numpy_sort wurde aufgerufen.")  # Debug-Ausgabe
+        self._snapshot_intact = False  #Die Songs stehen danach nicht mehr in der Reihenfolge des Snapshots
+        field = {'1': 'title', '2': 'artist', '3': 'genre'}[criteria]
+        keys = [(field, order == '1')]
+        if field != 'title':
+            keys.append(('title', True))
+        self.songs = self.numpy_index().sorted_songs(keys)
+
     def compare(self, song1, song2, ascending, criteria):
         """
         Vergleicht zwei Song-Objekte basierend auf einem Kriterium und der Sortierreihenfolge.
@@ -712,100 +1503,207 @@ class MusicApp:
         return result
     
 
+    def new_playlist(self, name):
+        """
+        Legt eine leere Playlist an und protokolliert die Änderung.
+
+        Args:
+            name (str): Der Name der Playlist.
+
+        Raises:
+            ValueError: Wenn es bereits eine Playlist mit diesem Namen gibt.
+
+        Returns:
+            Playlist: Die neue Playlist.
+        """
+        if name in self.playlists:
+            raise ValueError(f"Eine Playlist mit dem Namen '{name}' existiert bereits.")
+        playlist = self.playlists[name] = Playlist(name)
+        self._dirty_playlists.add(name)
+        self.log_change(SongJournal.PLAYLIST_CREATE, name)
+        return playlist
+
+    def add_to_playlist(self, name, song):
+        """
+        Fügt einen Song der Bibliothek zu einer Playlist hinzu und protokolliert die Änderung.
+
+        Args:
+            name (str): Der Name der Playlist.
+            song (Song): Der Song, er muss in der Bibliothek sein.
+
+        Raises:
+            KeyError: Wenn es keine Playlist mit diesem Namen gibt.
+
+        Returns:
+            bool: True, wenn der Song neu in der Playlist ist, False, wenn er schon enthalten war.
+        """
+        if not self._link_playlist_song(self.playlists[name], song):
+            return False
+        self.log_change(SongJournal.PLAYLIST_ADD, name, song.song_id)
+        return True
+
+    def remove_from_playlist(self, name, song):
+        """
+        Entfernt einen Song aus einer Playlist und protokolliert die Änderung.
+
+        Args:
+            name (str): Der Name der Playlist.
+            song (Song): Der zu entfernende Song.
+
+        Raises:
+            KeyError: Wenn es keine Playlist mit diesem Namen gibt.
+
+        Returns:
+            bool: True, wenn der Song in der Playlist war.
+        """
+        if not self._unlink_playlist_song(self.playlists[name], song):
+            return False
+        self.log_change(SongJournal.PLAYLIST_REMOVE, name, song.song_id)
+        return True
+
+    def playlists_of(self, song):
+        #Gibt die Playlists zurück, die einen Song enthalten, ohne alle Playlists zu durchlaufen
+        return list(self._playlists_by_song.get(song.song_id, ()))
+
+    def _link_playlist_song(self, playlist, song):
+        #Fügt einen Song zu einer Playlist hinzu und trägt die Playlist im Rückwärtsindex ein
+        if not playlist.add_song(song):
+            return False
+        self._playlists_by_song.setdefault(song.song_id, []).append(playlist)
+        self._dirty_playlists.add(playlist.name)
+        return True
+
+    def _unlink_playlist_song(self, playlist, song):
+        #Entfernt einen Song aus einer Playlist und aus dem Rückwärtsindex
+        if not playlist.remove_song(song):
+            return False
+        playlists = self._playlists_by_song[song.song_id]
+        playlists.remove(playlist)
+        if not playlists:
+            del self._playlists_by_song[song.song_id]
+        self._dirty_playlists.add(playlist.name)
+        return True
+
     def create_playlist(self):
         #Erstellt eine neue Playlist
         name = input("Gib den Namen der Playlist ein: ").strip()
-        if any(pl.name == name for pl in self.playlists):
+        try:
+            playlist = self.new_playlist(name)
+        except ValueError:
             print(f"Eine Playlist mit dem Namen '{name}' existiert bereits. Bitte wähle einen anderen Namen.")
             return
-        playlist = Playlist(name)
-        self.playlists.append(playlist)
-        self.save_data()
         print(f"Playlist erstellt: {playlist}")
 
     def add_song_to_playlist(self):
         #Fügt einen Song einer Playlist hinzu
         playlist_name = input("Gib den Namen der Playlist ein: ")
-        playlist = next((pl for pl in self.playlists if pl.name == playlist_name), None)
-        if not playlist:
+        playlist = self.playlists.get(playlist_name)
+        if playlist is None:
             print("Playlist nicht gefunden.")
             return
 
         song_title = input("Gib den Namen des Songs ein, der hinzugefügt werden soll: ")
-        song = next((s for s in self.songs if s.title == song_title), None)
-        if not song:
+        song = self.songs_by_title.get(song_title)
+        if song is None:
             print("Song nicht gefunden.")
             return
 
-        playlist.add_song(song)
-        self.save_data()
-        print(f"{song.title} zur Playlist {playlist.name} hinzugefügt.")
+        if self.add_to_playlist(playlist.name, song):
+            print(f"{song.title} zur Playlist {playlist.name} hinzugefügt.")
+        else:
+            print(f"{song.title} ist bereits in der Playlist {playlist.name}.")
 
     def remove_song_from_playlist(self):
         #Entfernt einen Song aus einer Playlist
         playlist_name = input("Gib den Namen der Playlist ein: ")
-        playlist = next((pl for pl in self.playlists if pl.name == playlist_name), None)
-        if not playlist:
+        playlist = self.playlists.get(playlist_name)
+        if playlist is None:
             print("Playlist nicht gefunden.")
             return
 
         song_title = input("Gib den Namen des Songs ein, der entfernt werden soll: ")
-        playlist.remove_song(song_title)
-        self.save_data()
+        #Alle Songs mit diesem Titel, die in der Playlist sind
+        removed = [song for song in self.songs_by_title.get_all(song_title) if self._unlink_playlist_song(playlist, song)]
+        if not removed:
+            print(f"{song_title} ist nicht in der Playlist {playlist.name}.")
+            return
+        for song in removed:
+            self.log_change(SongJournal.PLAYLIST_REMOVE, playlist.name, song.song_id)
 
     def display_playlists(self):
         #Zeigt alle Playlists an
         if not self.playlists:
             print("Keine Playlists verfügbar.")
         else:
-            for playlist in self.playlists:
+            for playlist in self.playlists.values():
                 print(playlist)
                 for song in playlist.songs:
                     print(f"  - {song}")
 
+    def add_songs(self, new_songs):
+        """
+        Fügt viele Songs gesammelt zur Bibliothek hinzu und speichert einen neuen Snapshot.
+
+        Args:
+            new_songs (list): Die hinzuzufügenden Songs.
+
+        Returns:
+            None
+        """
+        self._add_to_library(new_songs)
+        self.save_data()
+
     def create_random_songs(self, count):
-        # Startzeit messen
-        start_time = time.time()
-    
         #Erstellt eine bestimmte Anzahl zufälliger Songs und speichert sie auf einmal
-        for _ in range(count):
-            title = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
-            artist = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
-            album = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
-            genre = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
-            song = Song(title, artist, album, genre)
-            self.songs.append(song)
-            self.rbt.insert(song)  #Fügt den Song in den Rot-Schwarz-Baum ein
-
-    # Sortiere die Listen nach dem Hinzufügen der zufälligen Songs
-        self.sorted_songs_by_title = sorted(self.songs, key=lambda song: song.title)
-        self.sorted_songs_by_artist = sorted(self.songs, key=lambda song: song.artist)
-        self.sorted_songs_by_genre = sorted(self.songs, key=lambda song: song.genre)
-        
-        self.save_data()
-        
-        # Endzeit messen
-        end_time = time.time()
-        
-        # Benötigte Zeit berechnen
-        elapsed_time = end_time - start_time
-        
+        with self.instrumentation.track('bulk_insert') as measurement:
+            new_songs = []
+            for _ in range(count):
+                title = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
+                artist = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
+                album = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
+                genre = ''.join(random.choices(string.ascii_uppercase, k=random.randint(5, 10)))
+                song = self.new_song(title, artist, album, genre)
+                new_songs.append(song)
+            self.add_songs(new_songs)
+
         # Größe des RBT berechnen
         rbt_size = self.rbt.get_size()
         
         # Größe der Listen berechnen
-        lists_size = (sys.getsizeof(self.sorted_songs_by_title) +
-                      sys.getsizeof(self.sorted_songs_by_artist) +
-                      sys.getsizeof(self.sorted_songs_by_genre))
+        lists_size = sum(index.get_size() for index in self._sorted_indexes())
         
         total_size = rbt_size + lists_size
         
         print(f"{count} zufällige Songs erstellt, in einem Rot-Schwarz-Baum gespeichert und die Listen sortiert.")
-        print(f"Benötigte Zeit: {elapsed_time:.6f} Sekunden.")
+        print(self.describe_measurement(measurement.elapsed, measurement.memory))
         print(f"Speicherkapazität des RBT: {rbt_size} Bytes.")
         print(f"Speicherkapazität der Listen: {lists_size} Bytes.")
+        print("Zusätzliche Speicherkapazität der Präfixsuche: 0 Bytes (Bereichsabfragen auf den Listen).")
+        if self._fuzzy_index is not None:
+            print(f"Speicherkapazität des Trigramm-Index: {self._fuzzy_index.get_size()} Bytes.")
         print(f"Gesamte Speicherkapazität: {total_size} Bytes.")
-
+        if self.song_store is not None:
+            print(f"Speicherkapazität des SongStore: {self.song_store.get_size()} Bytes.")
+
+
+    def show_measurements(self):
+        #Zeigt die gesammelten Messwerte an und erlaubt Zurücksetzen, Export und Wechsel des Messmodus
+        self.instrumentation.dump()
+        print(f"Aufgebaute Indizes: {', '.join(self.built_indexes()) or 'keine'} (Aufbauzeiten unter build/...).")
+        memory_mode = self.instrumentation.mode == Instrumentation.MEMORY
+        action = input(f"(Z)urücksetzen, als (J)SON speichern, Speichermessung {'(A)usschalten' if memory_mode else '(E)inschalten'} oder Enter: ").strip().lower()
+        if action == 'z':
+            self.instrumentation.reset()
+            print("Messwerte zurückgesetzt.")
+        elif action == 'j':
+            filename = input("Dateiname (Enter für messwerte.json): ").strip() or "messwerte.json"
+            self.instrumentation.dump(filename)
+        elif action == 'e' and not memory_mode:
+            self.instrumentation.set_mode(Instrumentation.MEMORY)
+            print("Speichermessung eingeschaltet.")
+        elif action == 'a' and memory_mode:
+            self.instrumentation.set_mode(Instrumentation.TIMING)
+            print("Speichermessung ausgeschaltet.")
 
     def main_menu(self):
         #Hauptmenü der Musik-App
@@ -822,6 +1720,10 @@ class MusicApp:
             print("9. Song aus Bibliothek löschen")
             print("10. Beenden")
             print("11. Zufällige Songs erstellen")
+            print("12. Messwerte anzeigen")
+            print("13. Songs aus CSV importieren")
+            print("14. Songs als CSV exportieren")
+            print("15. Songs filtern")
 
             choice = input("Gib deine Wahl ein: ").strip()
 
@@ -842,7 +1744,11 @@ class MusicApp:
             elif choice == '6':
                 self.sort_songs()
             elif choice == '7':
-                self.display_all_songs()
+                page = input("Gib die Seite ein (Enter für alle Songs): ").strip()
+                if page and not page.isdigit():
+                    print("Ungültige Seite.")
+                else:
+                    self.display_all_songs(int(page) if page else None)
             elif choice == '8':
                 self.display_playlists()
             elif choice == '9':
@@ -854,6 +1760,16 @@ class MusicApp:
             elif choice == '11':
                 count = int(input("Gib die Anzahl der zu erstellenden zufälligen Songs ein: "))
                 self.create_random_songs(count)
+            elif choice == '12':
+                self.show_measurements()
+            elif choice == '13':
+                filename = input(f"Gib den Dateinamen ein (Enter für {self.FILENAME}): ").strip()
+                self.import_csv(filename or None)
+            elif choice == '14':
+                filename = input(f"Gib den Dateinamen ein (Enter für {self.FILENAME}): ").strip()
+                self.export_csv(filename or None)
+            elif choice == '15':
+                self.filter_songs_menu()
             else:
                 print("Ungültige Wahl. Bitte erneut auswählen.")
 
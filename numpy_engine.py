@@ -0,0 +1,120 @@
+try:
+    import numpy as np
+except ImportError:  #NumPy ist optional, ohne NumPy stehen die Methoden dieses Moduls nicht zur Verfügung
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+
+class NumpySongIndex:
+    """
+    Vektorisierte Such- und Sortier-Engine über wörterbuch-kodierte Song-Spalten.
+
+    Jedes Feld wird einmal als Array fester Breite eingelesen und mit np.unique in eine
+    sortierte Werteliste und einen Code je Song zerlegt. Da die Codes die Sortierreihenfolge
+    der Werte erhalten, laufen Suche (np.searchsorted), Sortierung (np.argsort/np.lexsort)
+    und Filter (boolesche Masken) vollständig auf Integer-Arrays.
+    """
+
+    FIELDS = ('title', 'artist', 'album', 'genre')
+
+    def __init__(self, songs):
+        """
+        Baut die kodierten Spalten für eine Momentaufnahme der Songs auf.
+
+        Args:
+            songs (list): Die Songs, über die gesucht und sortiert werden soll.
+
+        Raises:
+            ImportError: Wenn NumPy nicht installiert ist.
+        """
+        if np is None:
+            raise ImportError("Für die NumPy-Engine muss NumPy installiert sein (pip install numpy).")
+        self.songs = list(songs)
+        self.values = {}        #Feld -> sortierte, eindeutige Werte
+        self.codes = {}         #Feld -> Code je Song (Position des Werts in values)
+        self.order = {}         #Feld -> Songpositionen sortiert nach Code
+        self.sorted_codes = {}  #Feld -> Codes in sortierter Reihenfolge
+        for field in self.FIELDS:
+            column = np.array([getattr(song, field) for song in self.songs], dtype=str)
+            values, codes = np.unique(column, return_inverse=True)
+            codes = codes.astype(np.int64).ravel()
+            order = np.argsort(codes, kind='stable')
+            self.values[field] = values
+            self.codes[field] = codes
+            self.order[field] = order
+            self.sorted_codes[field] = codes[order]
+
+    def __len__(self):
+        return len(self.songs)
+
+    def _code(self, field, value):
+        #Sucht den Code eines Werts per Binärsuche in der Werteliste, None wenn er nicht vorkommt
+        values = self.values[field]
+        position = int(np.searchsorted(values, value))
+        if position < len(values) and values[position] == value:
+            return position
+        return None
+
+    def search(self, value, field):
+        """
+        Sucht den ersten Song mit dem angegebenen Wert per np.searchsorted.
+
+        Args:
+            value (str): Der gesuchte Wert.
+            field (str): Das Feld ('title', 'artist', 'album' oder 'genre').
+
+        Returns:
+            Song: Der gefundene Song oder None.
+        """
+        code = self._code(field, value)
+        if code is None:
+            return None
+        row = int(np.searchsorted(self.sorted_codes[field], code))
+        return self.songs[int(self.order[field][row])]
+
+    def filter(self, **criteria):
+        """
+        Gibt alle Songs zurück, die alle angegebenen Feldwerte haben (z.B. artist='X', genre='Y').
+
+        Args:
+            **criteria: Feldname und gesuchter Wert.
+
+        Returns:
+            list: Die passenden Songs in Bibliotheksreihenfolge.
+        """
+        mask = np.ones(len(self.songs), dtype=bool)
+        for field, value in criteria.items():
+            code = self._code(field, value)
+            if code is None:
+                return []
+            mask &= self.codes[field] == code
+        return [self.songs[row] for row in np.flatnonzero(mask)]
+
+    def sort_order(self, keys):
+        """
+        Berechnet die Sortierreihenfolge für einen oder mehrere Sortierschlüssel.
+
+        Args:
+            keys (list): Tupel (Feld, aufsteigend) in absteigender Priorität.
+
+        Returns:
+            numpy.ndarray: Die Songpositionen in sortierter Reihenfolge (stabil).
+        """
+        columns = [self.codes[field] if ascending else -self.codes[field] for field, ascending in keys]
+        if len(columns) == 1:
+            return np.argsort(columns[0], kind='stable')
+        return np.lexsort(columns[::-1])  #np.lexsort sortiert nach dem letzten Schlüssel zuerst
+
+    def sorted_songs(self, keys):
+        """
+        Gibt die Songs sortiert nach einem oder mehreren Sortierschlüsseln zurück.
+
+        Args:
+            keys (list): Tupel (Feld, aufsteigend) in absteigender Priorität.
+
+        Returns:
+            list: Die sortierten Songs.
+        """
+        songs = self.songs
+        return [songs[row] for row in self.sort_order(keys).tolist()]
@@ -0,0 +1,71 @@
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
+MIN_PARALLEL_SIZE = 50000  #Darunter lohnt sich das Starten der Prozesse nicht
+
+
+def _sort_run(keys, reverse):
+    #Sortiert einen Block von Schlüsseln im Arbeitsprozess und gibt die lokale Reihenfolge kompakt zurück
+    order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+    return array('I', order).tobytes()
+
+
+def merge_runs(keys, runs, reverse=False):
+    """
+    Führt sortierte Läufe von Positionen zu einer Sortierreihenfolge zusammen.
+
+    Die Läufe werden hintereinandergehängt und mit list.sort zusammengeführt: Timsort erkennt
+    die vorsortierten Läufe und verschmilzt sie in C (mit Galopp-Modus), statt wie heapq.merge
+    je Element Python-Code auszuführen. Gleiche Schlüssel behalten wie bei sorted() die
+    Reihenfolge ihrer Positionen, wenn die Läufe nach Position aufeinanderfolgen.
+
+    Args:
+        keys (list): Die Sortierschlüssel, einer pro Position.
+        runs (list): Die einzeln sortierten Läufe als Folgen von Positionen.
+        reverse (bool): True, wenn die Läufe absteigend sortiert sind.
+
+    Returns:
+        list: Die Positionen in sortierter Reihenfolge.
+    """
+    order = []
+    for run in runs:
+        order.extend(run)
+    order.sort(key=keys.__getitem__, reverse=reverse)
+    return order
+
+
+def parallel_sort_order(keys, reverse=False, workers=None):
+    """
+    Berechnet die Sortierreihenfolge einer Schlüsselliste mit mehreren Prozessen.
+
+    Die Schlüssel werden in einen Block pro Prozess aufgeteilt und in einem
+    ProcessPoolExecutor sortiert. Übertragen werden nur die Schlüssel (z.B. Titel-Strings)
+    und die lokale Reihenfolge als Integer-Array, keine Song-Objekte. Die sortierten Läufe
+    werden anschließend mit merge_runs zusammengeführt.
+
+    Args:
+        keys (list): Die Sortierschlüssel, einer pro Element.
+        reverse (bool): True für absteigende Sortierung.
+        workers (int): Anzahl der Prozesse, standardmäßig die Anzahl der CPU-Kerne.
+
+    Returns:
+        list: Die Positionen der Elemente in sortierter Reihenfolge.
+    """
+    workers = workers or os.cpu_count() or 1
+    count = len(keys)
+    if workers == 1 or count < MIN_PARALLEL_SIZE:
+        return sorted(range(count), key=keys.__getitem__, reverse=reverse)
+
+    chunk_size = -(-count // workers)
+    bounds = [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+    with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+        futures = [executor.submit(_sort_run, keys[start:end], reverse) for start, end in bounds]
+        runs = []
+        for (start, _), future in zip(bounds, futures):
+            local_order = array('I')
+            local_order.frombytes(future.result())
+            runs.append(map(start.__add__, local_order))  #Lokale in globale Positionen, ohne Python-Schleife
+
+    return merge_runs(keys, runs, reverse)
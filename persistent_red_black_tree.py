@@ -0,0 +1,538 @@
+import sys
+import heapq
+from collections import deque
+from operator import attrgetter
+
+RED = "RED"
+BLACK = "BLACK"
+
+
+class PersistentNode:
+    """
+    Unveränderlicher Knoten des PersistentRedBlackTree.
+
+    Ein Knoten wird nach dem Anlegen nicht mehr verändert; er kann daher in beliebig vielen
+    Versionen des Baums gleichzeitig vorkommen. Eltern-Zeiger gibt es nicht, da ein Knoten
+    in jeder Version einen anderen Elternknoten haben kann.
+    """
+
+    __slots__ = ('color', 'left', 'song', 'right', 'size')
+
+    def __init__(self, color, left, song, right):
+        self.color = color
+        self.left = left
+        self.song = song
+        self.right = right
+        self.size = left.size + right.size + 1  #Anzahl der Knoten im Teilbaum mit diesem Knoten als Wurzel
+
+
+#Gemeinsamer leerer Knoten aller Bäume; da er nie verändert wird, braucht nicht jeder Baum einen eigenen
+NIL = PersistentNode.__new__(PersistentNode)
+NIL.color = BLACK
+NIL.left = NIL.right = NIL.song = None
+NIL.size = 0
+
+
+def _balance(left, song, right):
+    #Löst ein rotes Kind mit rotem Kind unter einem schwarzen Knoten auf (Okasaki, in der Form
+    #von Kahrs mit dem zusätzlichen Fall zweier roter Kinder, den das Löschen benötigt)
+    if left.color is RED:
+        if right.color is RED:
+            return PersistentNode(RED, PersistentNode(BLACK, left.left, left.song, left.right), song,
+                                  PersistentNode(BLACK, right.left, right.song, right.right))
+        if left.left.color is RED:
+            inner = left.left
+            return PersistentNode(RED, PersistentNode(BLACK, inner.left, inner.song, inner.right), left.song,
+                                  PersistentNode(BLACK, left.right, song, right))
+        if left.right.color is RED:
+            inner = left.right
+            return PersistentNode(RED, PersistentNode(BLACK, left.left, left.song, inner.left), inner.song,
+                                  PersistentNode(BLACK, inner.right, song, right))
+    elif right.color is RED:
+        if right.right.color is RED:
+            inner = right.right
+            return PersistentNode(RED, PersistentNode(BLACK, left, song, right.left), right.song,
+                                  PersistentNode(BLACK, inner.left, inner.song, inner.right))
+        if right.left.color is RED:
+            inner = right.left
+            return PersistentNode(RED, PersistentNode(BLACK, left, song, inner.left), inner.song,
+                                  PersistentNode(BLACK, inner.right, right.song, right.right))
+    return PersistentNode(BLACK, left, song, right)
+
+
+def _insert(node, song, title):
+    #Kopiert den Suchpfad; gleiche Titel kommen wie im veränderlichen Baum nach rechts
+    if node is NIL:
+        return PersistentNode(RED, NIL, song, NIL)
+    if title < node.song.title:
+        if node.color is BLACK:
+            return _balance(_insert(node.left, song, title), node.song, node.right)
+        return PersistentNode(RED, _insert(node.left, song, title), node.song, node.right)
+    if node.color is BLACK:
+        return _balance(node.left, node.song, _insert(node.right, song, title))
+    return PersistentNode(RED, node.left, node.song, _insert(node.right, song, title))
+
+
+def _redden(node):
+    #Färbt einen schwarzen Knoten rot (verringert die Schwarzhöhe des Teilbaums um eins)
+    if node.color is not BLACK or node is NIL:
+        raise ValueError("Rot-Schwarz-Invariante verletzt: schwarzer Knoten erwartet.")
+    return PersistentNode(RED, node.left, node.song, node.right)
+
+
+def _balance_left(left, song, right):
+    #Der linke Teilbaum hat nach dem Löschen eine um eins kleinere Schwarzhöhe
+    if left.color is RED:
+        return PersistentNode(RED, PersistentNode(BLACK, left.left, left.song, left.right), song, right)
+    if right.color is BLACK:
+        return _balance(left, song, PersistentNode(RED, right.left, right.song, right.right))
+    inner = right.left
+    return PersistentNode(RED, PersistentNode(BLACK, left, song, inner.left), inner.song,
+                          _balance(inner.right, right.song, _redden(right.right)))
+
+
+def _balance_right(left, song, right):
+    #Der rechte Teilbaum hat nach dem Löschen eine um eins kleinere Schwarzhöhe
+    if right.color is RED:
+        return PersistentNode(RED, left, song, PersistentNode(BLACK, right.left, right.song, right.right))
+    if left.color is BLACK:
+        return _balance(PersistentNode(RED, left.left, left.song, left.right), song, right)
+    inner = left.right
+    return PersistentNode(RED, _balance(_redden(left.left), left.song, inner.left), inner.song,
+                          PersistentNode(BLACK, inner.right, song, right))
+
+
+def _fuse(left, right):
+    #Verbindet die beiden Teilbäume eines gelöschten Knotens (alle Titel links <= alle Titel rechts)
+    if left is NIL:
+        return right
+    if right is NIL:
+        return left
+    if left.color is RED and right.color is RED:
+        middle = _fuse(left.right, right.left)
+        if middle.color is RED:
+            return PersistentNode(RED, PersistentNode(RED, left.left, left.song, middle.left), middle.song,
+                                  PersistentNode(RED, middle.right, right.song, right.right))
+        return PersistentNode(RED, left.left, left.song, PersistentNode(RED, middle, right.song, right.right))
+    if left.color is BLACK and right.color is BLACK:
+        middle = _fuse(left.right, right.left)
+        if middle.color is RED:
+            return PersistentNode(RED, PersistentNode(BLACK, left.left, left.song, middle.left), middle.song,
+                                  PersistentNode(BLACK, middle.right, right.song, right.right))
+        return _balance_left(left.left, left.song, PersistentNode(BLACK, middle, right.song, right.right))
+    if right.color is RED:
+        return PersistentNode(RED, _fuse(left, right.left), right.song, right.right)
+    return PersistentNode(RED, left.left, left.song, _fuse(left.right, right))
+
+
+def _delete_at(node, k):
+    #Löscht den Knoten an Position k des Teilbaums (Kahrs); navigiert über die Teilbaumgrößen,
+    #damit bei gleichen Titeln genau der gewünschte Song entfernt wird
+    left_size = node.left.size
+    if k < left_size:
+        if node.left.color is BLACK:
+            return _balance_left(_delete_at(node.left, k), node.song, node.right)
+        return PersistentNode(RED, _delete_at(node.left, k), node.song, node.right)
+    if k > left_size:
+        k -= left_size + 1
+        if node.right.color is BLACK:
+            return _balance_right(node.left, node.song, _delete_at(node.right, k))
+        return PersistentNode(RED, node.left, node.song, _delete_at(node.right, k))
+    return _fuse(node.left, node.right)
+
+
+def _blacken(node):
+    #Die Wurzel ist immer schwarz
+    if node.color is RED:
+        return PersistentNode(BLACK, node.left, node.song, node.right)
+    return node
+
+
+class PersistentRedBlackTree:
+    """
+    Rot-Schwarz-Baum aus unveränderlichen Knoten (Pfadkopie).
+
+    Einfügen und Löschen verändern keinen bestehenden Knoten, sondern kopieren nur die
+    O(log n) Knoten auf dem Pfad zur Wurzel; alle übrigen Teilbäume teilt die neue Version
+    mit der alten. Danach wird die Wurzel mit einer einzigen Zuweisung ersetzt. Jede Methode
+    liest die Wurzel nur einmal, sodass Leser in anderen Threads ohne Sperre immer eine
+    vollständige, konsistente Version durchsuchen. Schreibvorgänge müssen weiterhin
+    nacheinander erfolgen. snapshot() hält eine Version in O(1) fest, z.B. für ein günstiges
+    Rückgängigmachen mit restore().
+    Die öffentliche Schnittstelle entspricht der von RedBlackTree.
+    """
+
+    NIL = NIL
+
+    def __init__(self, root=NIL):
+        #Initialisiert einen leeren Baum oder eine Version mit der angegebenen Wurzel
+        self.root = root
+
+    @classmethod
+    def from_sorted(cls, songs):
+        """
+        Baut einen balancierten Baum in linearer Zeit aus nach Titel sortierten Songs.
+
+        Wie bei RedBlackTree.from_sorted werden nur die Knoten der untersten Ebene rot gefärbt;
+        da es keine Eltern-Zeiger gibt, entstehen die Kinder vor ihrem Elternknoten.
+
+        Args:
+            songs (list): Die nach Titel sortierten Song-Objekte.
+
+        Returns:
+            PersistentRedBlackTree: Der aufgebaute Baum.
+        """
+        count = len(songs)
+        if count == 0:
+            return cls()
+        red_depth = count.bit_length() - 1  #Tiefe der untersten Ebene
+
+        def build(low, high, depth):
+            if low > high:
+                return NIL
+            mid = (low + high) // 2
+            return PersistentNode(RED if depth == red_depth else BLACK, build(low, mid - 1, depth + 1),
+                                  songs[mid], build(mid + 1, high, depth + 1))
+
+        return cls(_blacken(build(0, count - 1, 0)))
+
+    def snapshot(self):
+        """
+        Hält die aktuelle Version des Baums fest.
+
+        Späteres Einfügen oder Löschen in diesem Baum ändert die festgehaltene Version nicht;
+        beide teilen sich alle unveränderten Knoten.
+
+        Returns:
+            PersistentRedBlackTree: Ein Baum mit der Wurzel der aktuellen Version.
+        """
+        return type(self)(self.root)
+
+    def restore(self, snapshot):
+        #Setzt den Baum auf eine mit snapshot() festgehaltene Version zurück
+        self.root = snapshot.root
+
+    def inorder(self):
+        """
+        Durchläuft den Baum in sortierter Reihenfolge (In-Order).
+
+        Returns:
+            generator: Die Song-Objekte in aufsteigender Reihenfolge nach Titel.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not NIL:
+            while node is not NIL:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.song
+            node = node.right
+
+    def bulk_insert(self, songs):
+        """
+        Fügt viele Songs auf einmal in den Baum ein.
+
+        Kleine Mengen werden einzeln eingefügt. Bei großen Mengen werden der bestehende Baum
+        und die sortierten neuen Songs zusammengeführt und eine neue Version in linearer Zeit
+        aufgebaut.
+
+        Args:
+            songs (list): Die einzufügenden Song-Objekte.
+
+        Returns:
+            None
+        """
+        batch = sorted(songs, key=attrgetter('title'))
+        existing = len(self)
+        if existing and len(batch) * existing.bit_length() < existing:
+            root = self.root
+            for song in batch:
+                root = _blacken(_insert(root, song, song.title))
+            self.root = root
+            return
+        merged = list(heapq.merge(self.inorder(), batch, key=attrgetter('title')))
+        self.root = self.from_sorted(merged).root
+
+    def __len__(self):
+        #Anzahl der Songs im Baum, direkt aus der Teilbaumgröße der Wurzel
+        return self.root.size
+
+    def insert(self, song):
+        """
+        Fügt einen neuen Song ein, indem eine neue Version mit kopiertem Suchpfad entsteht.
+
+        Args:
+            song (Song): Das Song-Objekt, das in den Baum eingefügt werden soll.
+
+        Returns:
+            None
+        """
+        self.root = _blacken(_insert(self.root, song, song.title))
+
+    def delete(self, song):
+        """
+        Löscht einen Song, indem eine neue Version ohne ihn entsteht.
+
+        Gelöscht wird nur genau dieses Song-Objekt, nie ein anderer Song mit gleichem Titel.
+
+        Args:
+            song (Song): Das zu löschende Song-Objekt.
+
+        Returns:
+            bool: True, wenn genau dieses Song-Objekt gefunden und gelöscht wurde, sonst False.
+        """
+        root = self.root
+        position = self._find_position(root, song)
+        if position is None:
+            return False
+        self.root = _blacken(_delete_at(root, position))
+        return True
+
+    def _find_position(self, root, song):
+        #Position genau dieses Songs in der Version oder None
+        title = song.title
+        position = self._rank(root, title)
+        stack = self._path_to(root, position)
+        while stack:
+            node = stack.pop()
+            if node.song.title != title:
+                break
+            if node.song is song:
+                return position
+            position += 1
+            node = node.right
+            while node is not NIL:
+                stack.append(node)
+                node = node.left
+        return None
+
+    @staticmethod
+    def _path_to(root, k):
+        #Stapel für einen In-Order-Durchlauf ab Position k
+        stack = []
+        node = root
+        while node is not NIL:
+            left_size = node.left.size
+            if k < left_size:
+                stack.append(node)
+                node = node.left
+            elif k == left_size:
+                stack.append(node)
+                break
+            else:
+                k -= left_size + 1
+                node = node.right
+        return stack
+
+    def get_size(self):
+        """
+        Berechnet den Speicherbedarf der Knoten und Songs dieser Version.
+
+        Mit snapshot() festgehaltene Versionen teilen sich den Großteil der Knoten; jede
+        Änderung belegt nur die Knoten ihres kopierten Pfads zusätzlich.
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        root = self.root
+        if root is NIL:
+            return 0
+        return root.size * (sys.getsizeof(root) + sys.getsizeof(root.song))
+
+    @staticmethod
+    def _rank(root, title):
+        rank = 0
+        node = root
+        while node is not NIL:
+            if title <= node.song.title:
+                node = node.left
+            else:
+                rank += node.left.size + 1
+                node = node.right
+        return rank
+
+    def rank(self, title):
+        """
+        Bestimmt die Anzahl der Songs, deren Titel kleiner als der angegebene Titel ist.
+
+        Args:
+            title (str): Der Titel, dessen Rang bestimmt werden soll.
+
+        Returns:
+            int: Die Position, an der ein Song mit diesem Titel in der sortierten Reihenfolge steht.
+        """
+        return self._rank(self.root, title)
+
+    @staticmethod
+    def _select(root, k):
+        if not 0 <= k < root.size:
+            return None
+        node = root
+        while node is not NIL:
+            left_size = node.left.size
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.song
+            else:
+                k -= left_size + 1
+                node = node.right
+        return None
+
+    def select(self, k):
+        """
+        Gibt den Song an Position k der nach Titel sortierten Reihenfolge zurück.
+
+        Args:
+            k (int): Die Position (beginnend bei 0).
+
+        Returns:
+            Song: Der Song an dieser Position oder None, wenn k außerhalb des Baums liegt.
+        """
+        return self._select(self.root, k)
+
+    def page(self, offset, limit):
+        """
+        Gibt einen Ausschnitt der nach Titel sortierten Songs zurück.
+
+        Args:
+            offset (int): Die Position des ersten Songs.
+            limit (int): Die maximale Anzahl der Songs.
+
+        Returns:
+            list: Die Songs des Ausschnitts.
+        """
+        result = []
+        if offset < 0 or limit <= 0:
+            return result
+        stack = self._path_to(self.root, offset)
+        while stack and len(result) < limit:
+            node = stack.pop()
+            result.append(node.song)
+            node = node.right
+            while node is not NIL:
+                stack.append(node)
+                node = node.left
+        return result
+
+    def bfs_search(self, value, criteria):
+        """
+        Breitensuche nach einem Song basierend auf einem Kriterium.
+
+        Args:
+            value (str): Der Wert des Suchkriteriums.
+            criteria (str): Das Suchkriterium (z.B. 'title', 'artist').
+
+        Returns:
+            Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
+        """
+        root = self.root
+        if root is NIL:
+            return None
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            if getattr(node.song, criteria) == value:
+                return node.song
+            if node.left is not NIL:
+                queue.append(node.left)
+            if node.right is not NIL:
+                queue.append(node.right)
+        return None
+
+    def dfs_search(self, node, value, criteria):
+        """
+        Führt eine Tiefensuche nach einem Song-Objekt ab einem Knoten basierend auf einem Kriterium durch.
+
+        Args:
+            node (PersistentNode): Der Knoten, ab dem gesucht wird (z.B. tree.root).
+            value (str): Der Wert des Suchkriteriums.
+            criteria (str): Das Suchkriterium (z.B. 'title', 'artist').
+
+        Returns:
+            Song: Der gefundene Song oder None, wenn kein Song gefunden wurde.
+        """
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node is NIL:
+                continue
+            if getattr(node.song, criteria) == value:
+                return node.song
+            stack.append(node.right)
+            stack.append(node.left)
+        return None
+
+    def search(self, value, criteria):
+        #Sucht entlang der Sortierung; für andere Kriterien als den Titel wie RedBlackTree.search nur heuristisch
+        node = self.root
+        while node is not NIL:
+            key = getattr(node.song, criteria)
+            if key == value:
+                return node.song
+            node = node.left if value < key else node.right
+        return None
+
+    def height(self):
+        """
+        Berechnet die Höhe des Baums (Anzahl der Ebenen).
+
+        Returns:
+            int: Die Höhe des Baums, 0 für einen leeren Baum.
+        """
+        height = 0
+        root = self.root
+        level = [root] if root is not NIL else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child is not NIL]
+        return height
+
+    def validate(self):
+        """
+        Überprüft alle Invarianten des Rot-Schwarz-Baums.
+
+        Geprüft werden die schwarze Wurzel, keine zwei roten Knoten hintereinander, gleiche
+        Schwarzhöhe auf allen Pfaden, die Sortierung nach Titel und die Teilbaumgrößen.
+
+        Returns:
+            int: Die Schwarzhöhe des Baums.
+
+        Raises:
+            ValueError: Wenn eine Invariante verletzt ist.
+        """
+        root = self.root
+        if NIL.color is not BLACK or NIL.size != 0:
+            raise ValueError("Der NIL-Knoten muss schwarz sein und die Größe 0 haben.")
+        if root is NIL:
+            return 1
+        if root.color is not BLACK:
+            raise ValueError("Die Wurzel muss schwarz sein.")
+
+        black_heights = {}
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                for child in (node.left, node.right):
+                    if child is not NIL and node.color is RED and child.color is RED:
+                        raise ValueError(f"Roter Knoten '{node.song.title}' hat ein rotes Kind.")
+                if node.left is not NIL and node.left.song.title > node.song.title:
+                    raise ValueError(f"Sortierung verletzt links von '{node.song.title}'.")
+                if node.right is not NIL and node.right.song.title < node.song.title:
+                    raise ValueError(f"Sortierung verletzt rechts von '{node.song.title}'.")
+                stack.append((node, True))
+                if node.left is not NIL:
+                    stack.append((node.left, False))
+                if node.right is not NIL:
+                    stack.append((node.right, False))
+            else:
+                left_height = black_heights.pop(id(node.left)) if node.left is not NIL else 1
+                right_height = black_heights.pop(id(node.right)) if node.right is not NIL else 1
+                if left_height != right_height:
+                    raise ValueError(f"Unterschiedliche Schwarzhöhe unter '{node.song.title}'.")
+                if node.size != node.left.size + node.right.size + 1:
+                    raise ValueError(f"Falsche Teilbaumgröße bei '{node.song.title}'.")
+                black_heights[id(node)] = left_height + (node.color is BLACK)
+        return black_heights[id(root)]
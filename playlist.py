@@ -1,15 +1,36 @@
-from song import Song
-
 class Playlist:
     def __init__(self, name):
         """
         Initialisiert eine Playlist mit einem Namen und einer leeren Songliste.
 
+        Die Songs liegen in einem Wörterbuch Schlüssel -> Song. Es behält die Reihenfolge des
+        Hinzufügens bei und erlaubt Hinzufügen, Entfernen und Enthaltensein in O(1).
+
         Args:
             name (str): Der Name der Playlist.
         """
         self.name = name
-        self.songs = []
+        self._songs = {}  #Song-Nummer -> Song, in der Reihenfolge des Hinzufügens
+
+    @staticmethod
+    def _key(song):
+        #Songs einer Bibliothek haben eine Song-Nummer; Songs außerhalb werden über ihre Identität
+        #unterschieden, da Song.__eq__ nur den Titel vergleicht und Songs nicht hashbar sind
+        return song.song_id if song.song_id is not None else id(song)
+
+    @property
+    def songs(self):
+        #Die Songs in der Reihenfolge des Hinzufügens
+        return self._songs.values()
+
+    def __len__(self):
+        return len(self._songs)
+
+    def __iter__(self):
+        return iter(self._songs.values())
+
+    def __contains__(self, song):
+        return self._key(song) in self._songs
 
     def add_song(self, song):
         """
@@ -17,38 +38,55 @@ class Playlist:
 
         Args:
             song (Song): Das hinzuzufügende Song-Objekt.
-            
+
         Returns:
-            None
+            bool: True, wenn der Song neu in der Playlist ist, False, wenn er schon enthalten war.
         """
-        self.songs.append(song)
-    
-    def remove_song(self, title):
+        key = self._key(song)
+        if key in self._songs:
+            return False
+        self._songs[key] = song
+        return True
+
+    def remove_song(self, song):
         """
-        Entfernt einen Song aus der Playlist basierend auf dem Titel.
+        Entfernt einen Song aus der Playlist.
 
         Args:
-            title (str): Der Titel des Songs, der entfernt werden soll.
+            song (Song): Der Song, der entfernt werden soll.
 
         Returns:
-            None
+            bool: True, wenn der Song in der Playlist war.
         """
-        self.songs = [song for song in self.songs if song.title != title]
+        return self._songs.pop(self._key(song), None) is not None
 
     def __str__(self):
         #Gibt eine lesbare Darstellung der Playlist zurück
-        return f"Playlist: {self.name}, Songs: {len(self.songs)}"
+        return f"Playlist: {self.name}, Songs: {len(self._songs)}"
 
     def to_dict(self):
-        #Konvertiert die Playlist in ein Wörterbuch
+        #Konvertiert die Playlist in ein Wörterbuch; die Songs werden über ihre Song-Nummer referenziert
         return {
             "name": self.name,
-            "songs": [song.to_dict() for song in self.songs]
+            "song_ids": [song.song_id for song in self._songs.values()]
         }
 
     @staticmethod
-    def from_dict(data):
-        # Erstellt eine Playlist aus einem Wörterbuch
+    def from_dict(data, songs_by_id):
+        """
+        Erstellt eine Playlist aus einem Wörterbuch von to_dict.
+
+        Args:
+            data (dict): Das Wörterbuch mit 'name' und 'song_ids'.
+            songs_by_id (dict): Song-Nummer -> Song der geladenen Bibliothek; Nummern ohne
+                Song (z.B. inzwischen gelöschte Songs) werden übersprungen.
+
+        Returns:
+            Playlist: Die Playlist mit den Song-Objekten der Bibliothek.
+        """
         playlist = Playlist(data['name'])
-        playlist.songs = [Song.from_dict(song_data) for song_data in data['songs']]
+        for song_id in data['song_ids']:
+            song = songs_by_id.get(song_id)
+            if song is not None:
+                playlist.add_song(song)
         return playlist
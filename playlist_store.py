@@ -0,0 +1,63 @@
+import json
+import os
+from urllib.parse import quote, unquote
+
+SUFFIX = '.json'
+
+
+def playlist_filename(directory, name):
+    #Eine Datei je Playlist; der Name wird so maskiert, dass er ein gültiger Dateiname ist
+    return os.path.join(directory, quote(name, safe='') + SUFFIX)
+
+
+def write_playlist(directory, playlist):
+    """
+    Schreibt eine Playlist als JSON-Datei mit den Song-Nummern ihrer Songs.
+
+    Die Songs werden nur über ihre Nummer referenziert, nicht kopiert: ein Song in vielen
+    Playlists liegt so nur einmal im Snapshot der Bibliothek. Geschrieben wird in eine
+    temporäre Datei, die die alte danach ersetzt.
+
+    Args:
+        directory (str): Das Verzeichnis der Playlist-Dateien, es wird bei Bedarf angelegt.
+        playlist (Playlist): Die zu speichernde Playlist.
+
+    Returns:
+        None
+    """
+    os.makedirs(directory, exist_ok=True)
+    filename = playlist_filename(directory, playlist.name)
+    pending = filename + '.new'
+    with open(pending, 'w', encoding='utf-8') as file:
+        json.dump(playlist.to_dict(), file, ensure_ascii=False, separators=(',', ':'))
+    os.replace(pending, filename)
+
+
+def read_playlists(directory):
+    """
+    Liest alle Playlist-Dateien eines Verzeichnisses.
+
+    Die Song-Nummern werden hier noch nicht aufgelöst, damit der Aufrufer die Nummern aller
+    Playlists gesammelt in einem Durchlauf über die Bibliothek auflösen kann.
+
+    Args:
+        directory (str): Das Verzeichnis der Playlist-Dateien.
+
+    Returns:
+        list: Wörterbücher mit 'name' und 'song_ids' je Playlist, nach Dateiname sortiert.
+    """
+    if not os.path.isdir(directory):
+        return []
+    playlists = []
+    for entry in sorted(os.listdir(directory)):
+        if not entry.endswith(SUFFIX):
+            continue
+        try:
+            with open(os.path.join(directory, entry), 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Warnung: Playlist-Datei {entry} wird übersprungen ({e}).")
+            continue
+        data.setdefault('name', unquote(entry[:-len(SUFFIX)]))
+        playlists.append(data)
+    return playlists
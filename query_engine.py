@@ -0,0 +1,183 @@
+import re
+import sys
+from array import array
+from bisect import bisect_left, insort
+
+FIELD_NAMES = {
+    #Feldnamen in Anfragen, deutsch oder wie die Song-Attribute
+    'artist': 'artist', 'künstler': 'artist',
+    'album': 'album',
+    'genre': 'genre',
+}
+
+
+def parse_query(text):
+    """
+    Zerlegt eine Anfrage wie "artist=Queen AND genre=Rock" in Bedingungen.
+
+    Die Bedingungen werden mit AND (Groß-/Kleinschreibung egal) verknüpft, jede Bedingung
+    hat die Form feld=wert. Leerzeichen um Feld und Wert werden entfernt.
+
+    Args:
+        text (str): Die Anfrage.
+
+    Raises:
+        ValueError: Wenn eine Bedingung kein '=' enthält oder das Feld unbekannt ist.
+
+    Returns:
+        dict: Feld -> gesuchter Wert.
+    """
+    conditions = {}
+    for part in re.split(r'\s+and\s+', text.strip(), flags=re.IGNORECASE):
+        field, separator, value = part.partition('=')
+        field = FIELD_NAMES.get(field.strip().lower())
+        if not separator or field is None:
+            raise ValueError(f"Ungültige Bedingung '{part.strip()}'. Erwartet: feld=wert mit feld aus {', '.join(FIELD_NAMES)}")
+        conditions[field] = value.strip()
+    return conditions
+
+
+class QueryEngine:
+    """
+    Invertierte Indizes für Anfragen mit mehreren Bedingungen (z.B. Künstler UND Genre UND Album).
+
+    Je Feld wird zu jedem Wert die aufsteigend sortierte Liste der Song-Nummern gespeichert
+    (Posting-Liste). Eine Anfrage schneidet die Listen ihrer Bedingungen: die kürzeste Liste
+    wird durchlaufen und jede Nummer per Binärsuche in den übrigen Listen gesucht, wobei die
+    Suche dort an der zuletzt gefundenen Position weitermacht. Der Aufwand hängt damit von
+    der kürzesten Liste ab, nicht von der Größe der Bibliothek.
+    """
+
+    FIELDS = ('artist', 'album', 'genre')
+
+    def __init__(self, songs_by_id, fields=FIELDS):
+        """
+        Initialisiert leere Indizes.
+
+        Args:
+            songs_by_id (dict): Die Zuordnung Song-Nummer -> Song, über die Treffer aufgelöst werden.
+            fields (tuple): Die indizierten Song-Attribute.
+        """
+        self.songs_by_id = songs_by_id
+        self.fields = fields
+        self._postings = {field: {} for field in fields}  #Feld -> Wert -> Song-Nummern (array, sortiert)
+
+    def add(self, song):
+        """
+        Nimmt einen Song in die Posting-Listen seiner Werte auf.
+
+        Args:
+            song (Song): Der Song, er muss eine song_id haben.
+
+        Returns:
+            None
+        """
+        song_id = song.song_id
+        for field in self.fields:
+            postings = self._postings[field]
+            value = getattr(song, field)
+            posting = postings.get(value)
+            if posting is None:
+                postings[value] = array('I', (song_id,))
+            elif posting[-1] < song_id:
+                posting.append(song_id)  #Neue Songs haben die größte Nummer, der Normalfall
+            else:
+                insort(posting, song_id)
+
+    def update(self, songs):
+        #Nimmt viele Songs in die Indizes auf
+        for song in songs:
+            self.add(song)
+
+    def remove(self, song):
+        """
+        Entfernt einen Song aus den Posting-Listen seiner Werte.
+
+        Args:
+            song (Song): Der zu entfernende Song.
+
+        Returns:
+            None
+        """
+        song_id = song.song_id
+        for field in self.fields:
+            postings = self._postings[field]
+            value = getattr(song, field)
+            posting = postings.get(value)
+            if posting is None:
+                continue
+            position = bisect_left(posting, song_id)
+            if position < len(posting) and posting[position] == song_id:
+                del posting[position]
+                if not posting:
+                    del postings[value]
+
+    def count(self, field, value):
+        #Anzahl der Songs mit einem Wert, ohne die Songs aufzulösen
+        return len(self._postings[field].get(value, ()))
+
+    def query_ids(self, conditions):
+        """
+        Liefert die Song-Nummern, die alle Bedingungen erfüllen, in aufsteigender Reihenfolge.
+
+        Args:
+            conditions (dict): Feld -> gesuchter Wert, alle Felder müssen indiziert sein.
+
+        Raises:
+            ValueError: Wenn ein Feld nicht indiziert ist.
+
+        Returns:
+            generator: Die passenden Song-Nummern.
+        """
+        postings = []
+        for field, value in conditions.items():
+            if field not in self._postings:
+                raise ValueError(f"Das Feld '{field}' ist nicht indiziert. Erlaubt: {', '.join(self.fields)}")
+            posting = self._postings[field].get(value)
+            if posting is None:
+                return  #Ein Wert ohne Songs: die Schnittmenge ist leer
+            postings.append(posting)
+        if not postings:
+            return
+        #Kürzeste Liste zuerst, die anderen werden nur per Binärsuche geprüft
+        postings.sort(key=len)
+        smallest, others = postings[0], postings[1:]
+        positions = [0] * len(others)
+        for song_id in smallest:
+            for i, posting in enumerate(others):
+                position = bisect_left(posting, song_id, positions[i])
+                if position == len(posting):
+                    return  #Eine Liste ist erschöpft, es kann keine weiteren Treffer geben
+                positions[i] = position
+                if posting[position] != song_id:
+                    break
+            else:
+                yield song_id
+
+    def query(self, conditions):
+        """
+        Liefert die Songs, die alle Bedingungen erfüllen, ohne die ganze Ergebnismenge aufzubauen.
+
+        Args:
+            conditions (dict): Feld -> gesuchter Wert.
+
+        Returns:
+            generator: Die passenden Songs in der Reihenfolge ihrer Song-Nummer.
+        """
+        songs_by_id = self.songs_by_id
+        for song_id in self.query_ids(conditions):
+            yield songs_by_id[song_id]
+
+    def get_size(self):
+        """
+        Berechnet den Speicherbedarf der Indizes (ohne die Songs selbst).
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        size = sys.getsizeof(self._postings)
+        for postings in self._postings.values():
+            size += sys.getsizeof(postings)
+            for posting in postings.values():
+                size += sys.getsizeof(posting)
+        return size
@@ -1,4 +1,7 @@
 import sys
+import gc
+import heapq
+from operator import attrgetter
 
 class RedBlackNode:
     def __init__(self, song):
@@ -8,14 +11,110 @@ class RedBlackNode:
         self.left = None
         self.right = None
         self.parent = None
+        self.size = 1  #Anzahl der Knoten im Teilbaum mit diesem Knoten als Wurzel
 
 class RedBlackTree:
     def __init__(self):
         #Initialisiert einen Rot-Schwarz-Baum mit einem NIL-Knoten
         self.NIL = RedBlackNode(None)
         self.NIL.color = "BLACK"
+        self.NIL.size = 0
         self.root = self.NIL
 
+    @classmethod
+    def from_sorted(cls, songs):
+        """
+        Baut einen balancierten Rot-Schwarz-Baum in linearer Zeit aus nach Titel sortierten Songs.
+
+        Der Baum wird über die Mitte der Liste rekursiv aufgebaut. Alle Blätter liegen dadurch
+        auf den untersten beiden Ebenen; die Knoten der tiefsten Ebene werden rot gefärbt,
+        alle anderen schwarz, sodass jeder Pfad dieselbe Schwarzhöhe hat.
+
+        Args:
+            songs (list): Die nach Titel sortierten Song-Objekte.
+
+        Returns:
+            RedBlackTree: Der aufgebaute Baum.
+        """
+        tree = cls()
+        tree._build_from_sorted(songs)
+        return tree
+
+    def _build_from_sorted(self, songs):
+        #Ersetzt den Inhalt des Baums durch einen aus den sortierten Songs aufgebauten Baum
+        nil = self.NIL
+        count = len(songs)
+        if count == 0:
+            self.root = nil
+            return
+        red_depth = count.bit_length() - 1  #Tiefe der untersten Ebene
+
+        def build(low, high, parent, depth):
+            if low > high:
+                return nil
+            mid = (low + high) // 2
+            node = RedBlackNode(songs[mid])
+            node.color = "RED" if depth == red_depth else "BLACK"
+            node.size = high - low + 1
+            node.parent = parent
+            node.left = build(low, mid - 1, node, depth + 1)
+            node.right = build(mid + 1, high, node, depth + 1)
+            return node
+
+        #Die zyklische Garbage Collection würde beim Anlegen von Millionen Knoten (mit
+        #Eltern-Zeigern) wiederholt den ganzen Heap durchsuchen und wird daher pausiert
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.root = build(0, count - 1, None, 0)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self.root.color = "BLACK"
+
+    def inorder(self):
+        """
+        Durchläuft den Baum in sortierter Reihenfolge (In-Order).
+
+        Returns:
+            generator: Die Song-Objekte in aufsteigender Reihenfolge nach Titel.
+        """
+        stack = []
+        node = self.root
+        while stack or node != self.NIL:
+            while node != self.NIL:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.song
+            node = node.right
+
+    def bulk_insert(self, songs):
+        """
+        Fügt viele Songs auf einmal in den Baum ein.
+
+        Kleine Mengen werden einzeln eingefügt. Bei großen Mengen werden der bestehende Baum
+        und die sortierten neuen Songs zusammengeführt und der Baum in linearer Zeit neu aufgebaut.
+
+        Args:
+            songs (list): Die einzufügenden Song-Objekte.
+
+        Returns:
+            None
+        """
+        batch = sorted(songs, key=attrgetter('title'))
+        existing = len(self)
+        if existing and len(batch) * existing.bit_length() < existing:
+            for song in batch:
+                self.insert(song)
+            return
+        merged = list(heapq.merge(self.inorder(), batch, key=attrgetter('title')))
+        self._build_from_sorted(merged)
+
+    def __len__(self):
+        #Anzahl der Songs im Baum, direkt aus der Teilbaumgröße der Wurzel
+        return self.root.size
+
     def insert(self, song):
         """
         Fügt einen neuen Song in den Rot-Schwarz-Baum ein.
@@ -35,6 +134,7 @@ class RedBlackTree:
 
         while current != self.NIL:
             parent = current
+            current.size += 1  #Der neue Knoten landet im Teilbaum jedes Knotens auf dem Pfad
             if new_node.song < current.song:
                 current = current.left
             else:
@@ -117,6 +217,8 @@ class RedBlackTree:
             x.parent.right = y
         y.left = x
         x.parent = y
+        y.size = x.size
+        x.size = x.left.size + x.right.size + 1
 
     def right_rotate(self, x):
         """
@@ -141,15 +243,107 @@ class RedBlackTree:
             x.parent.left = y
         y.right = x
         x.parent = y
+        y.size = x.size
+        x.size = x.left.size + x.right.size + 1
     
     def get_size(self):
-        def node_size(node):
-            if node == self.NIL:
-                return 0
-            return (sys.getsizeof(node) + sys.getsizeof(node.song) +
-                    node_size(node.left) + node_size(node.right))
+        """
+        Berechnet den Speicherbedarf der Knoten und Songs im Baum.
+
+        Alle Knoten und Songs haben dieselbe Objektgröße, daher genügt die Knotenanzahl
+        aus der Wurzel statt eines Durchlaufs über den ganzen Baum.
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        if self.root == self.NIL:
+            return 0
+        return self.root.size * (sys.getsizeof(self.root) + sys.getsizeof(self.root.song))
+
+    def rank(self, title):
+        """
+        Bestimmt die Anzahl der Songs, deren Titel kleiner als der angegebene Titel ist.
+
+        Args:
+            title (str): Der Titel, dessen Rang bestimmt werden soll.
+
+        Returns:
+            int: Die Position, an der ein Song mit diesem Titel in der sortierten Reihenfolge steht.
+        """
+        rank = 0
+        node = self.root
+        while node != self.NIL:
+            if title <= node.song.title:
+                node = node.left
+            else:
+                rank += node.left.size + 1
+                node = node.right
+        return rank
+
+    def select(self, k):
+        """
+        Gibt den Song an Position k der nach Titel sortierten Reihenfolge zurück.
+
+        Args:
+            k (int): Die Position (beginnend bei 0).
+
+        Returns:
+            Song: Der Song an dieser Position oder None, wenn k außerhalb des Baums liegt.
+        """
+        if not 0 <= k < self.root.size:
+            return None
+        node = self.root
+        while node != self.NIL:
+            left_size = node.left.size
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.song
+            else:
+                k -= left_size + 1
+                node = node.right
+        return None
+
+    def page(self, offset, limit):
+        """
+        Gibt einen Ausschnitt der nach Titel sortierten Songs zurück.
 
-        return node_size(self.root)
+        Der Einstieg erfolgt in O(log n) über die Teilbaumgrößen, danach wird nur so weit
+        in In-Order-Reihenfolge gelaufen, wie der Ausschnitt lang ist.
+
+        Args:
+            offset (int): Die Position des ersten Songs.
+            limit (int): Die maximale Anzahl der Songs.
+
+        Returns:
+            list: Die Songs des Ausschnitts.
+        """
+        result = []
+        if offset < 0 or limit <= 0:
+            return result
+        stack = []
+        node = self.root
+        k = offset
+        while node != self.NIL:
+            left_size = node.left.size
+            if k < left_size:
+                stack.append(node)
+                node = node.left
+            elif k == left_size:
+                stack.append(node)
+                break
+            else:
+                k -= left_size + 1
+                node = node.right
+
+        while stack and len(result) < limit:
+            node = stack.pop()
+            result.append(node.song)
+            node = node.right
+            while node != self.NIL:
+                stack.append(node)
+                node = node.left
+        return result
     
 
     def bfs_search(self, value, criteria):
@@ -211,33 +405,220 @@ class RedBlackTree:
             return self._search_recursive(node.right, value, criteria)
         
     def delete(self, song):
-        #Löscht einen Song aus dem Rot-Schwarz-Baum
-        self.root = self._delete_recursive(self.root, song)
+        """
+        Löscht einen Song aus dem Rot-Schwarz-Baum und stellt die Rot-Schwarz-Eigenschaften wieder her.
 
-    def _delete_recursive(self, node, song):
-        #Rekursive Methode zum Löschen eines Songs
-        if node == self.NIL:
-            return node
+        Args:
+            song (Song): Das zu löschende Song-Objekt.
 
-        if song < node.song:
-            node.left = self._delete_recursive(node.left, song)
-        elif song > node.song:
-            node.right = self._delete_recursive(node.right, song)
+        Returns:
+            bool: True, wenn genau dieses Song-Objekt gefunden und gelöscht wurde, sonst False.
+        """
+        z = self._find_node(song)
+        if z is None:
+            return False
+
+        #Der Knoten, der physisch aus dem Baum entfernt wird, ist z selbst oder sein Nachfolger
+        y = z if z.left == self.NIL or z.right == self.NIL else self._min_value_node(z.right)
+        ancestor = y.parent
+        while ancestor is not None:
+            ancestor.size -= 1
+            ancestor = ancestor.parent
+
+        y_original_color = y.color
+        if z.left == self.NIL:
+            x = z.right
+            self._transplant(z, z.right)
+        elif z.right == self.NIL:
+            x = z.left
+            self._transplant(z, z.left)
         else:
-            if node.left == self.NIL:
-                return node.right
-            elif node.right == self.NIL:
-                return node.left
+            x = y.right
+            if y.parent == z:
+                x.parent = y
+            else:
+                self._transplant(y, y.right)
+                y.right = z.right
+                y.right.parent = y
+            self._transplant(z, y)
+            y.left = z.left
+            y.left.parent = y
+            y.color = z.color
+            y.size = z.size
+
+        if y_original_color == "BLACK":
+            self.delete_fixup(x)
+        self.NIL.parent = None
+        return True
+
+    def _find_node(self, song):
+        #Sucht den Knoten genau dieses Songs; ein anderer Song mit gleichem Titel wird nie geliefert,
+        #damit delete nicht stillschweigend den falschen Song entfernt
+        title = song.title
+        node = self.root
+        first = None
+        while node != self.NIL:
+            if title <= node.song.title:
+                if title == node.song.title:
+                    first = node
+                node = node.left
+            else:
+                node = node.right
 
-            temp = self._min_value_node(node.right)
-            node.song = temp.song
-            node.right = self._delete_recursive(node.right, temp.song)
+        node = first
+        while node is not None and node.song.title == title:
+            if node.song is song:
+                return node
+            node = self._successor(node)
+        return None
 
-        return node
+    def _successor(self, node):
+        #Findet den In-Order-Nachfolger eines Knotens über die Eltern-Zeiger
+        if node.right != self.NIL:
+            return self._min_value_node(node.right)
+        parent = node.parent
+        while parent is not None and node == parent.right:
+            node = parent
+            parent = parent.parent
+        return parent
+
+    def _transplant(self, u, v):
+        #Ersetzt den Teilbaum mit Wurzel u durch den Teilbaum mit Wurzel v
+        if u.parent is None:
+            self.root = v
+        elif u == u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        v.parent = u.parent
+
+    def delete_fixup(self, x):
+        """
+        Fixiert den Baum nach dem Löschen eines schwarzen Knotens.
+
+        Args:
+            x (RedBlackNode): Der Knoten, der an die Stelle des entfernten Knotens gerückt ist.
+
+        Returns:
+            None
+        """
+        while x != self.root and x.color == "BLACK":
+            if x == x.parent.left:
+                sibling = x.parent.right
+                if sibling.color == "RED":
+                    sibling.color = "BLACK"
+                    x.parent.color = "RED"
+                    self.left_rotate(x.parent)
+                    sibling = x.parent.right
+                if sibling.left.color == "BLACK" and sibling.right.color == "BLACK":
+                    sibling.color = "RED"
+                    x = x.parent
+                else:
+                    if sibling.right.color == "BLACK":
+                        sibling.left.color = "BLACK"
+                        sibling.color = "RED"
+                        self.right_rotate(sibling)
+                        sibling = x.parent.right
+                    sibling.color = x.parent.color
+                    x.parent.color = "BLACK"
+                    sibling.right.color = "BLACK"
+                    self.left_rotate(x.parent)
+                    x = self.root
+            else:
+                sibling = x.parent.left
+                if sibling.color == "RED":
+                    sibling.color = "BLACK"
+                    x.parent.color = "RED"
+                    self.right_rotate(x.parent)
+                    sibling = x.parent.left
+                if sibling.right.color == "BLACK" and sibling.left.color == "BLACK":
+                    sibling.color = "RED"
+                    x = x.parent
+                else:
+                    if sibling.left.color == "BLACK":
+                        sibling.right.color = "BLACK"
+                        sibling.color = "RED"
+                        self.left_rotate(sibling)
+                        sibling = x.parent.left
+                    sibling.color = x.parent.color
+                    x.parent.color = "BLACK"
+                    sibling.left.color = "BLACK"
+                    self.right_rotate(x.parent)
+                    x = self.root
+        x.color = "BLACK"
 
     def _min_value_node(self, node):
         #Findet den Knoten mit dem minimalen Wert
         current = node
         while current.left != self.NIL:
             current = current.left
-        return current
\ No newline at end of file
+        return current
+
+    def height(self):
+        """
+        Berechnet die Höhe des Baums (Anzahl der Ebenen).
+
+        Returns:
+            int: Die Höhe des Baums, 0 für einen leeren Baum.
+        """
+        height = 0
+        level = [self.root] if self.root != self.NIL else []
+        while level:
+            height += 1
+            level = [child for node in level for child in (node.left, node.right) if child != self.NIL]
+        return height
+
+    def validate(self):
+        """
+        Überprüft alle Invarianten des Rot-Schwarz-Baums.
+
+        Geprüft werden die schwarze Wurzel, keine zwei roten Knoten hintereinander, gleiche
+        Schwarzhöhe auf allen Pfaden, konsistente Eltern-Zeiger, die Sortierung nach Titel
+        und die gespeicherten Teilbaumgrößen.
+
+        Returns:
+            int: Die Schwarzhöhe des Baums.
+
+        Raises:
+            ValueError: Wenn eine Invariante verletzt ist.
+        """
+        nil = self.NIL
+        if nil.color != "BLACK" or nil.size != 0:
+            raise ValueError("Der NIL-Knoten muss schwarz sein und die Größe 0 haben.")
+        if self.root == nil:
+            return 1
+        if self.root.color != "BLACK":
+            raise ValueError("Die Wurzel muss schwarz sein.")
+        if self.root.parent is not None:
+            raise ValueError("Die Wurzel darf keinen Elternknoten haben.")
+
+        black_heights = {}
+        stack = [(self.root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                for child in (node.left, node.right):
+                    if child == nil:
+                        continue
+                    if child.parent is not node:
+                        raise ValueError(f"Falscher Eltern-Zeiger bei '{child.song.title}'.")
+                    if node.color == "RED" and child.color == "RED":
+                        raise ValueError(f"Roter Knoten '{node.song.title}' hat ein rotes Kind.")
+                if node.left != nil and node.left.song.title > node.song.title:
+                    raise ValueError(f"Sortierung verletzt links von '{node.song.title}'.")
+                if node.right != nil and node.right.song.title < node.song.title:
+                    raise ValueError(f"Sortierung verletzt rechts von '{node.song.title}'.")
+                stack.append((node, True))
+                if node.left != nil:
+                    stack.append((node.left, False))
+                if node.right != nil:
+                    stack.append((node.right, False))
+            else:
+                left_height = black_heights.pop(id(node.left)) if node.left != nil else 1
+                right_height = black_heights.pop(id(node.right)) if node.right != nil else 1
+                if left_height != right_height:
+                    raise ValueError(f"Unterschiedliche Schwarzhöhe unter '{node.song.title}'.")
+                if node.size != node.left.size + node.right.size + 1:
+                    raise ValueError(f"Falsche Teilbaumgröße bei '{node.song.title}'.")
+                black_heights[id(node)] = left_height + (node.color == "BLACK")
+        return black_heights[id(self.root)]
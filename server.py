@@ -0,0 +1,457 @@
+"""
+Lokaler asyncio-Server, über den mehrere Clients gleichzeitig auf die Musikbibliothek zugreifen.
+
+Protokoll: JSON-Zeilen über TCP. Jede Zeile ist eine Anfrage {"id": ..., "op": ..., ...} und
+wird mit genau einer Zeile {"id": ..., "ok": true, "result": ...} bzw.
+{"id": ..., "ok": false, "error": "..."} beantwortet. Ein Client darf weitere Anfragen
+senden, bevor die Antworten da sind (Pipelining); die Antworten kommen in der Reihenfolge
+der Anfragen. Eine Zeile mit einer JSON-Liste von Anfragen ist ein Batch und wird mit einer
+Zeile mit der Liste der Antworten beantwortet.
+
+Lesende Anfragen laufen gleichzeitig in einem Thread-Pool, schreibende nacheinander und
+allein. Muss eine lesende Anfrage erst einen Index aufbauen, läuft sie wie eine schreibende.
+
+Lesend:    search (value, field, method), filter (conditions oder query), sorted (field, offset,
+           limit, descending), get (song_id), playlist (name), playlists, stats
+Schreibend: add (title, artist, album, genre), delete (title), playlist_create (name),
+           playlist_add (name, song_id), playlist_remove (name, song_id), save
+
+Die Suchen linear, binary, jump und interpolation liefern den Song mit der Anzahl der dafür
+geprüften Positionen (probes), prefix und fuzzy eine Liste von Songs.
+
+Aufruf: python server.py [--host 127.0.0.1] [--port 8765] [--backend node] [--workers 4]
+"""
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from instrumentation import Instrumentation
+from music_app import MusicApp
+from query_engine import parse_query
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+MAX_LIMIT = 1000          #Höchstzahl Songs je Antwort
+LINE_LIMIT = 1 << 20      #Höchstlänge einer Anfragezeile in Bytes
+PIPELINE_DEPTH = 256      #Höchstzahl offener Anfragen je Verbindung, danach wird nicht weiter gelesen
+FIELDS = ('title', 'artist', 'album', 'genre')
+
+
+def song_to_dict(song):
+    #Song als Wörterbuch für die Antwort, mit Song-Nummer für Playlist-Anfragen
+    data = song.to_dict()
+    data['song_id'] = song.song_id
+    return data
+
+
+class ReadWriteLock:
+    """
+    Lese-Schreib-Sperre für asyncio-Tasks, die in Ankunftsreihenfolge zugeteilt wird.
+
+    Beliebig viele Leser dürfen gleichzeitig arbeiten, ein Schreiber arbeitet allein. Wartet
+    ein Schreiber, werden später ankommende Leser hinter ihm eingereiht: Schreiber verhungern
+    nicht, und jede Anfrage sieht alle Schreibvorgänge, die vor ihr angekommen sind.
+    """
+
+    def __init__(self):
+        self._readers = 0
+        self._writer = False
+        self._waiters = deque()  #(Future, ist Schreiber) in Ankunftsreihenfolge
+
+    @contextlib.asynccontextmanager
+    async def reading(self):
+        await self._acquire(False)
+        try:
+            yield
+        finally:
+            self._readers -= 1
+            self._wake()
+
+    @contextlib.asynccontextmanager
+    async def writing(self):
+        await self._acquire(True)
+        try:
+            yield
+        finally:
+            self._writer = False
+            self._wake()
+
+    def _can_enter(self, writer):
+        return not self._writer and (not writer or self._readers == 0)
+
+    def _enter(self, writer):
+        if writer:
+            self._writer = True
+        else:
+            self._readers += 1
+
+    async def _acquire(self, writer):
+        if not self._waiters and self._can_enter(writer):
+            self._enter(writer)
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, writer)
+        self._waiters.append(entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                #Die Sperre war schon zugeteilt, als der Abbruch ankam: wieder freigeben
+                if writer:
+                    self._writer = False
+                else:
+                    self._readers -= 1
+            else:
+                self._waiters.remove(entry)
+            self._wake()
+            raise
+
+    def _wake(self):
+        #Teilt die Sperre den vordersten Wartenden zu, solange sie eintreten dürfen
+        while self._waiters:
+            future, writer = self._waiters[0]
+            if not self._can_enter(writer):
+                break
+            self._waiters.popleft()
+            self._enter(writer)
+            future.set_result(None)
+
+
+class MusicServer:
+    """
+    Beantwortet Anfragen der Clients über einer MusicApp.
+
+    Die Methoden _op_<name> führen die Anfragen aus; sie laufen in einem Thread des Pools,
+    während die Ereignisschleife die Sperre hält. Die Laufzeit jeder Anfrage (einschließlich
+    der Wartezeit auf die Sperre) wird unter 'server/<op>' gemessen.
+    """
+
+    READ_OPERATIONS = ('search', 'filter', 'sorted', 'get', 'playlist', 'playlists', 'stats')
+    WRITE_OPERATIONS = ('add', 'delete', 'playlist_create', 'playlist_add', 'playlist_remove', 'save')
+    SEARCH_METHODS = ('binary', 'interpolation', 'jump', 'linear', 'prefix', 'fuzzy')
+
+    def __init__(self, app, workers=4):
+        """
+        Initialisiert den Server über einer geladenen Bibliothek.
+
+        Args:
+            app (MusicApp): Die Musik-App, auf die die Anfragen zugreifen.
+            workers (int): Die Anzahl Threads für lesende Anfragen.
+        """
+        self.app = app
+        self.lock = ReadWriteLock()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.instrumentation = Instrumentation()
+        self.handlers = {op: getattr(self, f'_op_{op}') for op in self.READ_OPERATIONS + self.WRITE_OPERATIONS}
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        #Nimmt Verbindungen an, bis der Server abgebrochen wird
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=LINE_LIMIT)
+        print(f"Server läuft auf {host}:{port} ({len(self.app.songs)} Songs).")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=True)
+
+    async def handle_connection(self, reader, writer):
+        """
+        Liest die Anfragezeilen einer Verbindung und beantwortet sie in derselben Reihenfolge.
+
+        Jede Zeile wird sofort als eigene Task bearbeitet, auch wenn frühere Antworten noch
+        ausstehen; ein zweiter Task schreibt die Antworten der Reihe nach.
+
+        Args:
+            reader (asyncio.StreamReader): Der lesende Teil der Verbindung.
+            writer (asyncio.StreamWriter): Der schreibende Teil der Verbindung.
+
+        Returns:
+            None
+        """
+        pending = asyncio.Queue(PIPELINE_DEPTH)
+        sender = asyncio.create_task(self._send_responses(pending, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ConnectionError, ValueError):  #Verbindung abgebrochen oder Zeile zu lang
+                    break
+                if not line:
+                    break
+                if line.strip():
+                    await pending.put(asyncio.create_task(self.handle_line(line)))
+        finally:
+            await pending.put(None)
+            try:
+                await sender
+            finally:
+                writer.close()  #Auch wenn das Schreiben der Antworten fehlschlug, die Verbindung nicht offen lassen
+                with contextlib.suppress(ConnectionError):
+                    await writer.wait_closed()
+
+    async def _send_responses(self, pending, writer):
+        #Schreibt die Antworten in der Reihenfolge der Anfragen; geleert wird erst, wenn keine weitere Antwort bereitliegt
+        connected = True
+        while True:
+            task = await pending.get()
+            if task is None:
+                return
+            response = await task
+            if not connected:
+                continue
+            writer.write(response)
+            if pending.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    connected = False
+
+    async def handle_line(self, line):
+        """
+        Bearbeitet eine Anfragezeile, eine einzelne Anfrage oder einen Batch.
+
+        Args:
+            line (bytes): Die Zeile mit einem JSON-Objekt oder einer JSON-Liste von Objekten.
+
+        Returns:
+            bytes: Die Antwortzeile.
+        """
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {'id': None, 'ok': False, 'error': f"Ungültiges JSON: {e}"}
+        else:
+            try:
+                if isinstance(request, list):
+                    response = await self.handle_batch(request)
+                else:
+                    response = await self.handle_request(request)
+            except Exception as e:  #Jede Zeile bekommt eine Antwort, sonst bliebe die Verbindung hängen
+                response = {'id': None, 'ok': False, 'error': f"Interner Fehler: {type(e).__name__}: {e}"}
+        return json.dumps(response, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    async def handle_batch(self, requests):
+        """
+        Bearbeitet die Anfragen eines Batchs in ihrer Reihenfolge.
+
+        Besteht der Batch nur aus lesenden Anfragen, deren Indizes bereits aufgebaut sind,
+        wird die Lesesperre nur einmal genommen und der ganze Batch in einem Thread bearbeitet.
+
+        Args:
+            requests (list): Die Anfragen.
+
+        Returns:
+            list: Die Antworten in derselben Reihenfolge.
+        """
+        if all(self._is_plain_read(request) for request in requests):
+            start = time.perf_counter_ns()
+            async with self.lock.reading():
+                if all(self._is_plain_read(request) for request in requests):
+                    responses = await self._run(lambda: [self.execute(request) for request in requests])
+                    self.instrumentation.record('server/batch', time.perf_counter_ns() - start)
+                    return responses
+        return [await self.handle_request(request) for request in requests]
+
+    async def handle_request(self, request):
+        """
+        Bearbeitet eine einzelne Anfrage unter der passenden Sperre.
+
+        Args:
+            request (dict): Die Anfrage mit 'op' und den Argumenten der Operation.
+
+        Returns:
+            dict: Die Antwort mit 'id', 'ok' und 'result' bzw. 'error'.
+        """
+        op = request.get('op') if isinstance(request, dict) else None
+        if not isinstance(op, str) or op not in self.handlers:
+            request_id = request.get('id') if isinstance(request, dict) else None
+            return {'id': request_id, 'ok': False, 'error': f"Unbekannte Operation '{op}'. Erlaubt: {', '.join(self.handlers)}"}
+        start = time.perf_counter_ns()
+        while True:
+            if self._is_plain_read(request):
+                async with self.lock.reading():
+                    #Ein Schreibvorgang vor dieser Anfrage kann einen Index verworfen haben
+                    if self._is_plain_read(request):
+                        response = await self._run(self.execute, request)
+                        break
+            else:
+                async with self.lock.writing():
+                    response = await self._run(self.execute, request)
+                    break
+        self.instrumentation.record(f"server/{request['op']}", time.perf_counter_ns() - start)
+        return response
+
+    async def _run(self, function, *args):
+        #Führt eine Funktion in einem Thread des Pools aus, damit die Ereignisschleife weiter Anfragen annimmt
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    def _is_plain_read(self, request):
+        #Prüft, ob eine Anfrage nur liest und dafür keinen Index mehr aufbauen muss; nur solche laufen gleichzeitig
+        if not isinstance(request, dict) or request.get('op') not in self.READ_OPERATIONS:
+            return False
+        op = request['op']
+        built = self.app.built_indexes()
+        if op == 'search':
+            method = request.get('method', 'binary')
+            if method == 'fuzzy':
+                return 'fuzzy' in built
+            field = request.get('field', 'title')
+            if method == 'linear' or field not in MusicApp.INDEX_FIELDS:
+                return True
+            if field not in built:
+                return False
+            return method != 'interpolation' or self.app.sorted_index(field).numbers_built()
+        if op == 'sorted':
+            field = request.get('field', 'title')
+            return field not in MusicApp.INDEX_FIELDS or field in built
+        if op == 'filter':
+            return 'query' in built
+        if op == 'get':
+            return 'songs_by_id' in built
+        return True
+
+    def execute(self, request):
+        """
+        Führt eine Anfrage aus; Fehler in den Argumenten werden zur Fehlerantwort.
+
+        Args:
+            request (dict): Die Anfrage mit einer bekannten Operation.
+
+        Returns:
+            dict: Die Antwort.
+        """
+        try:
+            result = self.handlers[request['op']](request)
+        except KeyError as e:
+            return {'id': request.get('id'), 'ok': False, 'error': f"Nicht gefunden oder Argument fehlt: {e.args[0]}"}
+        except (ValueError, TypeError, OverflowError) as e:  #OverflowError z.B. bei int(Infinity)
+            return {'id': request.get('id'), 'ok': False, 'error': str(e)}
+        except Exception as e:
+            return {'id': request.get('id'), 'ok': False, 'error': f"Interner Fehler: {type(e).__name__}: {e}"}
+        return {'id': request.get('id'), 'ok': True, 'result': result}
+
+    @staticmethod
+    def _limit(request, default):
+        #Anzahl der angeforderten Songs, auf MAX_LIMIT begrenzt
+        limit = int(request.get('limit', default))
+        if limit < 0:
+            raise ValueError("limit darf nicht negativ sein.")
+        return min(limit, MAX_LIMIT)
+
+    @staticmethod
+    def _field(request, fields=FIELDS):
+        field = request.get('field', 'title')
+        if field not in fields:
+            raise ValueError(f"Unbekanntes Feld '{field}'. Erlaubt: {', '.join(fields)}")
+        return field
+
+    def _song(self, request):
+        #Song der Bibliothek zur Song-Nummer der Anfrage
+        song = self.app.songs_by_id.get(int(request['song_id']))
+        if song is None:
+            raise KeyError(f"Song-Nummer {request['song_id']}")
+        return song
+
+    def _op_search(self, request):
+        value = str(request['value'])
+        method = request.get('method', 'binary')
+        if method not in self.SEARCH_METHODS:
+            raise ValueError(f"Unbekannte Suchmethode '{method}'. Erlaubt: {', '.join(self.SEARCH_METHODS)}")
+        limit = self._limit(request, MusicApp.PREFIX_LIMIT)
+        if method == 'fuzzy':
+            return [dict(song_to_dict(song), score=round(score, 3)) for song, score in self.app.fuzzy_search(value, limit)]
+        if method == 'prefix':
+            return [song_to_dict(song) for song in self.app.prefix_search(value, self._field(request, MusicApp.INDEX_FIELDS), limit)]
+        fields = FIELDS if method == 'linear' else MusicApp.INDEX_FIELDS
+        #Die Proben werden je Anfrage zurückgegeben statt über das von allen Lesern geteilte last_search_probes
+        song, probes = self.app.counted_search(method, value, self._field(request, fields))
+        return None if song is None else dict(song_to_dict(song), probes=probes)
+
+    def _op_filter(self, request):
+        conditions = request.get('conditions')
+        if conditions is None:
+            conditions = parse_query(str(request['query']))
+        if not isinstance(conditions, dict):
+            raise ValueError("conditions muss ein Objekt feld -> wert sein.")
+        return [song_to_dict(song) for song in islice(self.app.filter_songs(**conditions), self._limit(request, MusicApp.PAGE_SIZE))]
+
+    def _op_sorted(self, request):
+        #Seite der nach einem Feld sortierten Bibliothek, gelesen als Ausschnitt des sortierten Index
+        index = self.app.sorted_index(self._field(request, MusicApp.INDEX_FIELDS))
+        offset = max(int(request.get('offset', 0)), 0)
+        limit = self._limit(request, MusicApp.PAGE_SIZE)
+        total = len(index)
+        if request.get('descending'):
+            stop = max(total - offset, 0)
+            songs = index[max(stop - limit, 0):stop][::-1]
+        else:
+            songs = index[offset:offset + limit]
+        return {'total': total, 'songs': [song_to_dict(song) for song in songs]}
+
+    def _op_get(self, request):
+        return song_to_dict(self._song(request))
+
+    def _op_playlist(self, request):
+        playlist = self.app.playlists[request['name']]
+        return {'name': playlist.name, 'songs': [song_to_dict(song) for song in playlist]}
+
+    def _op_playlists(self, request):
+        return [{'name': playlist.name, 'size': len(playlist)} for playlist in self.app.playlists.values()]
+
+    def _op_stats(self, request):
+        return {
+            'songs': len(self.app.songs),
+            'playlists': len(self.app.playlists),
+            'indexes': self.app.built_indexes(),
+            'latency': self.instrumentation.snapshot(),
+        }
+
+    def _op_add(self, request):
+        fields = [str(request[field]) for field in FIELDS]
+        return song_to_dict(self.app.add_song(*fields))
+
+    def _op_delete(self, request):
+        song = self.app.delete_song(str(request['title']))
+        return None if song is None else song_to_dict(song)
+
+    def _op_playlist_create(self, request):
+        playlist = self.app.new_playlist(str(request['name']))
+        return {'name': playlist.name, 'size': len(playlist)}
+
+    def _op_playlist_add(self, request):
+        return self.app.add_to_playlist(request['name'], self._song(request))
+
+    def _op_playlist_remove(self, request):
+        return self.app.remove_from_playlist(request['name'], self._song(request))
+
+    def _op_save(self, request):
+        self.app.save_data()
+        return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lokaler Server für die Musikbibliothek (JSON-Zeilen über TCP).")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="Adresse, an die der Server gebunden wird (Standard: nur lokal)")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--backend', default='node', choices=sorted(MusicApp.TREE_BACKENDS))
+    parser.add_argument('--workers', type=int, default=4, help="Threads für lesende Anfragen")
+    args = parser.parse_args(argv)
+    app = MusicApp(args.backend)
+    #Die geladene Bibliothek bleibt bestehen: aus der Garbage Collection nehmen, damit volle
+    #Sammelläufe nicht bei jeder Anfrage alle Songs durchlaufen und die Latenz springt
+    gc.freeze()
+    server = MusicServer(app, args.workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("Server beendet.")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,29 @@
+import sys
+
+
 class Song:
-    def __init__(self, title, artist, album, genre):
+    #Feste Attribute ohne __dict__ pro Instanz spart Speicher bei großen Bibliotheken
+    __slots__ = ('title', 'artist', 'album', 'genre', 'song_id')
+
+    def __init__(self, title, artist, album, genre, song_id=None):
         """
         Initialisiert ein Song-Objekt.
 
+        Künstler, Album und Genre wiederholen sich in echten Bibliotheken häufig und werden
+        deshalb interniert, sodass gleiche Werte nur einmal im Speicher liegen.
+
         Args:
             title (str): Der Titel des Songs.
             artist (str): Der Künstler des Songs.
             album (str): Das Album, zu dem der Song gehört.
             genre (str): Das Genre des Songs.
+            song_id (int): Die eindeutige Nummer des Songs in der Bibliothek (None außerhalb einer Bibliothek).
         """
         self.title = title
-        self.artist = artist
-        self.album = album
-        self.genre = genre
+        self.artist = sys.intern(artist)
+        self.album = sys.intern(album)
+        self.genre = sys.intern(genre)
+        self.song_id = song_id
 
     def __str__(self):
         #Gibt eine lesbare Darstellung des Songs zurück
@@ -0,0 +1,76 @@
+import csv
+import os
+from itertools import islice
+
+BATCH_SIZE = 10000  #Anzahl Zeilen, die pro Batch gelesen werden
+
+FIELD_COUNT = 4  #Titel, Künstler, Album, Genre
+
+
+def read_song_batches(filename, batch_size=BATCH_SIZE):
+    """
+    Liest den Song-Snapshot als CSV in Batches fester Größe.
+
+    Die Datei wird batchweise gelesen, sodass nie die ganze Datei im Speicher liegt. Enthält ein
+    Batch kein Anführungszeichen, kann kein Feld maskiert sein und die Zeilen werden direkt am
+    Komma geteilt; sonst übernimmt das csv-Modul, damit Felder mit Kommas, Anführungszeichen
+    oder Zeilenumbrüchen korrekt zusammengesetzt werden. Zeilen mit falscher Feldanzahl werden
+    mit einer Warnung übersprungen.
+
+    Args:
+        filename (str): Der Pfad der CSV-Datei.
+        batch_size (int): Die Anzahl Zeilen, die pro Batch gelesen werden.
+
+    Returns:
+        generator: Listen mit den Feldern (Titel, Künstler, Album, Genre) je Song.
+    """
+    line_number = 0
+    with open(filename, 'r', newline='', encoding='utf-8') as file:
+        while True:
+            lines = list(islice(file, batch_size))
+            if not lines:
+                break
+            quotes = ''.join(lines).count('"')
+            while quotes % 2:
+                #Ein maskiertes Feld mit Zeilenumbruch reicht über das Batch-Ende hinaus
+                line = file.readline()
+                if not line:
+                    break
+                lines.append(line)
+                quotes += line.count('"')
+
+            if quotes:
+                reader = csv.reader(lines)
+                rows = [(row, reader.line_num) for row in reader]
+            else:
+                rows = [(line.rstrip('\r\n').split(','), offset + 1) for offset, line in enumerate(lines)]
+            batch = []
+            for row, offset in rows:
+                if len(row) == FIELD_COUNT:
+                    batch.append(row)
+                elif row and row != ['']:
+                    print(f"Warnung: Zeile {line_number + offset} in {filename} hat {len(row)} statt {FIELD_COUNT} Felder und wird übersprungen.")
+            line_number += len(lines)
+            if batch:
+                yield batch
+
+
+def write_songs(filename, songs):
+    """
+    Schreibt die Songs als CSV-Snapshot, Felder mit Kommas oder Anführungszeichen werden maskiert.
+
+    Geschrieben wird zuerst in eine temporäre Datei, die danach die alte Datei ersetzt, damit
+    ein Abbruch beim Schreiben keinen halben Snapshot hinterlässt.
+
+    Args:
+        filename (str): Der Pfad der CSV-Datei.
+        songs (list): Die zu speichernden Songs.
+
+    Returns:
+        int: Die Anzahl der geschriebenen Songs.
+    """
+    temporary = filename + '.tmp'
+    with open(temporary, 'w', newline='', encoding='utf-8') as file:
+        csv.writer(file).writerows((song.title, song.artist, song.album, song.genre) for song in songs)
+    os.replace(temporary, filename)
+    return len(songs)
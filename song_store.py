@@ -0,0 +1,146 @@
+import sys
+from array import array
+
+from song import Song
+
+
+class SongStore:
+    """
+    Spaltenorientierte Ablage vieler Songs.
+
+    Titel werden als Liste gespeichert, Künstler, Album und Genre per Wörterbuch-Kodierung:
+    jeder unterschiedliche Wert liegt einmal in einer Werteliste, die Zeilen speichern nur
+    den Code als Eintrag eines Integer-Arrays. Nach außen gibt der Store leichte SongView-
+    Objekte heraus, die sich wie ein Song verhalten.
+    """
+
+    CODED_FIELDS = ('artist', 'album', 'genre')
+
+    def __init__(self):
+        #Initialisiert einen leeren Store
+        self.titles = []
+        self.values = {field: [] for field in self.CODED_FIELDS}  #Code -> Wert
+        self.codes = {field: {} for field in self.CODED_FIELDS}   #Wert -> Code
+        self.columns = {field: array('I') for field in self.CODED_FIELDS}
+        self.ids = array('q')  #Song-Nummer je Zeile, -1 ohne Nummer
+        #Eigene Sicht-Klasse je Store, damit die Sichten selbst nur die Zeilennummer tragen
+        self.view_class = type('StoreSongView', (SongView,), {'__slots__': (), '_store': self})
+
+    def __len__(self):
+        return len(self.titles)
+
+    def _encode(self, field, value):
+        #Gibt den Code eines Werts zurück und legt ihn bei Bedarf neu an
+        codes = self.codes[field]
+        code = codes.get(value)
+        if code is None:
+            code = len(self.values[field])
+            codes[value] = code
+            self.values[field].append(value)
+        return code
+
+    def append(self, title, artist, album, genre, song_id=None):
+        """
+        Fügt eine Zeile hinzu und gibt eine Sicht darauf zurück.
+
+        Args:
+            title (str): Der Titel des Songs.
+            artist (str): Der Künstler des Songs.
+            album (str): Das Album, zu dem der Song gehört.
+            genre (str): Das Genre des Songs.
+            song_id (int): Die eindeutige Nummer des Songs oder None.
+
+        Returns:
+            SongView: Die Sicht auf die neue Zeile.
+        """
+        row = len(self.titles)
+        self.titles.append(title)
+        self.columns['artist'].append(self._encode('artist', artist))
+        self.columns['album'].append(self._encode('album', album))
+        self.columns['genre'].append(self._encode('genre', genre))
+        self.ids.append(-1 if song_id is None else song_id)
+        return self.view_class(row)
+
+    def value(self, field, row):
+        #Dekodiert den Wert eines kodierten Felds für eine Zeile
+        return self.values[field][self.columns[field][row]]
+
+    def get_size(self):
+        """
+        Berechnet den Speicherbedarf der Spalten und Wertelisten (ohne die SongView-Objekte).
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        size = sys.getsizeof(self.titles) + sum(sys.getsizeof(title) for title in self.titles) + sys.getsizeof(self.ids)
+        for field in self.CODED_FIELDS:
+            size += sys.getsizeof(self.columns[field]) + sys.getsizeof(self.codes[field])
+            size += sys.getsizeof(self.values[field]) + sum(sys.getsizeof(value) for value in self.values[field])
+        return size
+
+
+class SongView(int):
+    """
+    Leichte Sicht auf eine Zeile eines SongStore mit derselben Schnittstelle wie Song.
+
+    Die Sicht ist selbst die Zeilennummer (eine int-Unterklasse ohne weitere Attribute);
+    der zugehörige Store hängt an der von SongStore erzeugten Unterklasse. So kostet eine
+    Sicht nur ein kleines Integer-Objekt statt eines Objekts mit Store- und Zeilenverweis.
+    """
+
+    __slots__ = ()
+    _store = None
+
+    @property
+    def title(self):
+        return self._store.titles[self]
+
+    @property
+    def artist(self):
+        return self._store.value('artist', self)
+
+    @property
+    def album(self):
+        return self._store.value('album', self)
+
+    @property
+    def genre(self):
+        return self._store.value('genre', self)
+
+    @property
+    def song_id(self):
+        song_id = self._store.ids[self]
+        return None if song_id < 0 else song_id
+
+    def __bool__(self):
+        #Eine Sicht ist immer wahr, auch für Zeile 0 (z.B. bei "if song:")
+        return True
+
+    def __repr__(self):
+        return f"SongView({int(self)}: {self.title!r})"
+
+    def __str__(self):
+        #Gibt eine lesbare Darstellung des Songs zurück
+        return f"{self.title} von {self.artist} - Album: {self.album}, Genre: {self.genre}"
+
+    def __lt__(self, other):
+        #Vergleichsoperator für weniger als, basierend auf dem Titel
+        return self.title < other.title
+
+    def __eq__(self, other):
+        #Vergleichsoperator für Gleichheit, basierend auf dem Titel
+        return self.title == other.title
+
+    def to_dict(self):
+        #Konvertiert die Sicht in ein Wörterbuch wie Song.to_dict
+        return {
+            "title": self.title,
+            "artist": self.artist,
+            "album": self.album,
+            "genre": self.genre
+        }
+
+    @staticmethod
+    def from_dict(data):
+        #Erstellt aus einem Wörterbuch einen eigenständigen Song
+        return Song.from_dict(data)
@@ -0,0 +1,367 @@
+import math
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain, islice
+from operator import attrgetter
+
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'  #Ziffern, die int(text, basis) versteht
+NUMBER_BITS = 64  #Breite der Zahlenwerte (array-Typ 'Q')
+
+
+def numeric_encoder(keys):
+    """
+    Wählt eine ordnungserhaltende Abbildung der Schlüssel auf ganze Zahlen mit 64 Bit.
+
+    Kommen in den Schlüsseln höchstens 35 verschiedene Zeichen vor (z.B. A-Z bei den
+    Zufallsdaten), wird jedes Zeichen auf eine Ziffer zur Basis "Anzahl Zeichen + 1" abgebildet
+    (0 steht für das Ende des Schlüssels) und die ersten Zeichen als Zahl gelesen. Sonst
+    werden die ersten 8 Bytes der UTF-8-Kodierung zur Basis 256 gelesen. In beiden Fällen
+    folgt aus a < b für die Schlüssel, dass die Zahl von a höchstens so groß ist wie die von b.
+
+    Args:
+        keys (list): Blöcke mit den Schlüsseln des Index.
+
+    Returns:
+        tuple: Die Kodierfunktion und das Alphabet (set) bzw. None, wenn jeder Schlüssel kodierbar ist.
+    """
+    alphabet = set(''.join(map(''.join, keys)))
+    if len(alphabet) < len(DIGITS):
+        base = max(len(alphabet), 1) + 1
+        width = int(NUMBER_BITS / math.log2(base))  #Anzahl Zeichen, die in 64 Bit passen
+        table = {ord(char): DIGITS[digit] for digit, char in enumerate(sorted(alphabet), 1)}
+        return (lambda key: int(key[:width].translate(table).ljust(width, '0'), base)), alphabet
+    width = NUMBER_BITS // 8
+    return (lambda key: int.from_bytes(key.encode('utf-8')[:width].ljust(width, b'\0'), 'big')), None
+
+
+class SortedIndex:
+    """
+    Sortierter Index über ein Attribut der Songs (z.B. 'title', 'artist', 'genre').
+
+    Die Songs werden in Blöcken begrenzter Größe gehalten. Über die größten Schlüssel
+    der Blöcke wird binär gesucht, sodass Einfügen und Löschen in O(log n) den Block
+    finden und nur innerhalb eines kleinen Blocks verschieben müssen, statt die ganze
+    Liste neu zu sortieren.
+    """
+
+    LOAD = 1000  #Zielgröße eines Blocks, ab 2 * LOAD wird ein Block geteilt
+
+    def __init__(self, attribute, songs=None):
+        """
+        Initialisiert einen leeren Index und fügt optional Songs hinzu.
+
+        Args:
+            attribute (str): Das Song-Attribut, nach dem sortiert wird.
+            songs (list): Optionale Songs, die direkt eingefügt werden.
+        """
+        self.attribute = attribute
+        self._key = attrgetter(attribute)
+        self._keys = []     #Blöcke mit den Schlüsseln
+        self._songs = []    #Blöcke mit den Songs, parallel zu _keys
+        self._maxes = []    #Größter Schlüssel je Block
+        self._offsets = None  #Startposition je Block, wird bei Bedarf berechnet
+        self._numbers = None  #Blöcke mit den Schlüsseln als Zahlen, bei der ersten Interpolationssuche berechnet
+        self._encode = None   #Kodierfunktion der Zahlenwerte
+        self._alphabet = None  #Zeichen, die die Kodierung abbildet (None: alle)
+        self._len = 0
+        if songs:
+            self.update(songs)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return chain.from_iterable(self._songs)
+
+    def __getitem__(self, index):
+        #Positionszugriff wie bei einer sortierten Liste
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                if start >= stop:
+                    return []
+                #Ab dem Block der Startposition lesen, statt alle vorherigen Songs zu überspringen
+                block, position = self._locate(start)
+                songs = chain(self._songs[block][position:], chain.from_iterable(islice(self._songs, block + 1, None)))
+                return list(islice(songs, stop - start))
+            return list(self)[index]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedIndex-Index außerhalb des gültigen Bereichs")
+        block, position = self._locate(index)
+        return self._songs[block][position]
+
+    def _locate(self, index):
+        #Bestimmt Block und Position innerhalb des Blocks für eine globale Position
+        if self._offsets is None:
+            offsets = []
+            total = 0
+            for keys in self._keys:
+                offsets.append(total)
+                total += len(keys)
+            self._offsets = offsets
+        block = bisect_right(self._offsets, index) - 1
+        return block, index - self._offsets[block]
+
+    def insert(self, song):
+        """
+        Fügt einen Song an der passenden Position ein.
+
+        Args:
+            song (Song): Der einzufügende Song.
+
+        Returns:
+            None
+        """
+        key = self._key(song)
+        if not self._maxes:
+            self._keys.append([key])
+            self._songs.append([song])
+            self._maxes.append(key)
+            self._numbers = None
+        else:
+            block = bisect_right(self._maxes, key)
+            if block == len(self._maxes):
+                block -= 1
+                self._maxes[block] = key
+            keys = self._keys[block]
+            position = bisect_right(keys, key)
+            keys.insert(position, key)
+            self._songs[block].insert(position, song)
+            if self._numbers is not None:
+                if self._alphabet is None or self._alphabet.issuperset(key):
+                    self._numbers[block].insert(position, self._encode(key))
+                else:
+                    self._numbers = None  #Neues Zeichen: die Kodierung wird bei Bedarf neu gewählt
+            if len(keys) > 2 * self.LOAD:
+                self._split(block)
+        self._len += 1
+        self._offsets = None
+
+    def _split(self, block):
+        #Teilt einen zu großen Block in zwei Hälften
+        keys = self._keys[block]
+        songs = self._songs[block]
+        half = len(keys) // 2
+        self._keys[block:block + 1] = [keys[:half], keys[half:]]
+        self._songs[block:block + 1] = [songs[:half], songs[half:]]
+        self._maxes[block:block + 1] = [keys[half - 1], keys[-1]]
+        if self._numbers is not None:
+            numbers = self._numbers[block]
+            self._numbers[block:block + 1] = [numbers[:half], numbers[half:]]
+
+    def remove(self, song):
+        """
+        Entfernt genau dieses Song-Objekt aus dem Index.
+
+        Args:
+            song (Song): Der zu entfernende Song.
+
+        Returns:
+            bool: True, wenn der Song gefunden und entfernt wurde, sonst False.
+        """
+        key = self._key(song)
+        block = bisect_left(self._maxes, key)
+        while block < len(self._maxes):
+            keys = self._keys[block]
+            songs = self._songs[block]
+            position = bisect_left(keys, key)
+            while position < len(keys) and keys[position] == key:
+                if songs[position] is song:
+                    del keys[position]
+                    del songs[position]
+                    if self._numbers is not None:
+                        del self._numbers[block][position]
+                    if keys:
+                        self._maxes[block] = keys[-1]
+                    else:
+                        del self._keys[block]
+                        del self._songs[block]
+                        del self._maxes[block]
+                        if self._numbers is not None:
+                            del self._numbers[block]
+                    self._len -= 1
+                    self._offsets = None
+                    return True
+                position += 1
+            if position < len(keys):
+                break
+            block += 1
+        return False
+
+    def prefix(self, prefix, limit=None):
+        """
+        Gibt die Songs zurück, deren Schlüssel mit dem Präfix beginnt, in sortierter Reihenfolge.
+
+        Alle passenden Schlüssel liegen im Index direkt hintereinander: ab der Position, die eine
+        Binärsuche nach dem Präfix liefert, wird gelesen, bis ein Schlüssel nicht mehr mit dem
+        Präfix beginnt oder das Limit erreicht ist.
+
+        Args:
+            prefix (str): Der Anfang des Schlüssels.
+            limit (int): Die maximale Anzahl Songs oder None für alle Treffer.
+
+        Returns:
+            list: Die passenden Songs.
+        """
+        result = []
+        if limit is not None and limit <= 0:
+            return result
+        block = bisect_left(self._maxes, prefix)
+        position = bisect_left(self._keys[block], prefix) if block < len(self._keys) else 0
+        while block < len(self._keys):
+            keys = self._keys[block]
+            songs = self._songs[block]
+            for position in range(position, len(keys)):
+                if not keys[position].startswith(prefix):
+                    return result
+                result.append(songs[position])
+                if len(result) == limit:
+                    return result
+            block += 1
+            position = 0
+        return result
+
+    def build_numbers(self):
+        """
+        Berechnet die Zahlenwerte aller Schlüssel für die Interpolationssuche.
+
+        Die Zahlen liegen in Blöcken parallel zu den Schlüsseln und werden danach beim
+        Einfügen und Löschen mitgeführt.
+
+        Returns:
+            None
+        """
+        self._encode, self._alphabet = numeric_encoder(self._keys)
+        self._numbers = [array('Q', map(self._encode, keys)) for keys in self._keys]
+
+    def numbers_built(self):
+        #Prüft, ob die Zahlenwerte für die Interpolationssuche bereits berechnet sind
+        return self._numbers is not None
+
+    def _number(self, index):
+        #Zahlenwert des Schlüssels an einer globalen Position
+        block, position = self._locate(index)
+        return self._numbers[block][position]
+
+    def interpolation_search(self, key):
+        """
+        Sucht einen Schlüssel per Interpolation über die Zahlenwerte der Schlüssel.
+
+        Statt in der Mitte wird dort geprüft, wo der Schlüssel bei gleichmäßig verteilten
+        Zahlenwerten liegen müsste; bei gleichmäßig verteilten Schlüsseln genügen so etwa
+        O(log log n) Proben. Haben zwei Proben nacheinander weniger als die Hälfte des Bereichs
+        ausgeschlossen (ungleichmäßige Verteilung), folgt ein Schritt der Binärsuche, sodass
+        auch im ungünstigen Fall O(log n) Proben genügen.
+
+        Args:
+            key (str): Der gesuchte Schlüssel.
+
+        Returns:
+            tuple: Der gefundene Song (oder None) und die Anzahl der Proben.
+        """
+        if self._numbers is None:
+            self.build_numbers()
+        if self._alphabet is not None and not self._alphabet.issuperset(key):
+            return None, 0  #Ein Zeichen, das in keinem Schlüssel vorkommt
+        target = self._encode(key)
+        low = 0
+        high = self._len - 1
+        probes = 0
+        slow_steps = 0  #Proben in Folge, die weniger als die Hälfte ausgeschlossen haben
+        while low <= high:
+            low_number = self._number(low)
+            high_number = self._number(high)
+            if target < low_number or target > high_number:
+                break
+            probes += 1
+            if slow_steps >= 2 or low_number == high_number:
+                position = (low + high) // 2
+            else:
+                position = low + (target - low_number) * (high - low) // (high_number - low_number)
+            width = high - low
+            number = self._number(position)
+            if number < target:
+                low = position + 1
+            elif number > target:
+                high = position - 1
+            else:
+                return self._match(key, target, position, probes)
+            slow_steps = slow_steps + 1 if 2 * (high - low) > width else 0
+        return None, probes
+
+    def _match(self, key, target, position, probes):
+        #Vergleicht bei gleichem Zahlenwert den ganzen Schlüssel; nur Schlüssel, die länger als
+        #der kodierte Anfang sind, können denselben Zahlenwert wie ein anderer Schlüssel haben
+        block, offset = self._locate(position)
+        if self._keys[block][offset] == key:
+            return self._songs[block][offset], probes
+        for step in (-1, 1):
+            index = position + step
+            while 0 <= index < self._len and self._number(index) == target:
+                probes += 1
+                block, offset = self._locate(index)
+                if self._keys[block][offset] == key:
+                    return self._songs[block][offset], probes
+                index += step
+        return None, probes
+
+    def update(self, songs):
+        """
+        Fügt viele Songs auf einmal ein und baut die Blöcke in einem Durchlauf neu auf.
+
+        Args:
+            songs (list): Die einzufügenden Songs.
+
+        Returns:
+            None
+        """
+        merged = sorted(chain(self, songs), key=self._key)
+        self._set_sorted(merged)
+
+    def set_sorted(self, songs, keys=None):
+        """
+        Ersetzt den Inhalt durch bereits sortierte Songs, ohne erneut zu sortieren.
+
+        Args:
+            songs (list): Die nach dem Attribut sortierten Songs.
+            keys (list): Optional die Schlüssel der Songs in derselben Reihenfolge.
+
+        Returns:
+            None
+        """
+        self._set_sorted(songs, keys)
+
+    def _set_sorted(self, songs, keys=None):
+        #Baut die Blöcke aus einer bereits sortierten Songliste auf
+        load = self.LOAD
+        self._songs = [songs[i:i + load] for i in range(0, len(songs), load)]
+        if keys is None:
+            key = self._key
+            self._keys = [[key(song) for song in block] for block in self._songs]
+        else:
+            self._keys = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._len = len(songs)
+        self._offsets = None
+        self._numbers = None
+
+    def clear(self):
+        #Entfernt alle Songs aus dem Index
+        self._set_sorted([])
+
+    def get_size(self):
+        """
+        Berechnet den Speicherbedarf der Indexstruktur (ohne die Songs selbst).
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        size = sys.getsizeof(self._keys) + sys.getsizeof(self._songs) + sys.getsizeof(self._maxes)
+        for keys, songs in zip(self._keys, self._songs):
+            size += sys.getsizeof(keys) + sys.getsizeof(songs)
+        if self._numbers is not None:
+            size += sys.getsizeof(self._numbers) + sum(map(sys.getsizeof, self._numbers))
+        return size
@@ -0,0 +1,61 @@
+"""
+Regressionstest: Im spaltenorientierten Modus (MusicApp(columnar=True)) werden die Songs
+gespeichert und nach einem Neustart vollständig wieder geladen.
+
+Aufruf: python -m unittest discover tests
+"""
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from music_app import MusicApp
+
+
+class ColumnarSaveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.app_class = type('TestMusicApp', (MusicApp,), {
+            'FILENAME': os.path.join(self.directory, 'songs.csv'),
+            'BINARY_FILENAME': os.path.join(self.directory, 'songs.bin'),
+            'JOURNAL_FILENAME': os.path.join(self.directory, 'songs.journal'),
+            'PLAYLIST_DIRECTORY': os.path.join(self.directory, 'playlists'),
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open_app(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.app_class(columnar=True)
+
+    @staticmethod
+    def rows(app):
+        return sorted((song.song_id, song.title, song.artist, song.album, song.genre) for song in app.songs)
+
+    def test_save_and_reload(self):
+        random.seed(3)
+        app = self.open_app()
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.create_random_songs(50)
+        self.assertTrue(os.path.exists(app.BINARY_FILENAME))
+        reopened = self.open_app()
+        self.assertEqual(self.rows(reopened), self.rows(app))
+
+        #Gemischte Bibliothek: Sichten auf den gemappten Snapshot und auf den SongStore
+        with contextlib.redirect_stdout(io.StringIO()):
+            reopened.add_song('Neu', 'Artist', 'Album', 'Genre')
+            reopened.save_data()
+        self.assertEqual(list(reopened.journal.replay()), [])
+        self.assertEqual(self.rows(self.open_app()), self.rows(reopened))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Regressionstests für das Änderungsprotokoll: gelöschte Songs werden über ihre Song-Nummer
+protokolliert und beim Laden wiederhergestellt, auch wenn mehrere Songs denselben Titel haben.
+
+Aufruf: python -m unittest discover tests
+"""
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from journal import SongJournal
+from music_app import MusicApp
+
+
+class JournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.app_class = type('TestMusicApp', (MusicApp,), {
+            'FILENAME': os.path.join(self.directory, 'songs.csv'),
+            'BINARY_FILENAME': os.path.join(self.directory, 'songs.bin'),
+            'JOURNAL_FILENAME': os.path.join(self.directory, 'songs.journal'),
+            'PLAYLIST_DIRECTORY': os.path.join(self.directory, 'playlists'),
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open_app(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.app_class()
+
+    def test_delete_replays_exact_song(self):
+        app = self.open_app()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for artist in ('A', 'B', 'C'):
+                app.add_song('Same', artist, 'Album', 'Genre')
+            deleted = app.delete_song('Same')
+        entries = list(app.journal.replay())
+        self.assertEqual(entries[-1], (SongJournal.DELETE, [str(deleted.song_id)]))
+
+        reopened = self.open_app()
+        remaining = {(song.song_id, song.artist) for song in reopened.songs}
+        self.assertEqual(remaining, {(song.song_id, song.artist) for song in app.songs})
+        self.assertNotIn(deleted.song_id, reopened.songs_by_id)
+
+    def test_replay_after_interrupted_save(self):
+        #Bricht save_data nach dem Snapshot ab, bleibt das Protokoll stehen und darf keine Songs verdoppeln
+        app = self.open_app()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for title in ('One', 'Two', 'Three'):
+                app.add_song(title, 'Artist', 'Album', 'Genre')
+            with mock.patch.object(app, 'save_playlists', side_effect=OSError('Datenträger voll')):
+                app.save_data()
+            self.assertTrue(list(app.journal.replay()))
+            app.add_song('Four', 'Artist', 'Album', 'Genre')
+
+        reopened = self.open_app()
+        self.assertEqual(sorted((song.song_id, song.title) for song in reopened.songs),
+                         sorted((song.song_id, song.title) for song in app.songs))
+        with contextlib.redirect_stdout(io.StringIO()):
+            added = reopened.add_song('Five', 'Artist', 'Album', 'Genre')
+        self.assertEqual(added.song_id, 4)
+
+    def test_legacy_add_without_id(self):
+        app = self.open_app()
+        app.journal.append(SongJournal.ADD_WITHOUT_ID, 'Old', 'A', 'Album', 'Genre')
+
+        reopened = self.open_app()
+        self.assertEqual([(song.song_id, song.title) for song in reopened.songs], [(0, 'Old')])
+
+    def test_legacy_title_delete(self):
+        app = self.open_app()
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.add_song('Old', 'A', 'Album', 'Genre')
+            app.add_song('Kept', 'B', 'Album', 'Genre')
+        app.journal.append(SongJournal.DELETE_TITLE, 'Old')
+
+        reopened = self.open_app()
+        self.assertEqual([song.title for song in reopened.songs], ['Kept'])
+
+
+if __name__ == '__main__':
+    unittest.main()
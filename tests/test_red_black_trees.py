@@ -0,0 +1,105 @@
+"""
+Prüft die drei Rot-Schwarz-Baum-Backends mit zufälligem Einfügen und Löschen gegen eine
+sortierte Liste als Orakel: nach jedem Schritt validate(), dazu rank, select und page.
+
+Aufruf: python -m unittest discover tests
+"""
+import bisect
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from array_red_black_tree import ArrayRedBlackTree
+from persistent_red_black_tree import PersistentRedBlackTree
+from red_black_tree import RedBlackTree
+from song import Song
+
+BACKENDS = (RedBlackTree, ArrayRedBlackTree, PersistentRedBlackTree)
+
+
+class RedBlackTreeChurnTest(unittest.TestCase):
+
+    def assert_matches(self, tree, songs):
+        #Vergleicht den Baum mit den nach Titel sortierten Songs des Orakels
+        titles = sorted(song.title for song in songs)
+        tree.validate()
+        self.assertEqual(len(tree), len(titles))
+        self.assertEqual([song.title for song in tree.inorder()], titles)
+        self.assertEqual(sorted(map(id, tree.inorder())), sorted(map(id, songs)))
+        for title in ('', 'M', 'ZZZ', *titles[::7]):
+            self.assertEqual(tree.rank(title), bisect.bisect_left(titles, title))
+        for k in range(-1, len(titles) + 1):
+            song = tree.select(k)
+            self.assertEqual(None if song is None else song.title, titles[k] if 0 <= k < len(titles) else None)
+        for offset, limit in ((0, 5), (len(titles) // 2, 10), (max(len(titles) - 3, 0), 10), (len(titles), 5)):
+            self.assertEqual([song.title for song in tree.page(offset, limit)], titles[offset:offset + limit])
+
+    def test_random_churn(self):
+        for tree_class in BACKENDS:
+            with self.subTest(backend=tree_class.__name__):
+                rng = random.Random(7)
+                tree = tree_class()
+                songs = []
+                for step in range(600):
+                    if songs and rng.random() < 0.45:
+                        song = songs.pop(rng.randrange(len(songs)))
+                        self.assertTrue(tree.delete(song))
+                    else:
+                        #Wenige Buchstaben, damit viele Songs denselben Titel haben
+                        song = Song(''.join(rng.choices('ABCDE', k=2)), 'Artist', 'Album', 'Genre', step)
+                        tree.insert(song)
+                        songs.append(song)
+                    if step % 25 == 0:
+                        self.assert_matches(tree, songs)
+                self.assert_matches(tree, songs)
+                while songs:
+                    tree.delete(songs.pop(rng.randrange(len(songs))))
+                self.assert_matches(tree, songs)
+
+    def test_delete_other_song_with_same_title(self):
+        for tree_class in BACKENDS:
+            with self.subTest(backend=tree_class.__name__):
+                songs = [Song(title, 'Artist', 'Album', 'Genre', song_id) for song_id, title in enumerate('ABBC')]
+                tree = tree_class.from_sorted(songs)
+                self.assertFalse(tree.delete(Song('B', 'Artist', 'Album', 'Genre', 9)))
+                self.assert_matches(tree, songs)
+                self.assertTrue(tree.delete(songs[2]))
+                self.assert_matches(tree, songs[:2] + songs[3:])
+
+    def test_persistent_versions_unchanged(self):
+        #Festgehaltene Versionen bleiben nach weiteren Änderungen unverändert gültig
+        rng = random.Random(5)
+        tree = PersistentRedBlackTree()
+        songs = []
+        versions = []
+        for step in range(300):
+            if songs and rng.random() < 0.4:
+                tree.delete(songs.pop(rng.randrange(len(songs))))
+            else:
+                song = Song(''.join(rng.choices('ABCDE', k=2)), 'Artist', 'Album', 'Genre', step)
+                tree.insert(song)
+                songs.append(song)
+            if step % 30 == 0:
+                versions.append((tree.snapshot(), list(songs)))
+        for version, version_songs in versions:
+            self.assert_matches(version, version_songs)
+        tree.restore(versions[0][0])
+        self.assert_matches(tree, versions[0][1])
+
+    def test_bulk_insert(self):
+        for tree_class in BACKENDS:
+            with self.subTest(backend=tree_class.__name__):
+                rng = random.Random(3)
+                songs = [Song(''.join(rng.choices('ABCDEFG', k=3)), 'Artist', 'Album', 'Genre', song_id)
+                         for song_id in range(300)]
+                tree = tree_class.from_sorted(sorted(songs[:200], key=lambda song: song.title))
+                tree.bulk_insert(songs[200:210])  #Wenige Songs werden einzeln eingefügt
+                tree.bulk_insert(songs[210:])     #Viele Songs bauen den Baum neu auf
+                self.assert_matches(tree, songs)
+
+
+if __name__ == '__main__':
+    unittest.main()
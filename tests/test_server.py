@@ -0,0 +1,81 @@
+"""
+Regressionstest für server.py: fehlerhafte Anfragen (z.B. Infinity als Zahl, das json.loads
+annimmt) werden mit einer Fehlerantwort beantwortet und lassen die Verbindung weiterlaufen.
+
+Aufruf: python -m unittest discover tests
+"""
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from music_app import MusicApp
+from server import MusicServer
+
+MALFORMED = [
+    b'{"id": 1, "op": "get", "song_id": Infinity}',
+    b'{"id": 2, "op": "sorted", "field": "title", "limit": Infinity}',
+    b'{"id": 3, "op": "sorted", "field": "title", "offset": -Infinity}',
+    b'{"id": 4, "op": "filter", "conditions": {"artist": "A"}, "limit": NaN}',
+    b'{"id": 5, "op": ["search"]}',
+    b'[{"id": 6, "op": "get", "song_id": Infinity}, {"id": 7, "op": "stats"}]',
+    b'42',
+    b'{"id": 8, "op": "search"',
+]
+
+
+class ServerMalformedRequestTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        app_class = type('TestMusicApp', (MusicApp,), {
+            'FILENAME': os.path.join(self.directory, 'songs.csv'),
+            'BINARY_FILENAME': os.path.join(self.directory, 'songs.bin'),
+            'JOURNAL_FILENAME': os.path.join(self.directory, 'songs.journal'),
+            'PLAYLIST_DIRECTORY': os.path.join(self.directory, 'playlists'),
+        })
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.app = app_class()
+            self.app.add_song('Title', 'A', 'Album', 'Genre')
+        self.server = MusicServer(self.app, workers=2)
+
+    def tearDown(self):
+        self.server.executor.shutdown(wait=True)
+        shutil.rmtree(self.directory)
+
+    async def exchange(self, lines):
+        #Sendet alle Zeilen über eine Verbindung und liest je Zeile eine Antwort
+        server = await asyncio.start_server(self.server.handle_connection, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b''.join(line + b'\n' for line in lines))
+            await writer.drain()
+            responses = [json.loads(await asyncio.wait_for(reader.readline(), 5)) for _ in lines]
+            writer.close()
+            await writer.wait_closed()
+        return responses
+
+    def test_malformed_requests_get_error_responses(self):
+        lines = MALFORMED + [b'{"id": 9, "op": "get", "song_id": 0}']
+        with contextlib.redirect_stdout(io.StringIO()):
+            responses = asyncio.run(self.exchange(lines))
+        for response in responses[:5] + responses[6:8]:
+            self.assertFalse(response['ok'])
+            self.assertTrue(response['error'])
+        batch = responses[5]
+        self.assertFalse(batch[0]['ok'])
+        self.assertTrue(batch[1]['ok'])
+        self.assertEqual(responses[-1], {'id': 9, 'ok': True, 'result': {
+            'title': 'Title', 'artist': 'A', 'album': 'Album', 'genre': 'Genre', 'song_id': 0}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Regressionstests: Nach dem Umsortieren der Bibliothek dürfen die Indizes nicht mehr aus der
+Reihenfolge des geladenen binären Snapshots aufgebaut werden.
+
+Aufruf: python -m unittest discover tests
+"""
+import contextlib
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from music_app import MusicApp
+
+
+class SnapshotOrderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.app_class = type('TestMusicApp', (MusicApp,), {
+            'FILENAME': os.path.join(self.directory, 'songs.csv'),
+            'BINARY_FILENAME': os.path.join(self.directory, 'songs.bin'),
+            'JOURNAL_FILENAME': os.path.join(self.directory, 'songs.journal'),
+            'PLAYLIST_DIRECTORY': os.path.join(self.directory, 'playlists'),
+        })
+        random.seed(5)
+        app = self.open_app()
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.create_random_songs(200)
+            app.save_data()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def open_app(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.app_class()
+
+    def assert_searchable(self, app, field):
+        #Der Index muss sortiert sein und jeden Song über die Binärsuche finden
+        with contextlib.redirect_stdout(io.StringIO()):
+            keys = [getattr(song, field) for song in app.sorted_index(field)]
+            self.assertEqual(keys, sorted(keys))
+            for song in app.songs:
+                found = app.binary_search(getattr(song, field), field)
+                self.assertIsNotNone(found)
+                self.assertEqual(getattr(found, field), getattr(song, field))
+
+    def test_search_after_sort(self):
+        sorts = {
+            'bubble': lambda app: app.bubble_sort('2', '1'),
+            'insertion': lambda app: app.insertion_sort('2', '1'),
+            'merge': lambda app: app.merge_sort('2', '1'),
+            'quick': lambda app: app.quick_sort(0, len(app.songs) - 1, '2', '1'),
+        }
+        for name, sort in sorts.items():
+            with self.subTest(sort=name):
+                app = self.open_app()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    sort(app)
+                self.assert_searchable(app, 'artist')
+
+    def test_songs_for_ids_after_sort(self):
+        #Die Song-Nummern dürfen nach dem Sortieren nicht mehr über die Zeilen des Snapshots aufgelöst werden
+        app = self.open_app()
+        with contextlib.redirect_stdout(io.StringIO()):
+            app.merge_sort('2', '1')
+        song_ids = [song.song_id for song in app.songs[::7]]
+        songs_by_id = app._songs_for_ids(song_ids)
+        self.assertEqual(sorted(songs_by_id), sorted(song_ids))
+        for song_id, song in songs_by_id.items():
+            self.assertEqual(song.song_id, song_id)
+
+    def test_search_after_sort_songs_menu(self):
+        #Vergleich aller Algorithmen über das Menü, danach gilt die Referenzsortierung
+        app = self.open_app()
+        answers = iter(['5', '2', '1'])
+        with mock.patch('builtins.input', lambda prompt='': next(answers)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                app.sort_songs()
+        self.assert_searchable(self.open_app(), 'genre')
+        self.assert_searchable(app, 'genre')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import sys
+
+
+class TitleIndex:
+    """
+    Hash-Index Titel -> Song für Nachschlagen, Löschen und Playlists in O(1).
+
+    Die meisten Titel kommen nur einmal vor. Deshalb zeigt das Hauptwörterbuch direkt auf den
+    ersten Song eines Titels; nur für mehrfach vorkommende Titel liegen die weiteren Songs in
+    einem zweiten Wörterbuch. So kostet ein eindeutiger Titel keine eigene Liste.
+    """
+
+    def __init__(self, songs=None):
+        """
+        Initialisiert einen leeren Index und fügt optional Songs hinzu.
+
+        Args:
+            songs (list): Optionale Songs, die in dieser Reihenfolge eingefügt werden.
+        """
+        self._first = {}       #Titel -> erster Song mit diesem Titel
+        self._duplicates = {}  #Titel -> weitere Songs mit diesem Titel, in Einfügereihenfolge
+        if songs:
+            self.update(songs)
+
+    def __len__(self):
+        return len(self._first) + sum(len(songs) for songs in self._duplicates.values())
+
+    def __contains__(self, title):
+        return title in self._first
+
+    def add(self, song):
+        #Fügt einen Song hinzu; gibt es den Titel schon, wird der Song hinten angestellt
+        first = self._first.setdefault(song.title, song)
+        if first is not song:
+            self._duplicates.setdefault(song.title, []).append(song)
+
+    def update(self, songs):
+        #Fügt viele Songs in dieser Reihenfolge hinzu
+        setdefault = self._first.setdefault
+        for song in songs:
+            if setdefault(song.title, song) is not song:
+                self._duplicates.setdefault(song.title, []).append(song)
+
+    def get(self, title):
+        """
+        Gibt den ersten Song mit einem Titel zurück.
+
+        Args:
+            title (str): Der gesuchte Titel.
+
+        Returns:
+            Song: Der zuerst eingefügte Song mit diesem Titel oder None.
+        """
+        return self._first.get(title)
+
+    def get_all(self, title):
+        #Gibt alle Songs mit einem Titel in Einfügereihenfolge zurück
+        first = self._first.get(title)
+        if first is None:
+            return []
+        return [first] + self._duplicates.get(title, [])
+
+    def remove(self, song):
+        """
+        Entfernt genau dieses Song-Objekt; der nächste Song mit demselben Titel rückt nach.
+
+        Args:
+            song (Song): Der zu entfernende Song.
+
+        Returns:
+            bool: True, wenn der Song im Index war.
+        """
+        title = song.title
+        first = self._first.get(title)
+        if first is None:
+            return False
+        duplicates = self._duplicates.get(title)
+        if first is song:
+            if duplicates:
+                self._first[title] = duplicates.pop(0)
+                if not duplicates:
+                    del self._duplicates[title]
+            else:
+                del self._first[title]
+            return True
+        if duplicates:
+            for position, other in enumerate(duplicates):
+                if other is song:
+                    del duplicates[position]
+                    if not duplicates:
+                        del self._duplicates[title]
+                    return True
+        return False
+
+    def get_size(self):
+        """
+        Berechnet den Speicherbedarf des Index (ohne die Songs und Titel selbst).
+
+        Returns:
+            int: Die Größe in Bytes.
+        """
+        size = sys.getsizeof(self._first) + sys.getsizeof(self._duplicates)
+        for songs in self._duplicates.values():
+            size += sys.getsizeof(songs)
+        return size